@@ -4,10 +4,7 @@ DIA packaged for use without COM registration using comtypes.
 
 import sys
 import pathlib
-import ctypes
-import comtypes
-from comtypes import client
-from . import _dia, cvconst
+from . import cvconst
 
 
 __version__ = "0.2.1"
@@ -22,21 +19,83 @@ else:
 
 _DIA_DLL = _SCRIPT_DIR / 'lib' / _arch / "msdia140.dll"
 
+# The comtypes wrapper modules for the typelib of _DIA_DLL, pregenerated at build time by
+# scripts/generate_dia_wrapper.py, so that we don't need to run comtypes codegen at runtime.
+_DIA_GEN_DIR = _SCRIPT_DIR / 'lib' / _arch / "comtypes_gen"
+_DIA_TYPELIB_MODULE = "Dia2Lib"
 
-#: The dia typelib module. Retrieved via :func:`comtypes.client.GetModule`.
-#:
-#: :meta hide-value:
-dia = client.GetModule(str(_DIA_DLL))
 
+# The dia typelib module (:data:`dia`) and the NoRegCoCreate function pointer are resolved on first
+# use, so that importing pydia2 (Or just pydia2.cvconst) doesn't pay for importing comtypes and
+# loading the typelib.
+_dia_module = None
+_NoRegCoCreate = None
 
-_NoRegCoCreate = ctypes.WINFUNCTYPE(
-    ctypes.HRESULT,
-    ctypes.c_wchar_p,
-    ctypes.POINTER(comtypes.GUID),
-    ctypes.POINTER(comtypes.GUID),
-    ctypes.POINTER(ctypes.c_void_p),
 
-)(_dia.NoRegCoCreatePtr)
+def _load_dia():
+    global _dia_module
+
+    if _dia_module is None:
+        module = _import_frozen_dia()
+        if module is None:
+            from comtypes import client
+
+            module = client.GetModule(str(_DIA_DLL))
+
+        _dia_module = module
+        globals()['dia'] = _dia_module
+
+    return _dia_module
+
+
+def _import_frozen_dia():
+    if not _DIA_GEN_DIR.is_dir():
+        return None
+
+    import importlib
+    import comtypes.gen
+
+    # Make the frozen modules importable as comtypes.gen modules, this way comtypes itself (e.g.
+    # GetBestInterface) also finds them instead of generating them.
+    if str(_DIA_GEN_DIR) not in comtypes.gen.__path__:
+        comtypes.gen.__path__.append(str(_DIA_GEN_DIR))
+
+    try:
+        return importlib.import_module(f"comtypes.gen.{_DIA_TYPELIB_MODULE}")
+    except ImportError:
+        # Most likely generated by an incompatible comtypes version, fallback to codegen
+        return None
+
+
+def _get_no_reg_co_create():
+    global _NoRegCoCreate
+
+    if _NoRegCoCreate is None:
+        import ctypes
+        import comtypes
+        from . import _dia
+
+        _NoRegCoCreate = ctypes.WINFUNCTYPE(
+            ctypes.HRESULT,
+            ctypes.c_wchar_p,
+            ctypes.POINTER(comtypes.GUID),
+            ctypes.POINTER(comtypes.GUID),
+            ctypes.POINTER(ctypes.c_void_p),
+
+        )(_dia.NoRegCoCreatePtr)
+
+    return _NoRegCoCreate
+
+
+def __getattr__(name):
+    if name == 'dia':
+        return _load_dia()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {'dia'})
 
 
 def CreateObject(progid, interface=None):
@@ -46,11 +105,18 @@ def CreateObject(progid, interface=None):
     Since this is intended to be used without registering DIA, you should grab the progid as a class
     object from the :data:`dia` module variable.
     """
+    import ctypes
+    import comtypes
+    from comtypes import client
+
+    # Make sure the typelib module is loaded so that GetBestInterface finds the DIA interfaces.
+    _load_dia()
+
     if interface is None:
         interface = comtypes.IUnknown
 
     clsid = comtypes.GUID.from_progid(progid)
     p = ctypes.POINTER(interface)()
     iid = interface._iid_
-    _NoRegCoCreate(str(_DIA_DLL), ctypes.byref(clsid), ctypes.byref(iid), ctypes.byref(p))
+    _get_no_reg_co_create()(str(_DIA_DLL), ctypes.byref(clsid), ctypes.byref(iid), ctypes.byref(p))
     return client.GetBestInterface(p)
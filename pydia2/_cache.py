@@ -0,0 +1,51 @@
+"""
+On disk caches of data derived from PDBs, keyed by the GUID and age of the PDB like the symbol
+server does, so that they can be reused across opens of the same PDB.
+"""
+
+import os
+import uuid
+import struct
+import tempfile
+
+
+# The stream index and header of the PDB info stream
+_PDB_STREAM = 1
+_PDB_STREAM_HEADER = struct.Struct('<III16s')
+
+
+def pdb_key(msf):
+    """The GUID and age of the PDB of *msf*, formatted like the symbol server path does."""
+    version, signature, age, guid = _PDB_STREAM_HEADER.unpack_from(
+        msf.stream(_PDB_STREAM).read(0, _PDB_STREAM_HEADER.size))
+    return f"{uuid.UUID(bytes_le=guid).hex.upper()}{age:X}"
+
+
+def path(cache_dir, msf, name):
+    """The path of the cache file *name* of the PDB of *msf* in *cache_dir*."""
+    return os.path.join(cache_dir, f"{pdb_key(msf)}.{name}")
+
+
+def read(path):
+    """Return the contents of the cache file *path*, or ``None`` if it doesn't exist."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write(path, *chunks):
+    """Write *chunks* to the cache file *path*."""
+    # Write to a temporary file first so that concurrent readers never see a partial file
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,3302 @@
+# CPU_TYPE value -> register family, and for each register family the (value, name, width in bits)
+# of its HREG registers sorted by value. Width is 0 when unknown. See pydia2.registers.
+
+
+CPU_FAMILIES = {
+    0x0: 'X86',
+    0x1: 'X86',
+    0x2: 'X86',
+    0x3: 'X86',
+    0x4: 'X86',
+    0x5: 'X86',
+    0x6: 'X86',
+    0x7: 'X86',
+    0x10: 'MIPS',
+    0x11: 'MIPS',
+    0x12: 'MIPS',
+    0x13: 'MIPS',
+    0x14: 'MIPS',
+    0x15: 'MIPS',
+    0x16: 'MIPS',
+    0x17: 'MIPS',
+    0x18: 'MIPS',
+    0x20: 'M68K',
+    0x21: 'M68K',
+    0x22: 'M68K',
+    0x23: 'M68K',
+    0x24: 'M68K',
+    0x30: 'ALPHA',
+    0x31: 'ALPHA',
+    0x32: 'ALPHA',
+    0x33: 'ALPHA',
+    0x34: 'ALPHA',
+    0x40: 'PPC',
+    0x41: 'PPC',
+    0x42: 'PPC',
+    0x43: 'PPC',
+    0x44: 'PPC',
+    0x45: 'PPC',
+    0x50: 'SH',
+    0x51: 'SH',
+    0x52: 'SH',
+    0x53: 'SH',
+    0x54: 'SHMEDIA',
+    0x60: 'ARM',
+    0x61: 'ARM',
+    0x62: 'ARM',
+    0x63: 'ARM',
+    0x64: 'ARM',
+    0x65: 'ARM',
+    0x66: 'ARM',
+    0x67: 'ARM',
+    0x68: 'ARM',
+    0xf0: 'ARM',
+    0xf4: 'ARM',
+    0x80: 'IA64',
+    0x81: 'IA64',
+    0xa0: 'AM33',
+    0xb0: 'M32R',
+    0xc0: 'TRICORE',
+    0xd0: 'AMD64',
+    0xf6: 'ARM64',
+    0xf7: 'ARM64',
+    0xf8: 'ARM64',
+    0xf9: 'ARM64',
+}
+
+
+REGISTERS = {
+    'X86': (
+        (0, 'REG_NONE', 0),
+        (1, 'REG_AL', 8),
+        (2, 'REG_CL', 8),
+        (3, 'REG_DL', 8),
+        (4, 'REG_BL', 8),
+        (5, 'REG_AH', 8),
+        (6, 'REG_CH', 8),
+        (7, 'REG_DH', 8),
+        (8, 'REG_BH', 8),
+        (9, 'REG_AX', 16),
+        (10, 'REG_CX', 16),
+        (11, 'REG_DX', 16),
+        (12, 'REG_BX', 16),
+        (13, 'REG_SP', 16),
+        (14, 'REG_BP', 16),
+        (15, 'REG_SI', 16),
+        (16, 'REG_DI', 16),
+        (17, 'REG_EAX', 32),
+        (18, 'REG_ECX', 32),
+        (19, 'REG_EDX', 32),
+        (20, 'REG_EBX', 32),
+        (21, 'REG_ESP', 32),
+        (22, 'REG_EBP', 32),
+        (23, 'REG_ESI', 32),
+        (24, 'REG_EDI', 32),
+        (25, 'REG_ES', 16),
+        (26, 'REG_CS', 16),
+        (27, 'REG_SS', 16),
+        (28, 'REG_DS', 16),
+        (29, 'REG_FS', 16),
+        (30, 'REG_GS', 16),
+        (31, 'REG_IP', 16),
+        (32, 'REG_FLAGS', 16),
+        (33, 'REG_EIP', 32),
+        (34, 'REG_EFLAGS', 32),
+        (40, 'REG_TEMP', 0),
+        (41, 'REG_TEMPH', 0),
+        (42, 'REG_QUOTE', 0),
+        (43, 'REG_PCDR3', 0),
+        (44, 'REG_PCDR4', 0),
+        (45, 'REG_PCDR5', 0),
+        (46, 'REG_PCDR6', 0),
+        (47, 'REG_PCDR7', 0),
+        (80, 'REG_CR0', 32),
+        (81, 'REG_CR1', 32),
+        (82, 'REG_CR2', 32),
+        (83, 'REG_CR3', 32),
+        (84, 'REG_CR4', 32),
+        (90, 'REG_DR0', 32),
+        (91, 'REG_DR1', 32),
+        (92, 'REG_DR2', 32),
+        (93, 'REG_DR3', 32),
+        (94, 'REG_DR4', 32),
+        (95, 'REG_DR5', 32),
+        (96, 'REG_DR6', 32),
+        (97, 'REG_DR7', 32),
+        (110, 'REG_GDTR', 32),
+        (111, 'REG_GDTL', 16),
+        (112, 'REG_IDTR', 32),
+        (113, 'REG_IDTL', 16),
+        (114, 'REG_LDTR', 16),
+        (115, 'REG_TR', 16),
+        (116, 'REG_PSEUDO1', 0),
+        (117, 'REG_PSEUDO2', 0),
+        (118, 'REG_PSEUDO3', 0),
+        (119, 'REG_PSEUDO4', 0),
+        (120, 'REG_PSEUDO5', 0),
+        (121, 'REG_PSEUDO6', 0),
+        (122, 'REG_PSEUDO7', 0),
+        (123, 'REG_PSEUDO8', 0),
+        (124, 'REG_PSEUDO9', 0),
+        (128, 'REG_ST0', 80),
+        (129, 'REG_ST1', 80),
+        (130, 'REG_ST2', 80),
+        (131, 'REG_ST3', 80),
+        (132, 'REG_ST4', 80),
+        (133, 'REG_ST5', 80),
+        (134, 'REG_ST6', 80),
+        (135, 'REG_ST7', 80),
+        (136, 'REG_CTRL', 16),
+        (137, 'REG_STAT', 16),
+        (138, 'REG_TAG', 16),
+        (139, 'REG_FPIP', 32),
+        (140, 'REG_FPCS', 16),
+        (141, 'REG_FPDO', 32),
+        (142, 'REG_FPDS', 16),
+        (143, 'REG_ISEM', 16),
+        (144, 'REG_FPEIP', 32),
+        (145, 'REG_FPEDO', 32),
+        (146, 'REG_MM0', 64),
+        (147, 'REG_MM1', 64),
+        (148, 'REG_MM2', 64),
+        (149, 'REG_MM3', 64),
+        (150, 'REG_MM4', 64),
+        (151, 'REG_MM5', 64),
+        (152, 'REG_MM6', 64),
+        (153, 'REG_MM7', 64),
+        (154, 'REG_XMM0', 128),
+        (155, 'REG_XMM1', 128),
+        (156, 'REG_XMM2', 128),
+        (157, 'REG_XMM3', 128),
+        (158, 'REG_XMM4', 128),
+        (159, 'REG_XMM5', 128),
+        (160, 'REG_XMM6', 128),
+        (161, 'REG_XMM7', 128),
+        (162, 'REG_XMM00', 32),
+        (163, 'REG_XMM01', 32),
+        (164, 'REG_XMM02', 32),
+        (165, 'REG_XMM03', 32),
+        (166, 'REG_XMM10', 32),
+        (167, 'REG_XMM11', 32),
+        (168, 'REG_XMM12', 32),
+        (169, 'REG_XMM13', 32),
+        (170, 'REG_XMM20', 32),
+        (171, 'REG_XMM21', 32),
+        (172, 'REG_XMM22', 32),
+        (173, 'REG_XMM23', 32),
+        (174, 'REG_XMM30', 32),
+        (175, 'REG_XMM31', 32),
+        (176, 'REG_XMM32', 32),
+        (177, 'REG_XMM33', 32),
+        (178, 'REG_XMM40', 32),
+        (179, 'REG_XMM41', 32),
+        (180, 'REG_XMM42', 32),
+        (181, 'REG_XMM43', 32),
+        (182, 'REG_XMM50', 32),
+        (183, 'REG_XMM51', 32),
+        (184, 'REG_XMM52', 32),
+        (185, 'REG_XMM53', 32),
+        (186, 'REG_XMM60', 32),
+        (187, 'REG_XMM61', 32),
+        (188, 'REG_XMM62', 32),
+        (189, 'REG_XMM63', 32),
+        (190, 'REG_XMM70', 32),
+        (191, 'REG_XMM71', 32),
+        (192, 'REG_XMM72', 32),
+        (193, 'REG_XMM73', 32),
+        (194, 'REG_XMM0L', 64),
+        (195, 'REG_XMM1L', 64),
+        (196, 'REG_XMM2L', 64),
+        (197, 'REG_XMM3L', 64),
+        (198, 'REG_XMM4L', 64),
+        (199, 'REG_XMM5L', 64),
+        (200, 'REG_XMM6L', 64),
+        (201, 'REG_XMM7L', 64),
+        (202, 'REG_XMM0H', 64),
+        (203, 'REG_XMM1H', 64),
+        (204, 'REG_XMM2H', 64),
+        (205, 'REG_XMM3H', 64),
+        (206, 'REG_XMM4H', 64),
+        (207, 'REG_XMM5H', 64),
+        (208, 'REG_XMM6H', 64),
+        (209, 'REG_XMM7H', 64),
+        (211, 'REG_MXCSR', 32),
+        (212, 'REG_EDXEAX', 64),
+        (220, 'REG_EMM0L', 64),
+        (221, 'REG_EMM1L', 64),
+        (222, 'REG_EMM2L', 64),
+        (223, 'REG_EMM3L', 64),
+        (224, 'REG_EMM4L', 64),
+        (225, 'REG_EMM5L', 64),
+        (226, 'REG_EMM6L', 64),
+        (227, 'REG_EMM7L', 64),
+        (228, 'REG_EMM0H', 64),
+        (229, 'REG_EMM1H', 64),
+        (230, 'REG_EMM2H', 64),
+        (231, 'REG_EMM3H', 64),
+        (232, 'REG_EMM4H', 64),
+        (233, 'REG_EMM5H', 64),
+        (234, 'REG_EMM6H', 64),
+        (235, 'REG_EMM7H', 64),
+        (236, 'REG_MM00', 32),
+        (237, 'REG_MM01', 32),
+        (238, 'REG_MM10', 32),
+        (239, 'REG_MM11', 32),
+        (240, 'REG_MM20', 32),
+        (241, 'REG_MM21', 32),
+        (242, 'REG_MM30', 32),
+        (243, 'REG_MM31', 32),
+        (244, 'REG_MM40', 32),
+        (245, 'REG_MM41', 32),
+        (246, 'REG_MM50', 32),
+        (247, 'REG_MM51', 32),
+        (248, 'REG_MM60', 32),
+        (249, 'REG_MM61', 32),
+        (250, 'REG_MM70', 32),
+        (251, 'REG_MM71', 32),
+        (252, 'REG_YMM0', 256),
+        (253, 'REG_YMM1', 256),
+        (254, 'REG_YMM2', 256),
+        (255, 'REG_YMM3', 256),
+        (256, 'REG_YMM4', 256),
+        (257, 'REG_YMM5', 256),
+        (258, 'REG_YMM6', 256),
+        (259, 'REG_YMM7', 256),
+        (260, 'REG_YMM0H', 128),
+        (261, 'REG_YMM1H', 128),
+        (262, 'REG_YMM2H', 128),
+        (263, 'REG_YMM3H', 128),
+        (264, 'REG_YMM4H', 128),
+        (265, 'REG_YMM5H', 128),
+        (266, 'REG_YMM6H', 128),
+        (267, 'REG_YMM7H', 128),
+        (268, 'REG_YMM0I0', 64),
+        (269, 'REG_YMM0I1', 64),
+        (270, 'REG_YMM0I2', 64),
+        (271, 'REG_YMM0I3', 64),
+        (272, 'REG_YMM1I0', 64),
+        (273, 'REG_YMM1I1', 64),
+        (274, 'REG_YMM1I2', 64),
+        (275, 'REG_YMM1I3', 64),
+        (276, 'REG_YMM2I0', 64),
+        (277, 'REG_YMM2I1', 64),
+        (278, 'REG_YMM2I2', 64),
+        (279, 'REG_YMM2I3', 64),
+        (280, 'REG_YMM3I0', 64),
+        (281, 'REG_YMM3I1', 64),
+        (282, 'REG_YMM3I2', 64),
+        (283, 'REG_YMM3I3', 64),
+        (284, 'REG_YMM4I0', 64),
+        (285, 'REG_YMM4I1', 64),
+        (286, 'REG_YMM4I2', 64),
+        (287, 'REG_YMM4I3', 64),
+        (288, 'REG_YMM5I0', 64),
+        (289, 'REG_YMM5I1', 64),
+        (290, 'REG_YMM5I2', 64),
+        (291, 'REG_YMM5I3', 64),
+        (292, 'REG_YMM6I0', 64),
+        (293, 'REG_YMM6I1', 64),
+        (294, 'REG_YMM6I2', 64),
+        (295, 'REG_YMM6I3', 64),
+        (296, 'REG_YMM7I0', 64),
+        (297, 'REG_YMM7I1', 64),
+        (298, 'REG_YMM7I2', 64),
+        (299, 'REG_YMM7I3', 64),
+        (300, 'REG_YMM0F0', 32),
+        (301, 'REG_YMM0F1', 32),
+        (302, 'REG_YMM0F2', 32),
+        (303, 'REG_YMM0F3', 32),
+        (304, 'REG_YMM0F4', 32),
+        (305, 'REG_YMM0F5', 32),
+        (306, 'REG_YMM0F6', 32),
+        (307, 'REG_YMM0F7', 32),
+        (308, 'REG_YMM1F0', 32),
+        (309, 'REG_YMM1F1', 32),
+        (310, 'REG_YMM1F2', 32),
+        (311, 'REG_YMM1F3', 32),
+        (312, 'REG_YMM1F4', 32),
+        (313, 'REG_YMM1F5', 32),
+        (314, 'REG_YMM1F6', 32),
+        (315, 'REG_YMM1F7', 32),
+        (316, 'REG_YMM2F0', 32),
+        (317, 'REG_YMM2F1', 32),
+        (318, 'REG_YMM2F2', 32),
+        (319, 'REG_YMM2F3', 32),
+        (320, 'REG_YMM2F4', 32),
+        (321, 'REG_YMM2F5', 32),
+        (322, 'REG_YMM2F6', 32),
+        (323, 'REG_YMM2F7', 32),
+        (324, 'REG_YMM3F0', 32),
+        (325, 'REG_YMM3F1', 32),
+        (326, 'REG_YMM3F2', 32),
+        (327, 'REG_YMM3F3', 32),
+        (328, 'REG_YMM3F4', 32),
+        (329, 'REG_YMM3F5', 32),
+        (330, 'REG_YMM3F6', 32),
+        (331, 'REG_YMM3F7', 32),
+        (332, 'REG_YMM4F0', 32),
+        (333, 'REG_YMM4F1', 32),
+        (334, 'REG_YMM4F2', 32),
+        (335, 'REG_YMM4F3', 32),
+        (336, 'REG_YMM4F4', 32),
+        (337, 'REG_YMM4F5', 32),
+        (338, 'REG_YMM4F6', 32),
+        (339, 'REG_YMM4F7', 32),
+        (340, 'REG_YMM5F0', 32),
+        (341, 'REG_YMM5F1', 32),
+        (342, 'REG_YMM5F2', 32),
+        (343, 'REG_YMM5F3', 32),
+        (344, 'REG_YMM5F4', 32),
+        (345, 'REG_YMM5F5', 32),
+        (346, 'REG_YMM5F6', 32),
+        (347, 'REG_YMM5F7', 32),
+        (348, 'REG_YMM6F0', 32),
+        (349, 'REG_YMM6F1', 32),
+        (350, 'REG_YMM6F2', 32),
+        (351, 'REG_YMM6F3', 32),
+        (352, 'REG_YMM6F4', 32),
+        (353, 'REG_YMM6F5', 32),
+        (354, 'REG_YMM6F6', 32),
+        (355, 'REG_YMM6F7', 32),
+        (356, 'REG_YMM7F0', 32),
+        (357, 'REG_YMM7F1', 32),
+        (358, 'REG_YMM7F2', 32),
+        (359, 'REG_YMM7F3', 32),
+        (360, 'REG_YMM7F4', 32),
+        (361, 'REG_YMM7F5', 32),
+        (362, 'REG_YMM7F6', 32),
+        (363, 'REG_YMM7F7', 32),
+        (364, 'REG_YMM0D0', 64),
+        (365, 'REG_YMM0D1', 64),
+        (366, 'REG_YMM0D2', 64),
+        (367, 'REG_YMM0D3', 64),
+        (368, 'REG_YMM1D0', 64),
+        (369, 'REG_YMM1D1', 64),
+        (370, 'REG_YMM1D2', 64),
+        (371, 'REG_YMM1D3', 64),
+        (372, 'REG_YMM2D0', 64),
+        (373, 'REG_YMM2D1', 64),
+        (374, 'REG_YMM2D2', 64),
+        (375, 'REG_YMM2D3', 64),
+        (376, 'REG_YMM3D0', 64),
+        (377, 'REG_YMM3D1', 64),
+        (378, 'REG_YMM3D2', 64),
+        (379, 'REG_YMM3D3', 64),
+        (380, 'REG_YMM4D0', 64),
+        (381, 'REG_YMM4D1', 64),
+        (382, 'REG_YMM4D2', 64),
+        (383, 'REG_YMM4D3', 64),
+        (384, 'REG_YMM5D0', 64),
+        (385, 'REG_YMM5D1', 64),
+        (386, 'REG_YMM5D2', 64),
+        (387, 'REG_YMM5D3', 64),
+        (388, 'REG_YMM6D0', 64),
+        (389, 'REG_YMM6D1', 64),
+        (390, 'REG_YMM6D2', 64),
+        (391, 'REG_YMM6D3', 64),
+        (392, 'REG_YMM7D0', 64),
+        (393, 'REG_YMM7D1', 64),
+        (394, 'REG_YMM7D2', 64),
+        (395, 'REG_YMM7D3', 64),
+        (396, 'REG_BND0', 128),
+        (397, 'REG_BND1', 128),
+        (398, 'REG_BND2', 128),
+        (399, 'REG_BND3', 128),
+        (400, 'REG_BNDCFGU', 64),
+        (401, 'REG_BNDSTATUS', 64),
+        (402, 'REG_ZMM0', 512),
+        (403, 'REG_ZMM1', 512),
+        (404, 'REG_ZMM2', 512),
+        (405, 'REG_ZMM3', 512),
+        (406, 'REG_ZMM4', 512),
+        (407, 'REG_ZMM5', 512),
+        (408, 'REG_ZMM6', 512),
+        (409, 'REG_ZMM7', 512),
+        (410, 'REG_ZMM0H', 256),
+        (411, 'REG_ZMM1H', 256),
+        (412, 'REG_ZMM2H', 256),
+        (413, 'REG_ZMM3H', 256),
+        (414, 'REG_ZMM4H', 256),
+        (415, 'REG_ZMM5H', 256),
+        (416, 'REG_ZMM6H', 256),
+        (417, 'REG_ZMM7H', 256),
+        (418, 'REG_K0', 64),
+        (419, 'REG_K1', 64),
+        (420, 'REG_K2', 64),
+        (421, 'REG_K3', 64),
+        (422, 'REG_K4', 64),
+        (423, 'REG_K5', 64),
+        (424, 'REG_K6', 64),
+        (425, 'REG_K7', 64),
+        (426, 'REG_SSP', 32),
+    ),
+    'MIPS': (
+        (0, 'M4_NOREG', 0),
+        (10, 'M4_IntZERO', 0),
+        (11, 'M4_IntAT', 0),
+        (12, 'M4_IntV0', 0),
+        (13, 'M4_IntV1', 0),
+        (14, 'M4_IntA0', 0),
+        (15, 'M4_IntA1', 0),
+        (16, 'M4_IntA2', 0),
+        (17, 'M4_IntA3', 0),
+        (18, 'M4_IntT0', 0),
+        (19, 'M4_IntT1', 0),
+        (20, 'M4_IntT2', 0),
+        (21, 'M4_IntT3', 0),
+        (22, 'M4_IntT4', 0),
+        (23, 'M4_IntT5', 0),
+        (24, 'M4_IntT6', 0),
+        (25, 'M4_IntT7', 0),
+        (26, 'M4_IntS0', 0),
+        (27, 'M4_IntS1', 0),
+        (28, 'M4_IntS2', 0),
+        (29, 'M4_IntS3', 0),
+        (30, 'M4_IntS4', 0),
+        (31, 'M4_IntS5', 0),
+        (32, 'M4_IntS6', 0),
+        (33, 'M4_IntS7', 0),
+        (34, 'M4_IntT8', 0),
+        (35, 'M4_IntT9', 0),
+        (36, 'M4_IntKT0', 0),
+        (37, 'M4_IntKT1', 0),
+        (38, 'M4_IntGP', 0),
+        (39, 'M4_IntSP', 0),
+        (40, 'M4_IntS8', 0),
+        (41, 'M4_IntRA', 0),
+        (42, 'M4_IntLO', 0),
+        (43, 'M4_IntHI', 0),
+        (50, 'M4_Fir', 0),
+        (51, 'M4_Psr', 0),
+        (60, 'M4_FltF0', 0),
+        (61, 'M4_FltF1', 0),
+        (62, 'M4_FltF2', 0),
+        (63, 'M4_FltF3', 0),
+        (64, 'M4_FltF4', 0),
+        (65, 'M4_FltF5', 0),
+        (66, 'M4_FltF6', 0),
+        (67, 'M4_FltF7', 0),
+        (68, 'M4_FltF8', 0),
+        (69, 'M4_FltF9', 0),
+        (70, 'M4_FltF10', 0),
+        (71, 'M4_FltF11', 0),
+        (72, 'M4_FltF12', 0),
+        (73, 'M4_FltF13', 0),
+        (74, 'M4_FltF14', 0),
+        (75, 'M4_FltF15', 0),
+        (76, 'M4_FltF16', 0),
+        (77, 'M4_FltF17', 0),
+        (78, 'M4_FltF18', 0),
+        (79, 'M4_FltF19', 0),
+        (80, 'M4_FltF20', 0),
+        (81, 'M4_FltF21', 0),
+        (82, 'M4_FltF22', 0),
+        (83, 'M4_FltF23', 0),
+        (84, 'M4_FltF24', 0),
+        (85, 'M4_FltF25', 0),
+        (86, 'M4_FltF26', 0),
+        (87, 'M4_FltF27', 0),
+        (88, 'M4_FltF28', 0),
+        (89, 'M4_FltF29', 0),
+        (90, 'M4_FltF30', 0),
+        (91, 'M4_FltF31', 0),
+        (92, 'M4_FltFsr', 0),
+    ),
+    'M68K': (
+        (0, 'R68_D0', 0),
+        (1, 'R68_D1', 0),
+        (2, 'R68_D2', 0),
+        (3, 'R68_D3', 0),
+        (4, 'R68_D4', 0),
+        (5, 'R68_D5', 0),
+        (6, 'R68_D6', 0),
+        (7, 'R68_D7', 0),
+        (8, 'R68_A0', 0),
+        (9, 'R68_A1', 0),
+        (10, 'R68_A2', 0),
+        (11, 'R68_A3', 0),
+        (12, 'R68_A4', 0),
+        (13, 'R68_A5', 0),
+        (14, 'R68_A6', 0),
+        (15, 'R68_A7', 0),
+        (16, 'R68_CCR', 0),
+        (17, 'R68_SR', 0),
+        (18, 'R68_USP', 0),
+        (19, 'R68_MSP', 0),
+        (20, 'R68_SFC', 0),
+        (21, 'R68_DFC', 0),
+        (22, 'R68_CACR', 0),
+        (23, 'R68_VBR', 0),
+        (24, 'R68_CAAR', 0),
+        (25, 'R68_ISP', 0),
+        (26, 'R68_PC', 0),
+        (28, 'R68_FPCR', 0),
+        (29, 'R68_FPSR', 0),
+        (30, 'R68_FPIAR', 0),
+        (32, 'R68_FP0', 0),
+        (33, 'R68_FP1', 0),
+        (34, 'R68_FP2', 0),
+        (35, 'R68_FP3', 0),
+        (36, 'R68_FP4', 0),
+        (37, 'R68_FP5', 0),
+        (38, 'R68_FP6', 0),
+        (39, 'R68_FP7', 0),
+        (41, 'R68_MMUSR030', 0),
+        (42, 'R68_MMUSR', 0),
+        (43, 'R68_URP', 0),
+        (44, 'R68_DTT0', 0),
+        (45, 'R68_DTT1', 0),
+        (46, 'R68_ITT0', 0),
+        (47, 'R68_ITT1', 0),
+        (51, 'R68_PSR', 0),
+        (52, 'R68_PCSR', 0),
+        (53, 'R68_VAL', 0),
+        (54, 'R68_CRP', 0),
+        (55, 'R68_SRP', 0),
+        (56, 'R68_DRP', 0),
+        (57, 'R68_TC', 0),
+        (58, 'R68_AC', 0),
+        (59, 'R68_SCC', 0),
+        (60, 'R68_CAL', 0),
+        (61, 'R68_TT0', 0),
+        (62, 'R68_TT1', 0),
+        (64, 'R68_BAD0', 0),
+        (65, 'R68_BAD1', 0),
+        (66, 'R68_BAD2', 0),
+        (67, 'R68_BAD3', 0),
+        (68, 'R68_BAD4', 0),
+        (69, 'R68_BAD5', 0),
+        (70, 'R68_BAD6', 0),
+        (71, 'R68_BAD7', 0),
+        (72, 'R68_BAC0', 0),
+        (73, 'R68_BAC1', 0),
+        (74, 'R68_BAC2', 0),
+        (75, 'R68_BAC3', 0),
+        (76, 'R68_BAC4', 0),
+        (77, 'R68_BAC5', 0),
+        (78, 'R68_BAC6', 0),
+        (79, 'R68_BAC7', 0),
+    ),
+    'ALPHA': (
+        (0, 'ALPHA_NOREG', 0),
+        (10, 'ALPHA_FltF0', 0),
+        (11, 'ALPHA_FltF1', 0),
+        (12, 'ALPHA_FltF2', 0),
+        (13, 'ALPHA_FltF3', 0),
+        (14, 'ALPHA_FltF4', 0),
+        (15, 'ALPHA_FltF5', 0),
+        (16, 'ALPHA_FltF6', 0),
+        (17, 'ALPHA_FltF7', 0),
+        (18, 'ALPHA_FltF8', 0),
+        (19, 'ALPHA_FltF9', 0),
+        (20, 'ALPHA_FltF10', 0),
+        (21, 'ALPHA_FltF11', 0),
+        (22, 'ALPHA_FltF12', 0),
+        (23, 'ALPHA_FltF13', 0),
+        (24, 'ALPHA_FltF14', 0),
+        (25, 'ALPHA_FltF15', 0),
+        (26, 'ALPHA_FltF16', 0),
+        (27, 'ALPHA_FltF17', 0),
+        (28, 'ALPHA_FltF18', 0),
+        (29, 'ALPHA_FltF19', 0),
+        (30, 'ALPHA_FltF20', 0),
+        (31, 'ALPHA_FltF21', 0),
+        (32, 'ALPHA_FltF22', 0),
+        (33, 'ALPHA_FltF23', 0),
+        (34, 'ALPHA_FltF24', 0),
+        (35, 'ALPHA_FltF25', 0),
+        (36, 'ALPHA_FltF26', 0),
+        (37, 'ALPHA_FltF27', 0),
+        (38, 'ALPHA_FltF28', 0),
+        (39, 'ALPHA_FltF29', 0),
+        (40, 'ALPHA_FltF30', 0),
+        (41, 'ALPHA_FltF31', 0),
+        (42, 'ALPHA_IntV0', 0),
+        (43, 'ALPHA_IntT0', 0),
+        (44, 'ALPHA_IntT1', 0),
+        (45, 'ALPHA_IntT2', 0),
+        (46, 'ALPHA_IntT3', 0),
+        (47, 'ALPHA_IntT4', 0),
+        (48, 'ALPHA_IntT5', 0),
+        (49, 'ALPHA_IntT6', 0),
+        (50, 'ALPHA_IntT7', 0),
+        (51, 'ALPHA_IntS0', 0),
+        (52, 'ALPHA_IntS1', 0),
+        (53, 'ALPHA_IntS2', 0),
+        (54, 'ALPHA_IntS3', 0),
+        (55, 'ALPHA_IntS4', 0),
+        (56, 'ALPHA_IntS5', 0),
+        (57, 'ALPHA_IntFP', 0),
+        (58, 'ALPHA_IntA0', 0),
+        (59, 'ALPHA_IntA1', 0),
+        (60, 'ALPHA_IntA2', 0),
+        (61, 'ALPHA_IntA3', 0),
+        (62, 'ALPHA_IntA4', 0),
+        (63, 'ALPHA_IntA5', 0),
+        (64, 'ALPHA_IntT8', 0),
+        (65, 'ALPHA_IntT9', 0),
+        (66, 'ALPHA_IntT10', 0),
+        (67, 'ALPHA_IntT11', 0),
+        (68, 'ALPHA_IntRA', 0),
+        (69, 'ALPHA_IntT12', 0),
+        (70, 'ALPHA_IntAT', 0),
+        (71, 'ALPHA_IntGP', 0),
+        (72, 'ALPHA_IntSP', 0),
+        (73, 'ALPHA_IntZERO', 0),
+        (74, 'ALPHA_Fpcr', 0),
+        (75, 'ALPHA_Fir', 0),
+        (76, 'ALPHA_Psr', 0),
+        (77, 'ALPHA_FltFsr', 0),
+        (78, 'ALPHA_SoftFpcr', 0),
+    ),
+    'PPC': (
+        (1, 'PPC_GPR0', 0),
+        (2, 'PPC_GPR1', 0),
+        (3, 'PPC_GPR2', 0),
+        (4, 'PPC_GPR3', 0),
+        (5, 'PPC_GPR4', 0),
+        (6, 'PPC_GPR5', 0),
+        (7, 'PPC_GPR6', 0),
+        (8, 'PPC_GPR7', 0),
+        (9, 'PPC_GPR8', 0),
+        (10, 'PPC_GPR9', 0),
+        (11, 'PPC_GPR10', 0),
+        (12, 'PPC_GPR11', 0),
+        (13, 'PPC_GPR12', 0),
+        (14, 'PPC_GPR13', 0),
+        (15, 'PPC_GPR14', 0),
+        (16, 'PPC_GPR15', 0),
+        (17, 'PPC_GPR16', 0),
+        (18, 'PPC_GPR17', 0),
+        (19, 'PPC_GPR18', 0),
+        (20, 'PPC_GPR19', 0),
+        (21, 'PPC_GPR20', 0),
+        (22, 'PPC_GPR21', 0),
+        (23, 'PPC_GPR22', 0),
+        (24, 'PPC_GPR23', 0),
+        (25, 'PPC_GPR24', 0),
+        (26, 'PPC_GPR25', 0),
+        (27, 'PPC_GPR26', 0),
+        (28, 'PPC_GPR27', 0),
+        (29, 'PPC_GPR28', 0),
+        (30, 'PPC_GPR29', 0),
+        (31, 'PPC_GPR30', 0),
+        (32, 'PPC_GPR31', 0),
+        (33, 'PPC_CR', 0),
+        (34, 'PPC_CR0', 0),
+        (35, 'PPC_CR1', 0),
+        (36, 'PPC_CR2', 0),
+        (37, 'PPC_CR3', 0),
+        (38, 'PPC_CR4', 0),
+        (39, 'PPC_CR5', 0),
+        (40, 'PPC_CR6', 0),
+        (41, 'PPC_CR7', 0),
+        (42, 'PPC_FPR0', 0),
+        (43, 'PPC_FPR1', 0),
+        (44, 'PPC_FPR2', 0),
+        (45, 'PPC_FPR3', 0),
+        (46, 'PPC_FPR4', 0),
+        (47, 'PPC_FPR5', 0),
+        (48, 'PPC_FPR6', 0),
+        (49, 'PPC_FPR7', 0),
+        (50, 'PPC_FPR8', 0),
+        (51, 'PPC_FPR9', 0),
+        (52, 'PPC_FPR10', 0),
+        (53, 'PPC_FPR11', 0),
+        (54, 'PPC_FPR12', 0),
+        (55, 'PPC_FPR13', 0),
+        (56, 'PPC_FPR14', 0),
+        (57, 'PPC_FPR15', 0),
+        (58, 'PPC_FPR16', 0),
+        (59, 'PPC_FPR17', 0),
+        (60, 'PPC_FPR18', 0),
+        (61, 'PPC_FPR19', 0),
+        (62, 'PPC_FPR20', 0),
+        (63, 'PPC_FPR21', 0),
+        (64, 'PPC_FPR22', 0),
+        (65, 'PPC_FPR23', 0),
+        (66, 'PPC_FPR24', 0),
+        (67, 'PPC_FPR25', 0),
+        (68, 'PPC_FPR26', 0),
+        (69, 'PPC_FPR27', 0),
+        (70, 'PPC_FPR28', 0),
+        (71, 'PPC_FPR29', 0),
+        (72, 'PPC_FPR30', 0),
+        (73, 'PPC_FPR31', 0),
+        (74, 'PPC_FPSCR', 0),
+        (75, 'PPC_MSR', 0),
+        (76, 'PPC_SR0', 0),
+        (77, 'PPC_SR1', 0),
+        (78, 'PPC_SR2', 0),
+        (79, 'PPC_SR3', 0),
+        (80, 'PPC_SR4', 0),
+        (81, 'PPC_SR5', 0),
+        (82, 'PPC_SR6', 0),
+        (83, 'PPC_SR7', 0),
+        (84, 'PPC_SR8', 0),
+        (85, 'PPC_SR9', 0),
+        (86, 'PPC_SR10', 0),
+        (87, 'PPC_SR11', 0),
+        (88, 'PPC_SR12', 0),
+        (89, 'PPC_SR13', 0),
+        (90, 'PPC_SR14', 0),
+        (91, 'PPC_SR15', 0),
+        (99, 'PPC_PC', 0),
+        (100, 'PPC_MQ', 0),
+        (101, 'PPC_XER', 0),
+        (104, 'PPC_RTCU', 0),
+        (105, 'PPC_RTCL', 0),
+        (108, 'PPC_LR', 0),
+        (109, 'PPC_CTR', 0),
+        (110, 'PPC_COMPARE', 0),
+        (111, 'PPC_COUNT', 0),
+        (118, 'PPC_DSISR', 0),
+        (119, 'PPC_DAR', 0),
+        (122, 'PPC_DEC', 0),
+        (125, 'PPC_SDR1', 0),
+        (126, 'PPC_SRR0', 0),
+        (127, 'PPC_SRR1', 0),
+        (280, 'PPC_ASR', 0),
+        (287, 'PPC_PVR', 0),
+        (372, 'PPC_SPRG0', 0),
+        (373, 'PPC_SPRG1', 0),
+        (374, 'PPC_SPRG2', 0),
+        (375, 'PPC_SPRG3', 0),
+        (382, 'PPC_EAR', 0),
+        (628, 'PPC_BAT0U', 0),
+        (629, 'PPC_BAT0L', 0),
+        (630, 'PPC_BAT1U', 0),
+        (631, 'PPC_BAT1L', 0),
+        (632, 'PPC_BAT2U', 0),
+        (633, 'PPC_BAT2L', 0),
+        (634, 'PPC_BAT3U', 0),
+        (635, 'PPC_BAT3L', 0),
+        (636, 'PPC_DBAT0U', 0),
+        (637, 'PPC_DBAT0L', 0),
+        (638, 'PPC_DBAT1U', 0),
+        (639, 'PPC_DBAT1L', 0),
+        (640, 'PPC_DBAT2U', 0),
+        (641, 'PPC_DBAT2L', 0),
+        (642, 'PPC_DBAT3U', 0),
+        (643, 'PPC_DBAT3L', 0),
+        (1044, 'PPC_PMR0', 0),
+        (1045, 'PPC_PMR1', 0),
+        (1046, 'PPC_PMR2', 0),
+        (1047, 'PPC_PMR3', 0),
+        (1048, 'PPC_PMR4', 0),
+        (1049, 'PPC_PMR5', 0),
+        (1050, 'PPC_PMR6', 0),
+        (1051, 'PPC_PMR7', 0),
+        (1052, 'PPC_PMR8', 0),
+        (1053, 'PPC_PMR9', 0),
+        (1054, 'PPC_PMR10', 0),
+        (1055, 'PPC_PMR11', 0),
+        (1056, 'PPC_PMR12', 0),
+        (1057, 'PPC_PMR13', 0),
+        (1058, 'PPC_PMR14', 0),
+        (1059, 'PPC_PMR15', 0),
+        (1076, 'PPC_DMISS', 0),
+        (1077, 'PPC_DCMP', 0),
+        (1078, 'PPC_HASH1', 0),
+        (1079, 'PPC_HASH2', 0),
+        (1080, 'PPC_IMISS', 0),
+        (1081, 'PPC_ICMP', 0),
+        (1082, 'PPC_RPA', 0),
+        (1108, 'PPC_HID0', 0),
+        (1109, 'PPC_HID1', 0),
+        (1110, 'PPC_HID2', 0),
+        (1111, 'PPC_HID3', 0),
+        (1112, 'PPC_HID4', 0),
+        (1113, 'PPC_HID5', 0),
+        (1114, 'PPC_HID6', 0),
+        (1115, 'PPC_HID7', 0),
+        (1116, 'PPC_HID8', 0),
+        (1117, 'PPC_HID9', 0),
+        (1118, 'PPC_HID10', 0),
+        (1119, 'PPC_HID11', 0),
+        (1120, 'PPC_HID12', 0),
+        (1121, 'PPC_HID13', 0),
+        (1122, 'PPC_HID14', 0),
+        (1123, 'PPC_HID15', 0),
+    ),
+    'SH': (
+        (0, 'SH3_NOREG', 0),
+        (10, 'SH3_IntR0', 0),
+        (11, 'SH3_IntR1', 0),
+        (12, 'SH3_IntR2', 0),
+        (13, 'SH3_IntR3', 0),
+        (14, 'SH3_IntR4', 0),
+        (15, 'SH3_IntR5', 0),
+        (16, 'SH3_IntR6', 0),
+        (17, 'SH3_IntR7', 0),
+        (18, 'SH3_IntR8', 0),
+        (19, 'SH3_IntR9', 0),
+        (20, 'SH3_IntR10', 0),
+        (21, 'SH3_IntR11', 0),
+        (22, 'SH3_IntR12', 0),
+        (23, 'SH3_IntR13', 0),
+        (24, 'SH3_IntFp', 0),
+        (25, 'SH3_IntSp', 0),
+        (38, 'SH3_Gbr', 0),
+        (39, 'SH3_Pr', 0),
+        (40, 'SH3_Mach', 0),
+        (41, 'SH3_Macl', 0),
+        (50, 'SH3_Pc', 0),
+        (51, 'SH3_Sr', 0),
+        (60, 'SH3_BarA', 0),
+        (61, 'SH3_BasrA', 0),
+        (62, 'SH3_BamrA', 0),
+        (63, 'SH3_BbrA', 0),
+        (64, 'SH3_BarB', 0),
+        (65, 'SH3_BasrB', 0),
+        (66, 'SH3_BamrB', 0),
+        (67, 'SH3_BbrB', 0),
+        (68, 'SH3_BdrB', 0),
+        (69, 'SH3_BdmrB', 0),
+        (70, 'SH3_Brcr', 0),
+        (75, 'SH_Fpscr', 0),
+        (76, 'SH_Fpul', 0),
+        (80, 'SH_FpR0', 0),
+        (81, 'SH_FpR1', 0),
+        (82, 'SH_FpR2', 0),
+        (83, 'SH_FpR3', 0),
+        (84, 'SH_FpR4', 0),
+        (85, 'SH_FpR5', 0),
+        (86, 'SH_FpR6', 0),
+        (87, 'SH_FpR7', 0),
+        (88, 'SH_FpR8', 0),
+        (89, 'SH_FpR9', 0),
+        (90, 'SH_FpR10', 0),
+        (91, 'SH_FpR11', 0),
+        (92, 'SH_FpR12', 0),
+        (93, 'SH_FpR13', 0),
+        (94, 'SH_FpR14', 0),
+        (95, 'SH_FpR15', 0),
+        (96, 'SH_XFpR0', 0),
+        (97, 'SH_XFpR1', 0),
+        (98, 'SH_XFpR2', 0),
+        (99, 'SH_XFpR3', 0),
+        (100, 'SH_XFpR4', 0),
+        (101, 'SH_XFpR5', 0),
+        (102, 'SH_XFpR6', 0),
+        (103, 'SH_XFpR7', 0),
+        (104, 'SH_XFpR8', 0),
+        (105, 'SH_XFpR9', 0),
+        (106, 'SH_XFpR10', 0),
+        (107, 'SH_XFpR11', 0),
+        (108, 'SH_XFpR12', 0),
+        (109, 'SH_XFpR13', 0),
+        (110, 'SH_XFpR14', 0),
+        (111, 'SH_XFpR15', 0),
+    ),
+    'SHMEDIA': (
+        (0, 'SHMEDIA_NOREG', 0),
+        (10, 'SHMEDIA_R0', 0),
+        (11, 'SHMEDIA_R1', 0),
+        (12, 'SHMEDIA_R2', 0),
+        (13, 'SHMEDIA_R3', 0),
+        (14, 'SHMEDIA_R4', 0),
+        (15, 'SHMEDIA_R5', 0),
+        (16, 'SHMEDIA_R6', 0),
+        (17, 'SHMEDIA_R7', 0),
+        (18, 'SHMEDIA_R8', 0),
+        (19, 'SHMEDIA_R9', 0),
+        (20, 'SHMEDIA_R10', 0),
+        (21, 'SHMEDIA_R11', 0),
+        (22, 'SHMEDIA_R12', 0),
+        (23, 'SHMEDIA_R13', 0),
+        (24, 'SHMEDIA_R14', 0),
+        (25, 'SHMEDIA_R15', 0),
+        (26, 'SHMEDIA_R16', 0),
+        (27, 'SHMEDIA_R17', 0),
+        (28, 'SHMEDIA_R18', 0),
+        (29, 'SHMEDIA_R19', 0),
+        (30, 'SHMEDIA_R20', 0),
+        (31, 'SHMEDIA_R21', 0),
+        (32, 'SHMEDIA_R22', 0),
+        (33, 'SHMEDIA_R23', 0),
+        (34, 'SHMEDIA_R24', 0),
+        (35, 'SHMEDIA_R25', 0),
+        (36, 'SHMEDIA_R26', 0),
+        (37, 'SHMEDIA_R27', 0),
+        (38, 'SHMEDIA_R28', 0),
+        (39, 'SHMEDIA_R29', 0),
+        (40, 'SHMEDIA_R30', 0),
+        (41, 'SHMEDIA_R31', 0),
+        (42, 'SHMEDIA_R32', 0),
+        (43, 'SHMEDIA_R33', 0),
+        (44, 'SHMEDIA_R34', 0),
+        (45, 'SHMEDIA_R35', 0),
+        (46, 'SHMEDIA_R36', 0),
+        (47, 'SHMEDIA_R37', 0),
+        (48, 'SHMEDIA_R38', 0),
+        (49, 'SHMEDIA_R39', 0),
+        (50, 'SHMEDIA_R40', 0),
+        (51, 'SHMEDIA_R41', 0),
+        (52, 'SHMEDIA_R42', 0),
+        (53, 'SHMEDIA_R43', 0),
+        (54, 'SHMEDIA_R44', 0),
+        (55, 'SHMEDIA_R45', 0),
+        (56, 'SHMEDIA_R46', 0),
+        (57, 'SHMEDIA_R47', 0),
+        (58, 'SHMEDIA_R48', 0),
+        (59, 'SHMEDIA_R49', 0),
+        (60, 'SHMEDIA_R50', 0),
+        (61, 'SHMEDIA_R51', 0),
+        (62, 'SHMEDIA_R52', 0),
+        (63, 'SHMEDIA_R53', 0),
+        (64, 'SHMEDIA_R54', 0),
+        (65, 'SHMEDIA_R55', 0),
+        (66, 'SHMEDIA_R56', 0),
+        (67, 'SHMEDIA_R57', 0),
+        (68, 'SHMEDIA_R58', 0),
+        (69, 'SHMEDIA_R59', 0),
+        (70, 'SHMEDIA_R60', 0),
+        (71, 'SHMEDIA_R61', 0),
+        (72, 'SHMEDIA_R62', 0),
+        (73, 'SHMEDIA_R63', 0),
+        (74, 'SHMEDIA_TR0', 0),
+        (75, 'SHMEDIA_TR1', 0),
+        (76, 'SHMEDIA_TR2', 0),
+        (77, 'SHMEDIA_TR3', 0),
+        (78, 'SHMEDIA_TR4', 0),
+        (79, 'SHMEDIA_TR5', 0),
+        (80, 'SHMEDIA_TR6', 0),
+        (81, 'SHMEDIA_TR7', 0),
+        (82, 'SHMEDIA_TR8', 0),
+        (83, 'SHMEDIA_TR9', 0),
+        (84, 'SHMEDIA_TR10', 0),
+        (85, 'SHMEDIA_TR11', 0),
+        (86, 'SHMEDIA_TR12', 0),
+        (87, 'SHMEDIA_TR13', 0),
+        (88, 'SHMEDIA_TR14', 0),
+        (89, 'SHMEDIA_TR15', 0),
+        (90, 'SHMEDIA_MACL', 0),
+        (91, 'SHMEDIA_MACH', 0),
+        (92, 'SHMEDIA_T', 0),
+        (93, 'SHMEDIA_PC', 0),
+        (128, 'SHMEDIA_FR0', 0),
+        (129, 'SHMEDIA_FR1', 0),
+        (130, 'SHMEDIA_FR2', 0),
+        (131, 'SHMEDIA_FR3', 0),
+        (132, 'SHMEDIA_FR4', 0),
+        (133, 'SHMEDIA_FR5', 0),
+        (134, 'SHMEDIA_FR6', 0),
+        (135, 'SHMEDIA_FR7', 0),
+        (136, 'SHMEDIA_FR8', 0),
+        (137, 'SHMEDIA_FR9', 0),
+        (138, 'SHMEDIA_FR10', 0),
+        (139, 'SHMEDIA_FR11', 0),
+        (140, 'SHMEDIA_FR12', 0),
+        (141, 'SHMEDIA_FR13', 0),
+        (142, 'SHMEDIA_FR14', 0),
+        (143, 'SHMEDIA_FR15', 0),
+        (144, 'SHMEDIA_FR16', 0),
+        (145, 'SHMEDIA_FR17', 0),
+        (146, 'SHMEDIA_FR18', 0),
+        (147, 'SHMEDIA_FR19', 0),
+        (148, 'SHMEDIA_FR20', 0),
+        (149, 'SHMEDIA_FR21', 0),
+        (150, 'SHMEDIA_FR22', 0),
+        (151, 'SHMEDIA_FR23', 0),
+        (152, 'SHMEDIA_FR24', 0),
+        (153, 'SHMEDIA_FR25', 0),
+        (154, 'SHMEDIA_FR26', 0),
+        (155, 'SHMEDIA_FR27', 0),
+        (156, 'SHMEDIA_FR28', 0),
+        (157, 'SHMEDIA_FR29', 0),
+        (158, 'SHMEDIA_FR30', 0),
+        (159, 'SHMEDIA_FR31', 0),
+        (160, 'SHMEDIA_FR32', 0),
+        (161, 'SHMEDIA_FR33', 0),
+        (162, 'SHMEDIA_FR34', 0),
+        (163, 'SHMEDIA_FR35', 0),
+        (164, 'SHMEDIA_FR36', 0),
+        (165, 'SHMEDIA_FR37', 0),
+        (166, 'SHMEDIA_FR38', 0),
+        (167, 'SHMEDIA_FR39', 0),
+        (168, 'SHMEDIA_FR40', 0),
+        (169, 'SHMEDIA_FR41', 0),
+        (170, 'SHMEDIA_FR42', 0),
+        (171, 'SHMEDIA_FR43', 0),
+        (172, 'SHMEDIA_FR44', 0),
+        (173, 'SHMEDIA_FR45', 0),
+        (174, 'SHMEDIA_FR46', 0),
+        (175, 'SHMEDIA_FR47', 0),
+        (176, 'SHMEDIA_FR48', 0),
+        (177, 'SHMEDIA_FR49', 0),
+        (178, 'SHMEDIA_FR50', 0),
+        (179, 'SHMEDIA_FR51', 0),
+        (180, 'SHMEDIA_FR52', 0),
+        (181, 'SHMEDIA_FR53', 0),
+        (182, 'SHMEDIA_FR54', 0),
+        (183, 'SHMEDIA_FR55', 0),
+        (184, 'SHMEDIA_FR56', 0),
+        (185, 'SHMEDIA_FR57', 0),
+        (186, 'SHMEDIA_FR58', 0),
+        (187, 'SHMEDIA_FR59', 0),
+        (188, 'SHMEDIA_FR60', 0),
+        (189, 'SHMEDIA_FR61', 0),
+        (190, 'SHMEDIA_FR62', 0),
+        (191, 'SHMEDIA_FR63', 0),
+        (256, 'SHMEDIA_DR0', 0),
+        (258, 'SHMEDIA_DR2', 0),
+        (260, 'SHMEDIA_DR4', 0),
+        (262, 'SHMEDIA_DR6', 0),
+        (264, 'SHMEDIA_DR8', 0),
+        (266, 'SHMEDIA_DR10', 0),
+        (268, 'SHMEDIA_DR12', 0),
+        (270, 'SHMEDIA_DR14', 0),
+        (272, 'SHMEDIA_DR16', 0),
+        (274, 'SHMEDIA_DR18', 0),
+        (276, 'SHMEDIA_DR20', 0),
+        (278, 'SHMEDIA_DR22', 0),
+        (280, 'SHMEDIA_DR24', 0),
+        (282, 'SHMEDIA_DR26', 0),
+        (284, 'SHMEDIA_DR28', 0),
+        (286, 'SHMEDIA_DR30', 0),
+        (288, 'SHMEDIA_DR32', 0),
+        (290, 'SHMEDIA_DR34', 0),
+        (292, 'SHMEDIA_DR36', 0),
+        (294, 'SHMEDIA_DR38', 0),
+        (296, 'SHMEDIA_DR40', 0),
+        (298, 'SHMEDIA_DR42', 0),
+        (300, 'SHMEDIA_DR44', 0),
+        (302, 'SHMEDIA_DR46', 0),
+        (304, 'SHMEDIA_DR48', 0),
+        (306, 'SHMEDIA_DR50', 0),
+        (308, 'SHMEDIA_DR52', 0),
+        (310, 'SHMEDIA_DR54', 0),
+        (312, 'SHMEDIA_DR56', 0),
+        (314, 'SHMEDIA_DR58', 0),
+        (316, 'SHMEDIA_DR60', 0),
+        (318, 'SHMEDIA_DR62', 0),
+        (512, 'SHMEDIA_FV0', 0),
+        (516, 'SHMEDIA_FV4', 0),
+        (520, 'SHMEDIA_FV8', 0),
+        (524, 'SHMEDIA_FV12', 0),
+        (528, 'SHMEDIA_FV16', 0),
+        (532, 'SHMEDIA_FV20', 0),
+        (536, 'SHMEDIA_FV24', 0),
+        (540, 'SHMEDIA_FV28', 0),
+        (544, 'SHMEDIA_FV32', 0),
+        (548, 'SHMEDIA_FV36', 0),
+        (552, 'SHMEDIA_FV40', 0),
+        (556, 'SHMEDIA_FV44', 0),
+        (560, 'SHMEDIA_FV48', 0),
+        (564, 'SHMEDIA_FV52', 0),
+        (568, 'SHMEDIA_FV56', 0),
+        (572, 'SHMEDIA_FV60', 0),
+        (1024, 'SHMEDIA_MTRX0', 0),
+        (1040, 'SHMEDIA_MTRX16', 0),
+        (1056, 'SHMEDIA_MTRX32', 0),
+        (1072, 'SHMEDIA_MTRX48', 0),
+        (2000, 'SHMEDIA_CR0', 0),
+        (2001, 'SHMEDIA_CR1', 0),
+        (2002, 'SHMEDIA_CR2', 0),
+        (2003, 'SHMEDIA_CR3', 0),
+        (2004, 'SHMEDIA_CR4', 0),
+        (2005, 'SHMEDIA_CR5', 0),
+        (2006, 'SHMEDIA_CR6', 0),
+        (2007, 'SHMEDIA_CR7', 0),
+        (2008, 'SHMEDIA_CR8', 0),
+        (2009, 'SHMEDIA_CR9', 0),
+        (2010, 'SHMEDIA_CR10', 0),
+        (2011, 'SHMEDIA_CR11', 0),
+        (2012, 'SHMEDIA_CR12', 0),
+        (2013, 'SHMEDIA_CR13', 0),
+        (2014, 'SHMEDIA_CR14', 0),
+        (2015, 'SHMEDIA_CR15', 0),
+        (2016, 'SHMEDIA_CR16', 0),
+        (2017, 'SHMEDIA_CR17', 0),
+        (2018, 'SHMEDIA_CR18', 0),
+        (2019, 'SHMEDIA_CR19', 0),
+        (2020, 'SHMEDIA_CR20', 0),
+        (2021, 'SHMEDIA_CR21', 0),
+        (2022, 'SHMEDIA_CR22', 0),
+        (2023, 'SHMEDIA_CR23', 0),
+        (2024, 'SHMEDIA_CR24', 0),
+        (2025, 'SHMEDIA_CR25', 0),
+        (2026, 'SHMEDIA_CR26', 0),
+        (2027, 'SHMEDIA_CR27', 0),
+        (2028, 'SHMEDIA_CR28', 0),
+        (2029, 'SHMEDIA_CR29', 0),
+        (2030, 'SHMEDIA_CR30', 0),
+        (2031, 'SHMEDIA_CR31', 0),
+        (2032, 'SHMEDIA_CR32', 0),
+        (2033, 'SHMEDIA_CR33', 0),
+        (2034, 'SHMEDIA_CR34', 0),
+        (2035, 'SHMEDIA_CR35', 0),
+        (2036, 'SHMEDIA_CR36', 0),
+        (2037, 'SHMEDIA_CR37', 0),
+        (2038, 'SHMEDIA_CR38', 0),
+        (2039, 'SHMEDIA_CR39', 0),
+        (2040, 'SHMEDIA_CR40', 0),
+        (2041, 'SHMEDIA_CR41', 0),
+        (2042, 'SHMEDIA_CR42', 0),
+        (2043, 'SHMEDIA_CR43', 0),
+        (2044, 'SHMEDIA_CR44', 0),
+        (2045, 'SHMEDIA_CR45', 0),
+        (2046, 'SHMEDIA_CR46', 0),
+        (2047, 'SHMEDIA_CR47', 0),
+        (2048, 'SHMEDIA_CR48', 0),
+        (2049, 'SHMEDIA_CR49', 0),
+        (2050, 'SHMEDIA_CR50', 0),
+        (2051, 'SHMEDIA_CR51', 0),
+        (2052, 'SHMEDIA_CR52', 0),
+        (2053, 'SHMEDIA_CR53', 0),
+        (2054, 'SHMEDIA_CR54', 0),
+        (2055, 'SHMEDIA_CR55', 0),
+        (2056, 'SHMEDIA_CR56', 0),
+        (2057, 'SHMEDIA_CR57', 0),
+        (2058, 'SHMEDIA_CR58', 0),
+        (2059, 'SHMEDIA_CR59', 0),
+        (2060, 'SHMEDIA_CR60', 0),
+        (2061, 'SHMEDIA_CR61', 0),
+        (2062, 'SHMEDIA_CR62', 0),
+        (2063, 'SHMEDIA_CR63', 0),
+        (2064, 'SHMEDIA_FPSCR', 0),
+    ),
+    'ARM': (
+        (0, 'ARM_NOREG', 0),
+        (10, 'ARM_R0', 32),
+        (11, 'ARM_R1', 32),
+        (12, 'ARM_R2', 32),
+        (13, 'ARM_R3', 32),
+        (14, 'ARM_R4', 32),
+        (15, 'ARM_R5', 32),
+        (16, 'ARM_R6', 32),
+        (17, 'ARM_R7', 32),
+        (18, 'ARM_R8', 32),
+        (19, 'ARM_R9', 32),
+        (20, 'ARM_R10', 32),
+        (21, 'ARM_R11', 32),
+        (22, 'ARM_R12', 32),
+        (23, 'ARM_SP', 32),
+        (24, 'ARM_LR', 32),
+        (25, 'ARM_PC', 32),
+        (26, 'ARM_CPSR', 32),
+        (27, 'ARM_ACC0', 64),
+        (40, 'ARM_FPSCR', 32),
+        (41, 'ARM_FPEXC', 32),
+        (50, 'ARM_FS0', 32),
+        (51, 'ARM_FS1', 32),
+        (52, 'ARM_FS2', 32),
+        (53, 'ARM_FS3', 32),
+        (54, 'ARM_FS4', 32),
+        (55, 'ARM_FS5', 32),
+        (56, 'ARM_FS6', 32),
+        (57, 'ARM_FS7', 32),
+        (58, 'ARM_FS8', 32),
+        (59, 'ARM_FS9', 32),
+        (60, 'ARM_FS10', 32),
+        (61, 'ARM_FS11', 32),
+        (62, 'ARM_FS12', 32),
+        (63, 'ARM_FS13', 32),
+        (64, 'ARM_FS14', 32),
+        (65, 'ARM_FS15', 32),
+        (66, 'ARM_FS16', 32),
+        (67, 'ARM_FS17', 32),
+        (68, 'ARM_FS18', 32),
+        (69, 'ARM_FS19', 32),
+        (70, 'ARM_FS20', 32),
+        (71, 'ARM_FS21', 32),
+        (72, 'ARM_FS22', 32),
+        (73, 'ARM_FS23', 32),
+        (74, 'ARM_FS24', 32),
+        (75, 'ARM_FS25', 32),
+        (76, 'ARM_FS26', 32),
+        (77, 'ARM_FS27', 32),
+        (78, 'ARM_FS28', 32),
+        (79, 'ARM_FS29', 32),
+        (80, 'ARM_FS30', 32),
+        (81, 'ARM_FS31', 32),
+        (90, 'ARM_FPEXTRA0', 32),
+        (91, 'ARM_FPEXTRA1', 32),
+        (92, 'ARM_FPEXTRA2', 32),
+        (93, 'ARM_FPEXTRA3', 32),
+        (94, 'ARM_FPEXTRA4', 32),
+        (95, 'ARM_FPEXTRA5', 32),
+        (96, 'ARM_FPEXTRA6', 32),
+        (97, 'ARM_FPEXTRA7', 32),
+        (128, 'ARM_WR0', 64),
+        (129, 'ARM_WR1', 64),
+        (130, 'ARM_WR2', 64),
+        (131, 'ARM_WR3', 64),
+        (132, 'ARM_WR4', 64),
+        (133, 'ARM_WR5', 64),
+        (134, 'ARM_WR6', 64),
+        (135, 'ARM_WR7', 64),
+        (136, 'ARM_WR8', 64),
+        (137, 'ARM_WR9', 64),
+        (138, 'ARM_WR10', 64),
+        (139, 'ARM_WR11', 64),
+        (140, 'ARM_WR12', 64),
+        (141, 'ARM_WR13', 64),
+        (142, 'ARM_WR14', 64),
+        (143, 'ARM_WR15', 64),
+        (144, 'ARM_WCID', 32),
+        (145, 'ARM_WCON', 32),
+        (146, 'ARM_WCSSF', 32),
+        (147, 'ARM_WCASF', 32),
+        (148, 'ARM_WC4', 32),
+        (149, 'ARM_WC5', 32),
+        (150, 'ARM_WC6', 32),
+        (151, 'ARM_WC7', 32),
+        (152, 'ARM_WCGR0', 32),
+        (153, 'ARM_WCGR1', 32),
+        (154, 'ARM_WCGR2', 32),
+        (155, 'ARM_WCGR3', 32),
+        (156, 'ARM_WC12', 32),
+        (157, 'ARM_WC13', 32),
+        (158, 'ARM_WC14', 32),
+        (159, 'ARM_WC15', 32),
+        (200, 'ARM_FS32', 32),
+        (201, 'ARM_FS33', 32),
+        (202, 'ARM_FS34', 32),
+        (203, 'ARM_FS35', 32),
+        (204, 'ARM_FS36', 32),
+        (205, 'ARM_FS37', 32),
+        (206, 'ARM_FS38', 32),
+        (207, 'ARM_FS39', 32),
+        (208, 'ARM_FS40', 32),
+        (209, 'ARM_FS41', 32),
+        (210, 'ARM_FS42', 32),
+        (211, 'ARM_FS43', 32),
+        (212, 'ARM_FS44', 32),
+        (213, 'ARM_FS45', 32),
+        (214, 'ARM_FS46', 32),
+        (215, 'ARM_FS47', 32),
+        (216, 'ARM_FS48', 32),
+        (217, 'ARM_FS49', 32),
+        (218, 'ARM_FS50', 32),
+        (219, 'ARM_FS51', 32),
+        (220, 'ARM_FS52', 32),
+        (221, 'ARM_FS53', 32),
+        (222, 'ARM_FS54', 32),
+        (223, 'ARM_FS55', 32),
+        (224, 'ARM_FS56', 32),
+        (225, 'ARM_FS57', 32),
+        (226, 'ARM_FS58', 32),
+        (227, 'ARM_FS59', 32),
+        (228, 'ARM_FS60', 32),
+        (229, 'ARM_FS61', 32),
+        (230, 'ARM_FS62', 32),
+        (231, 'ARM_FS63', 32),
+        (300, 'ARM_ND0', 64),
+        (301, 'ARM_ND1', 64),
+        (302, 'ARM_ND2', 64),
+        (303, 'ARM_ND3', 64),
+        (304, 'ARM_ND4', 64),
+        (305, 'ARM_ND5', 64),
+        (306, 'ARM_ND6', 64),
+        (307, 'ARM_ND7', 64),
+        (308, 'ARM_ND8', 64),
+        (309, 'ARM_ND9', 64),
+        (310, 'ARM_ND10', 64),
+        (311, 'ARM_ND11', 64),
+        (312, 'ARM_ND12', 64),
+        (313, 'ARM_ND13', 64),
+        (314, 'ARM_ND14', 64),
+        (315, 'ARM_ND15', 64),
+        (316, 'ARM_ND16', 64),
+        (317, 'ARM_ND17', 64),
+        (318, 'ARM_ND18', 64),
+        (319, 'ARM_ND19', 64),
+        (320, 'ARM_ND20', 64),
+        (321, 'ARM_ND21', 64),
+        (322, 'ARM_ND22', 64),
+        (323, 'ARM_ND23', 64),
+        (324, 'ARM_ND24', 64),
+        (325, 'ARM_ND25', 64),
+        (326, 'ARM_ND26', 64),
+        (327, 'ARM_ND27', 64),
+        (328, 'ARM_ND28', 64),
+        (329, 'ARM_ND29', 64),
+        (330, 'ARM_ND30', 64),
+        (331, 'ARM_ND31', 64),
+        (400, 'ARM_NQ0', 128),
+        (401, 'ARM_NQ1', 128),
+        (402, 'ARM_NQ2', 128),
+        (403, 'ARM_NQ3', 128),
+        (404, 'ARM_NQ4', 128),
+        (405, 'ARM_NQ5', 128),
+        (406, 'ARM_NQ6', 128),
+        (407, 'ARM_NQ7', 128),
+        (408, 'ARM_NQ8', 128),
+        (409, 'ARM_NQ9', 128),
+        (410, 'ARM_NQ10', 128),
+        (411, 'ARM_NQ11', 128),
+        (412, 'ARM_NQ12', 128),
+        (413, 'ARM_NQ13', 128),
+        (414, 'ARM_NQ14', 128),
+        (415, 'ARM_NQ15', 128),
+    ),
+    'IA64': (
+        (0, 'IA64_NOREG', 0),
+        (512, 'IA64_Br0', 0),
+        (513, 'IA64_Br1', 0),
+        (514, 'IA64_Br2', 0),
+        (515, 'IA64_Br3', 0),
+        (516, 'IA64_Br4', 0),
+        (517, 'IA64_Br5', 0),
+        (518, 'IA64_Br6', 0),
+        (519, 'IA64_Br7', 0),
+        (704, 'IA64_P0', 0),
+        (705, 'IA64_P1', 0),
+        (706, 'IA64_P2', 0),
+        (707, 'IA64_P3', 0),
+        (708, 'IA64_P4', 0),
+        (709, 'IA64_P5', 0),
+        (710, 'IA64_P6', 0),
+        (711, 'IA64_P7', 0),
+        (712, 'IA64_P8', 0),
+        (713, 'IA64_P9', 0),
+        (714, 'IA64_P10', 0),
+        (715, 'IA64_P11', 0),
+        (716, 'IA64_P12', 0),
+        (717, 'IA64_P13', 0),
+        (718, 'IA64_P14', 0),
+        (719, 'IA64_P15', 0),
+        (720, 'IA64_P16', 0),
+        (721, 'IA64_P17', 0),
+        (722, 'IA64_P18', 0),
+        (723, 'IA64_P19', 0),
+        (724, 'IA64_P20', 0),
+        (725, 'IA64_P21', 0),
+        (726, 'IA64_P22', 0),
+        (727, 'IA64_P23', 0),
+        (728, 'IA64_P24', 0),
+        (729, 'IA64_P25', 0),
+        (730, 'IA64_P26', 0),
+        (731, 'IA64_P27', 0),
+        (732, 'IA64_P28', 0),
+        (733, 'IA64_P29', 0),
+        (734, 'IA64_P30', 0),
+        (735, 'IA64_P31', 0),
+        (736, 'IA64_P32', 0),
+        (737, 'IA64_P33', 0),
+        (738, 'IA64_P34', 0),
+        (739, 'IA64_P35', 0),
+        (740, 'IA64_P36', 0),
+        (741, 'IA64_P37', 0),
+        (742, 'IA64_P38', 0),
+        (743, 'IA64_P39', 0),
+        (744, 'IA64_P40', 0),
+        (745, 'IA64_P41', 0),
+        (746, 'IA64_P42', 0),
+        (747, 'IA64_P43', 0),
+        (748, 'IA64_P44', 0),
+        (749, 'IA64_P45', 0),
+        (750, 'IA64_P46', 0),
+        (751, 'IA64_P47', 0),
+        (752, 'IA64_P48', 0),
+        (753, 'IA64_P49', 0),
+        (754, 'IA64_P50', 0),
+        (755, 'IA64_P51', 0),
+        (756, 'IA64_P52', 0),
+        (757, 'IA64_P53', 0),
+        (758, 'IA64_P54', 0),
+        (759, 'IA64_P55', 0),
+        (760, 'IA64_P56', 0),
+        (761, 'IA64_P57', 0),
+        (762, 'IA64_P58', 0),
+        (763, 'IA64_P59', 0),
+        (764, 'IA64_P60', 0),
+        (765, 'IA64_P61', 0),
+        (766, 'IA64_P62', 0),
+        (767, 'IA64_P63', 0),
+        (768, 'IA64_Preds', 0),
+        (832, 'IA64_IntH0', 0),
+        (833, 'IA64_IntH1', 0),
+        (834, 'IA64_IntH2', 0),
+        (835, 'IA64_IntH3', 0),
+        (836, 'IA64_IntH4', 0),
+        (837, 'IA64_IntH5', 0),
+        (838, 'IA64_IntH6', 0),
+        (839, 'IA64_IntH7', 0),
+        (840, 'IA64_IntH8', 0),
+        (841, 'IA64_IntH9', 0),
+        (842, 'IA64_IntH10', 0),
+        (843, 'IA64_IntH11', 0),
+        (844, 'IA64_IntH12', 0),
+        (845, 'IA64_IntH13', 0),
+        (846, 'IA64_IntH14', 0),
+        (847, 'IA64_IntH15', 0),
+        (1016, 'IA64_Ip', 0),
+        (1017, 'IA64_Umask', 0),
+        (1018, 'IA64_Cfm', 0),
+        (1019, 'IA64_Psr', 0),
+        (1020, 'IA64_Nats', 0),
+        (1021, 'IA64_Nats2', 0),
+        (1022, 'IA64_Nats3', 0),
+        (1024, 'IA64_IntR0', 0),
+        (1025, 'IA64_IntR1', 0),
+        (1026, 'IA64_IntR2', 0),
+        (1027, 'IA64_IntR3', 0),
+        (1028, 'IA64_IntR4', 0),
+        (1029, 'IA64_IntR5', 0),
+        (1030, 'IA64_IntR6', 0),
+        (1031, 'IA64_IntR7', 0),
+        (1032, 'IA64_IntR8', 0),
+        (1033, 'IA64_IntR9', 0),
+        (1034, 'IA64_IntR10', 0),
+        (1035, 'IA64_IntR11', 0),
+        (1036, 'IA64_IntR12', 0),
+        (1037, 'IA64_IntR13', 0),
+        (1038, 'IA64_IntR14', 0),
+        (1039, 'IA64_IntR15', 0),
+        (1040, 'IA64_IntR16', 0),
+        (1041, 'IA64_IntR17', 0),
+        (1042, 'IA64_IntR18', 0),
+        (1043, 'IA64_IntR19', 0),
+        (1044, 'IA64_IntR20', 0),
+        (1045, 'IA64_IntR21', 0),
+        (1046, 'IA64_IntR22', 0),
+        (1047, 'IA64_IntR23', 0),
+        (1048, 'IA64_IntR24', 0),
+        (1049, 'IA64_IntR25', 0),
+        (1050, 'IA64_IntR26', 0),
+        (1051, 'IA64_IntR27', 0),
+        (1052, 'IA64_IntR28', 0),
+        (1053, 'IA64_IntR29', 0),
+        (1054, 'IA64_IntR30', 0),
+        (1055, 'IA64_IntR31', 0),
+        (1056, 'IA64_IntR32', 0),
+        (1057, 'IA64_IntR33', 0),
+        (1058, 'IA64_IntR34', 0),
+        (1059, 'IA64_IntR35', 0),
+        (1060, 'IA64_IntR36', 0),
+        (1061, 'IA64_IntR37', 0),
+        (1062, 'IA64_IntR38', 0),
+        (1063, 'IA64_IntR39', 0),
+        (1064, 'IA64_IntR40', 0),
+        (1065, 'IA64_IntR41', 0),
+        (1066, 'IA64_IntR42', 0),
+        (1067, 'IA64_IntR43', 0),
+        (1068, 'IA64_IntR44', 0),
+        (1069, 'IA64_IntR45', 0),
+        (1070, 'IA64_IntR46', 0),
+        (1071, 'IA64_IntR47', 0),
+        (1072, 'IA64_IntR48', 0),
+        (1073, 'IA64_IntR49', 0),
+        (1074, 'IA64_IntR50', 0),
+        (1075, 'IA64_IntR51', 0),
+        (1076, 'IA64_IntR52', 0),
+        (1077, 'IA64_IntR53', 0),
+        (1078, 'IA64_IntR54', 0),
+        (1079, 'IA64_IntR55', 0),
+        (1080, 'IA64_IntR56', 0),
+        (1081, 'IA64_IntR57', 0),
+        (1082, 'IA64_IntR58', 0),
+        (1083, 'IA64_IntR59', 0),
+        (1084, 'IA64_IntR60', 0),
+        (1085, 'IA64_IntR61', 0),
+        (1086, 'IA64_IntR62', 0),
+        (1087, 'IA64_IntR63', 0),
+        (1088, 'IA64_IntR64', 0),
+        (1089, 'IA64_IntR65', 0),
+        (1090, 'IA64_IntR66', 0),
+        (1091, 'IA64_IntR67', 0),
+        (1092, 'IA64_IntR68', 0),
+        (1093, 'IA64_IntR69', 0),
+        (1094, 'IA64_IntR70', 0),
+        (1095, 'IA64_IntR71', 0),
+        (1096, 'IA64_IntR72', 0),
+        (1097, 'IA64_IntR73', 0),
+        (1098, 'IA64_IntR74', 0),
+        (1099, 'IA64_IntR75', 0),
+        (1100, 'IA64_IntR76', 0),
+        (1101, 'IA64_IntR77', 0),
+        (1102, 'IA64_IntR78', 0),
+        (1103, 'IA64_IntR79', 0),
+        (1104, 'IA64_IntR80', 0),
+        (1105, 'IA64_IntR81', 0),
+        (1106, 'IA64_IntR82', 0),
+        (1107, 'IA64_IntR83', 0),
+        (1108, 'IA64_IntR84', 0),
+        (1109, 'IA64_IntR85', 0),
+        (1110, 'IA64_IntR86', 0),
+        (1111, 'IA64_IntR87', 0),
+        (1112, 'IA64_IntR88', 0),
+        (1113, 'IA64_IntR89', 0),
+        (1114, 'IA64_IntR90', 0),
+        (1115, 'IA64_IntR91', 0),
+        (1116, 'IA64_IntR92', 0),
+        (1117, 'IA64_IntR93', 0),
+        (1118, 'IA64_IntR94', 0),
+        (1119, 'IA64_IntR95', 0),
+        (1120, 'IA64_IntR96', 0),
+        (1121, 'IA64_IntR97', 0),
+        (1122, 'IA64_IntR98', 0),
+        (1123, 'IA64_IntR99', 0),
+        (1124, 'IA64_IntR100', 0),
+        (1125, 'IA64_IntR101', 0),
+        (1126, 'IA64_IntR102', 0),
+        (1127, 'IA64_IntR103', 0),
+        (1128, 'IA64_IntR104', 0),
+        (1129, 'IA64_IntR105', 0),
+        (1130, 'IA64_IntR106', 0),
+        (1131, 'IA64_IntR107', 0),
+        (1132, 'IA64_IntR108', 0),
+        (1133, 'IA64_IntR109', 0),
+        (1134, 'IA64_IntR110', 0),
+        (1135, 'IA64_IntR111', 0),
+        (1136, 'IA64_IntR112', 0),
+        (1137, 'IA64_IntR113', 0),
+        (1138, 'IA64_IntR114', 0),
+        (1139, 'IA64_IntR115', 0),
+        (1140, 'IA64_IntR116', 0),
+        (1141, 'IA64_IntR117', 0),
+        (1142, 'IA64_IntR118', 0),
+        (1143, 'IA64_IntR119', 0),
+        (1144, 'IA64_IntR120', 0),
+        (1145, 'IA64_IntR121', 0),
+        (1146, 'IA64_IntR122', 0),
+        (1147, 'IA64_IntR123', 0),
+        (1148, 'IA64_IntR124', 0),
+        (1149, 'IA64_IntR125', 0),
+        (1150, 'IA64_IntR126', 0),
+        (1151, 'IA64_IntR127', 0),
+        (2048, 'IA64_FltF0', 0),
+        (2049, 'IA64_FltF1', 0),
+        (2050, 'IA64_FltF2', 0),
+        (2051, 'IA64_FltF3', 0),
+        (2052, 'IA64_FltF4', 0),
+        (2053, 'IA64_FltF5', 0),
+        (2054, 'IA64_FltF6', 0),
+        (2055, 'IA64_FltF7', 0),
+        (2056, 'IA64_FltF8', 0),
+        (2057, 'IA64_FltF9', 0),
+        (2058, 'IA64_FltF10', 0),
+        (2059, 'IA64_FltF11', 0),
+        (2060, 'IA64_FltF12', 0),
+        (2061, 'IA64_FltF13', 0),
+        (2062, 'IA64_FltF14', 0),
+        (2063, 'IA64_FltF15', 0),
+        (2064, 'IA64_FltF16', 0),
+        (2065, 'IA64_FltF17', 0),
+        (2066, 'IA64_FltF18', 0),
+        (2067, 'IA64_FltF19', 0),
+        (2068, 'IA64_FltF20', 0),
+        (2069, 'IA64_FltF21', 0),
+        (2070, 'IA64_FltF22', 0),
+        (2071, 'IA64_FltF23', 0),
+        (2072, 'IA64_FltF24', 0),
+        (2073, 'IA64_FltF25', 0),
+        (2074, 'IA64_FltF26', 0),
+        (2075, 'IA64_FltF27', 0),
+        (2076, 'IA64_FltF28', 0),
+        (2077, 'IA64_FltF29', 0),
+        (2078, 'IA64_FltF30', 0),
+        (2079, 'IA64_FltF31', 0),
+        (2080, 'IA64_FltF32', 0),
+        (2081, 'IA64_FltF33', 0),
+        (2082, 'IA64_FltF34', 0),
+        (2083, 'IA64_FltF35', 0),
+        (2084, 'IA64_FltF36', 0),
+        (2085, 'IA64_FltF37', 0),
+        (2086, 'IA64_FltF38', 0),
+        (2087, 'IA64_FltF39', 0),
+        (2088, 'IA64_FltF40', 0),
+        (2089, 'IA64_FltF41', 0),
+        (2090, 'IA64_FltF42', 0),
+        (2091, 'IA64_FltF43', 0),
+        (2092, 'IA64_FltF44', 0),
+        (2093, 'IA64_FltF45', 0),
+        (2094, 'IA64_FltF46', 0),
+        (2095, 'IA64_FltF47', 0),
+        (2096, 'IA64_FltF48', 0),
+        (2097, 'IA64_FltF49', 0),
+        (2098, 'IA64_FltF50', 0),
+        (2099, 'IA64_FltF51', 0),
+        (2100, 'IA64_FltF52', 0),
+        (2101, 'IA64_FltF53', 0),
+        (2102, 'IA64_FltF54', 0),
+        (2103, 'IA64_FltF55', 0),
+        (2104, 'IA64_FltF56', 0),
+        (2105, 'IA64_FltF57', 0),
+        (2106, 'IA64_FltF58', 0),
+        (2107, 'IA64_FltF59', 0),
+        (2108, 'IA64_FltF60', 0),
+        (2109, 'IA64_FltF61', 0),
+        (2110, 'IA64_FltF62', 0),
+        (2111, 'IA64_FltF63', 0),
+        (2112, 'IA64_FltF64', 0),
+        (2113, 'IA64_FltF65', 0),
+        (2114, 'IA64_FltF66', 0),
+        (2115, 'IA64_FltF67', 0),
+        (2116, 'IA64_FltF68', 0),
+        (2117, 'IA64_FltF69', 0),
+        (2118, 'IA64_FltF70', 0),
+        (2119, 'IA64_FltF71', 0),
+        (2120, 'IA64_FltF72', 0),
+        (2121, 'IA64_FltF73', 0),
+        (2122, 'IA64_FltF74', 0),
+        (2123, 'IA64_FltF75', 0),
+        (2124, 'IA64_FltF76', 0),
+        (2125, 'IA64_FltF77', 0),
+        (2126, 'IA64_FltF78', 0),
+        (2127, 'IA64_FltF79', 0),
+        (2128, 'IA64_FltF80', 0),
+        (2129, 'IA64_FltF81', 0),
+        (2130, 'IA64_FltF82', 0),
+        (2131, 'IA64_FltF83', 0),
+        (2132, 'IA64_FltF84', 0),
+        (2133, 'IA64_FltF85', 0),
+        (2134, 'IA64_FltF86', 0),
+        (2135, 'IA64_FltF87', 0),
+        (2136, 'IA64_FltF88', 0),
+        (2137, 'IA64_FltF89', 0),
+        (2138, 'IA64_FltF90', 0),
+        (2139, 'IA64_FltF91', 0),
+        (2140, 'IA64_FltF92', 0),
+        (2141, 'IA64_FltF93', 0),
+        (2142, 'IA64_FltF94', 0),
+        (2143, 'IA64_FltF95', 0),
+        (2144, 'IA64_FltF96', 0),
+        (2145, 'IA64_FltF97', 0),
+        (2146, 'IA64_FltF98', 0),
+        (2147, 'IA64_FltF99', 0),
+        (2148, 'IA64_FltF100', 0),
+        (2149, 'IA64_FltF101', 0),
+        (2150, 'IA64_FltF102', 0),
+        (2151, 'IA64_FltF103', 0),
+        (2152, 'IA64_FltF104', 0),
+        (2153, 'IA64_FltF105', 0),
+        (2154, 'IA64_FltF106', 0),
+        (2155, 'IA64_FltF107', 0),
+        (2156, 'IA64_FltF108', 0),
+        (2157, 'IA64_FltF109', 0),
+        (2158, 'IA64_FltF110', 0),
+        (2159, 'IA64_FltF111', 0),
+        (2160, 'IA64_FltF112', 0),
+        (2161, 'IA64_FltF113', 0),
+        (2162, 'IA64_FltF114', 0),
+        (2163, 'IA64_FltF115', 0),
+        (2164, 'IA64_FltF116', 0),
+        (2165, 'IA64_FltF117', 0),
+        (2166, 'IA64_FltF118', 0),
+        (2167, 'IA64_FltF119', 0),
+        (2168, 'IA64_FltF120', 0),
+        (2169, 'IA64_FltF121', 0),
+        (2170, 'IA64_FltF122', 0),
+        (2171, 'IA64_FltF123', 0),
+        (2172, 'IA64_FltF124', 0),
+        (2173, 'IA64_FltF125', 0),
+        (2174, 'IA64_FltF126', 0),
+        (2175, 'IA64_FltF127', 0),
+        (3072, 'IA64_ApKR0', 0),
+        (3073, 'IA64_ApKR1', 0),
+        (3074, 'IA64_ApKR2', 0),
+        (3075, 'IA64_ApKR3', 0),
+        (3076, 'IA64_ApKR4', 0),
+        (3077, 'IA64_ApKR5', 0),
+        (3078, 'IA64_ApKR6', 0),
+        (3079, 'IA64_ApKR7', 0),
+        (3080, 'IA64_AR8', 0),
+        (3081, 'IA64_AR9', 0),
+        (3082, 'IA64_AR10', 0),
+        (3083, 'IA64_AR11', 0),
+        (3084, 'IA64_AR12', 0),
+        (3085, 'IA64_AR13', 0),
+        (3086, 'IA64_AR14', 0),
+        (3087, 'IA64_AR15', 0),
+        (3088, 'IA64_RsRSC', 0),
+        (3089, 'IA64_RsBSP', 0),
+        (3090, 'IA64_RsBSPSTORE', 0),
+        (3091, 'IA64_RsRNAT', 0),
+        (3092, 'IA64_AR20', 0),
+        (3093, 'IA64_StFCR', 0),
+        (3094, 'IA64_AR22', 0),
+        (3095, 'IA64_AR23', 0),
+        (3096, 'IA64_EFLAG', 0),
+        (3097, 'IA64_CSD', 0),
+        (3098, 'IA64_SSD', 0),
+        (3099, 'IA64_CFLG', 0),
+        (3100, 'IA64_StFSR', 0),
+        (3101, 'IA64_StFIR', 0),
+        (3102, 'IA64_StFDR', 0),
+        (3103, 'IA64_AR31', 0),
+        (3104, 'IA64_ApCCV', 0),
+        (3105, 'IA64_AR33', 0),
+        (3106, 'IA64_AR34', 0),
+        (3107, 'IA64_AR35', 0),
+        (3108, 'IA64_ApUNAT', 0),
+        (3109, 'IA64_AR37', 0),
+        (3110, 'IA64_AR38', 0),
+        (3111, 'IA64_AR39', 0),
+        (3112, 'IA64_StFPSR', 0),
+        (3113, 'IA64_AR41', 0),
+        (3114, 'IA64_AR42', 0),
+        (3115, 'IA64_AR43', 0),
+        (3116, 'IA64_ApITC', 0),
+        (3117, 'IA64_AR45', 0),
+        (3118, 'IA64_AR46', 0),
+        (3119, 'IA64_AR47', 0),
+        (3120, 'IA64_AR48', 0),
+        (3121, 'IA64_AR49', 0),
+        (3122, 'IA64_AR50', 0),
+        (3123, 'IA64_AR51', 0),
+        (3124, 'IA64_AR52', 0),
+        (3125, 'IA64_AR53', 0),
+        (3126, 'IA64_AR54', 0),
+        (3127, 'IA64_AR55', 0),
+        (3128, 'IA64_AR56', 0),
+        (3129, 'IA64_AR57', 0),
+        (3130, 'IA64_AR58', 0),
+        (3131, 'IA64_AR59', 0),
+        (3132, 'IA64_AR60', 0),
+        (3133, 'IA64_AR61', 0),
+        (3134, 'IA64_AR62', 0),
+        (3135, 'IA64_AR63', 0),
+        (3136, 'IA64_RsPFS', 0),
+        (3137, 'IA64_ApLC', 0),
+        (3138, 'IA64_ApEC', 0),
+        (3139, 'IA64_AR67', 0),
+        (3140, 'IA64_AR68', 0),
+        (3141, 'IA64_AR69', 0),
+        (3142, 'IA64_AR70', 0),
+        (3143, 'IA64_AR71', 0),
+        (3144, 'IA64_AR72', 0),
+        (3145, 'IA64_AR73', 0),
+        (3146, 'IA64_AR74', 0),
+        (3147, 'IA64_AR75', 0),
+        (3148, 'IA64_AR76', 0),
+        (3149, 'IA64_AR77', 0),
+        (3150, 'IA64_AR78', 0),
+        (3151, 'IA64_AR79', 0),
+        (3152, 'IA64_AR80', 0),
+        (3153, 'IA64_AR81', 0),
+        (3154, 'IA64_AR82', 0),
+        (3155, 'IA64_AR83', 0),
+        (3156, 'IA64_AR84', 0),
+        (3157, 'IA64_AR85', 0),
+        (3158, 'IA64_AR86', 0),
+        (3159, 'IA64_AR87', 0),
+        (3160, 'IA64_AR88', 0),
+        (3161, 'IA64_AR89', 0),
+        (3162, 'IA64_AR90', 0),
+        (3163, 'IA64_AR91', 0),
+        (3164, 'IA64_AR92', 0),
+        (3165, 'IA64_AR93', 0),
+        (3166, 'IA64_AR94', 0),
+        (3167, 'IA64_AR95', 0),
+        (3168, 'IA64_AR96', 0),
+        (3169, 'IA64_AR97', 0),
+        (3170, 'IA64_AR98', 0),
+        (3171, 'IA64_AR99', 0),
+        (3172, 'IA64_AR100', 0),
+        (3173, 'IA64_AR101', 0),
+        (3174, 'IA64_AR102', 0),
+        (3175, 'IA64_AR103', 0),
+        (3176, 'IA64_AR104', 0),
+        (3177, 'IA64_AR105', 0),
+        (3178, 'IA64_AR106', 0),
+        (3179, 'IA64_AR107', 0),
+        (3180, 'IA64_AR108', 0),
+        (3181, 'IA64_AR109', 0),
+        (3182, 'IA64_AR110', 0),
+        (3183, 'IA64_AR111', 0),
+        (3184, 'IA64_AR112', 0),
+        (3185, 'IA64_AR113', 0),
+        (3186, 'IA64_AR114', 0),
+        (3187, 'IA64_AR115', 0),
+        (3188, 'IA64_AR116', 0),
+        (3189, 'IA64_AR117', 0),
+        (3190, 'IA64_AR118', 0),
+        (3191, 'IA64_AR119', 0),
+        (3192, 'IA64_AR120', 0),
+        (3193, 'IA64_AR121', 0),
+        (3194, 'IA64_AR122', 0),
+        (3195, 'IA64_AR123', 0),
+        (3196, 'IA64_AR124', 0),
+        (3197, 'IA64_AR125', 0),
+        (3198, 'IA64_AR126', 0),
+        (3199, 'IA64_AR127', 0),
+        (3328, 'IA64_CPUID0', 0),
+        (3329, 'IA64_CPUID1', 0),
+        (3330, 'IA64_CPUID2', 0),
+        (3331, 'IA64_CPUID3', 0),
+        (3332, 'IA64_CPUID4', 0),
+        (4096, 'IA64_ApDCR', 0),
+        (4097, 'IA64_ApITM', 0),
+        (4098, 'IA64_ApIVA', 0),
+        (4099, 'IA64_CR3', 0),
+        (4100, 'IA64_CR4', 0),
+        (4101, 'IA64_CR5', 0),
+        (4102, 'IA64_CR6', 0),
+        (4103, 'IA64_CR7', 0),
+        (4104, 'IA64_ApPTA', 0),
+        (4105, 'IA64_ApGPTA', 0),
+        (4106, 'IA64_CR10', 0),
+        (4107, 'IA64_CR11', 0),
+        (4108, 'IA64_CR12', 0),
+        (4109, 'IA64_CR13', 0),
+        (4110, 'IA64_CR14', 0),
+        (4111, 'IA64_CR15', 0),
+        (4112, 'IA64_StIPSR', 0),
+        (4113, 'IA64_StISR', 0),
+        (4114, 'IA64_CR18', 0),
+        (4115, 'IA64_StIIP', 0),
+        (4116, 'IA64_StIFA', 0),
+        (4117, 'IA64_StITIR', 0),
+        (4118, 'IA64_StIIPA', 0),
+        (4119, 'IA64_StIFS', 0),
+        (4120, 'IA64_StIIM', 0),
+        (4121, 'IA64_StIHA', 0),
+        (4122, 'IA64_CR26', 0),
+        (4123, 'IA64_CR27', 0),
+        (4124, 'IA64_CR28', 0),
+        (4125, 'IA64_CR29', 0),
+        (4126, 'IA64_CR30', 0),
+        (4127, 'IA64_CR31', 0),
+        (4128, 'IA64_CR32', 0),
+        (4129, 'IA64_CR33', 0),
+        (4130, 'IA64_CR34', 0),
+        (4131, 'IA64_CR35', 0),
+        (4132, 'IA64_CR36', 0),
+        (4133, 'IA64_CR37', 0),
+        (4134, 'IA64_CR38', 0),
+        (4135, 'IA64_CR39', 0),
+        (4136, 'IA64_CR40', 0),
+        (4137, 'IA64_CR41', 0),
+        (4138, 'IA64_CR42', 0),
+        (4139, 'IA64_CR43', 0),
+        (4140, 'IA64_CR44', 0),
+        (4141, 'IA64_CR45', 0),
+        (4142, 'IA64_CR46', 0),
+        (4143, 'IA64_CR47', 0),
+        (4144, 'IA64_CR48', 0),
+        (4145, 'IA64_CR49', 0),
+        (4146, 'IA64_CR50', 0),
+        (4147, 'IA64_CR51', 0),
+        (4148, 'IA64_CR52', 0),
+        (4149, 'IA64_CR53', 0),
+        (4150, 'IA64_CR54', 0),
+        (4151, 'IA64_CR55', 0),
+        (4152, 'IA64_CR56', 0),
+        (4153, 'IA64_CR57', 0),
+        (4154, 'IA64_CR58', 0),
+        (4155, 'IA64_CR59', 0),
+        (4156, 'IA64_CR60', 0),
+        (4157, 'IA64_CR61', 0),
+        (4158, 'IA64_CR62', 0),
+        (4159, 'IA64_CR63', 0),
+        (4160, 'IA64_SaLID', 0),
+        (4161, 'IA64_SaIVR', 0),
+        (4162, 'IA64_SaTPR', 0),
+        (4163, 'IA64_SaEOI', 0),
+        (4164, 'IA64_SaIRR0', 0),
+        (4165, 'IA64_SaIRR1', 0),
+        (4166, 'IA64_SaIRR2', 0),
+        (4167, 'IA64_SaIRR3', 0),
+        (4168, 'IA64_SaITV', 0),
+        (4169, 'IA64_SaPMV', 0),
+        (4170, 'IA64_SaCMCV', 0),
+        (4171, 'IA64_CR75', 0),
+        (4172, 'IA64_CR76', 0),
+        (4173, 'IA64_CR77', 0),
+        (4174, 'IA64_CR78', 0),
+        (4175, 'IA64_CR79', 0),
+        (4176, 'IA64_SaLRR0', 0),
+        (4177, 'IA64_SaLRR1', 0),
+        (4178, 'IA64_CR82', 0),
+        (4179, 'IA64_CR83', 0),
+        (4180, 'IA64_CR84', 0),
+        (4181, 'IA64_CR85', 0),
+        (4182, 'IA64_CR86', 0),
+        (4183, 'IA64_CR87', 0),
+        (4184, 'IA64_CR88', 0),
+        (4185, 'IA64_CR89', 0),
+        (4186, 'IA64_CR90', 0),
+        (4187, 'IA64_CR91', 0),
+        (4188, 'IA64_CR92', 0),
+        (4189, 'IA64_CR93', 0),
+        (4190, 'IA64_CR94', 0),
+        (4191, 'IA64_CR95', 0),
+        (4192, 'IA64_CR96', 0),
+        (4193, 'IA64_CR97', 0),
+        (4194, 'IA64_CR98', 0),
+        (4195, 'IA64_CR99', 0),
+        (4196, 'IA64_CR100', 0),
+        (4197, 'IA64_CR101', 0),
+        (4198, 'IA64_CR102', 0),
+        (4199, 'IA64_CR103', 0),
+        (4200, 'IA64_CR104', 0),
+        (4201, 'IA64_CR105', 0),
+        (4202, 'IA64_CR106', 0),
+        (4203, 'IA64_CR107', 0),
+        (4204, 'IA64_CR108', 0),
+        (4205, 'IA64_CR109', 0),
+        (4206, 'IA64_CR110', 0),
+        (4207, 'IA64_CR111', 0),
+        (4208, 'IA64_CR112', 0),
+        (4209, 'IA64_CR113', 0),
+        (4210, 'IA64_CR114', 0),
+        (4211, 'IA64_CR115', 0),
+        (4212, 'IA64_CR116', 0),
+        (4213, 'IA64_CR117', 0),
+        (4214, 'IA64_CR118', 0),
+        (4215, 'IA64_CR119', 0),
+        (4216, 'IA64_CR120', 0),
+        (4217, 'IA64_CR121', 0),
+        (4218, 'IA64_CR122', 0),
+        (4219, 'IA64_CR123', 0),
+        (4220, 'IA64_CR124', 0),
+        (4221, 'IA64_CR125', 0),
+        (4222, 'IA64_CR126', 0),
+        (4223, 'IA64_CR127', 0),
+        (5120, 'IA64_Pkr0', 0),
+        (5121, 'IA64_Pkr1', 0),
+        (5122, 'IA64_Pkr2', 0),
+        (5123, 'IA64_Pkr3', 0),
+        (5124, 'IA64_Pkr4', 0),
+        (5125, 'IA64_Pkr5', 0),
+        (5126, 'IA64_Pkr6', 0),
+        (5127, 'IA64_Pkr7', 0),
+        (5128, 'IA64_Pkr8', 0),
+        (5129, 'IA64_Pkr9', 0),
+        (5130, 'IA64_Pkr10', 0),
+        (5131, 'IA64_Pkr11', 0),
+        (5132, 'IA64_Pkr12', 0),
+        (5133, 'IA64_Pkr13', 0),
+        (5134, 'IA64_Pkr14', 0),
+        (5135, 'IA64_Pkr15', 0),
+        (6144, 'IA64_Rr0', 0),
+        (6145, 'IA64_Rr1', 0),
+        (6146, 'IA64_Rr2', 0),
+        (6147, 'IA64_Rr3', 0),
+        (6148, 'IA64_Rr4', 0),
+        (6149, 'IA64_Rr5', 0),
+        (6150, 'IA64_Rr6', 0),
+        (6151, 'IA64_Rr7', 0),
+        (7168, 'IA64_PFD0', 0),
+        (7169, 'IA64_PFD1', 0),
+        (7170, 'IA64_PFD2', 0),
+        (7171, 'IA64_PFD3', 0),
+        (7172, 'IA64_PFD4', 0),
+        (7173, 'IA64_PFD5', 0),
+        (7174, 'IA64_PFD6', 0),
+        (7175, 'IA64_PFD7', 0),
+        (7176, 'IA64_PFD8', 0),
+        (7177, 'IA64_PFD9', 0),
+        (7178, 'IA64_PFD10', 0),
+        (7179, 'IA64_PFD11', 0),
+        (7180, 'IA64_PFD12', 0),
+        (7181, 'IA64_PFD13', 0),
+        (7182, 'IA64_PFD14', 0),
+        (7183, 'IA64_PFD15', 0),
+        (7184, 'IA64_PFD16', 0),
+        (7185, 'IA64_PFD17', 0),
+        (7424, 'IA64_PFC0', 0),
+        (7425, 'IA64_PFC1', 0),
+        (7426, 'IA64_PFC2', 0),
+        (7427, 'IA64_PFC3', 0),
+        (7428, 'IA64_PFC4', 0),
+        (7429, 'IA64_PFC5', 0),
+        (7430, 'IA64_PFC6', 0),
+        (7431, 'IA64_PFC7', 0),
+        (7432, 'IA64_PFC8', 0),
+        (7433, 'IA64_PFC9', 0),
+        (7434, 'IA64_PFC10', 0),
+        (7435, 'IA64_PFC11', 0),
+        (7436, 'IA64_PFC12', 0),
+        (7437, 'IA64_PFC13', 0),
+        (7438, 'IA64_PFC14', 0),
+        (7439, 'IA64_PFC15', 0),
+        (8192, 'IA64_TrI0', 0),
+        (8193, 'IA64_TrI1', 0),
+        (8194, 'IA64_TrI2', 0),
+        (8195, 'IA64_TrI3', 0),
+        (8196, 'IA64_TrI4', 0),
+        (8197, 'IA64_TrI5', 0),
+        (8198, 'IA64_TrI6', 0),
+        (8199, 'IA64_TrI7', 0),
+        (8320, 'IA64_TrD0', 0),
+        (8321, 'IA64_TrD1', 0),
+        (8322, 'IA64_TrD2', 0),
+        (8323, 'IA64_TrD3', 0),
+        (8324, 'IA64_TrD4', 0),
+        (8325, 'IA64_TrD5', 0),
+        (8326, 'IA64_TrD6', 0),
+        (8327, 'IA64_TrD7', 0),
+        (8448, 'IA64_DbI0', 0),
+        (8449, 'IA64_DbI1', 0),
+        (8450, 'IA64_DbI2', 0),
+        (8451, 'IA64_DbI3', 0),
+        (8452, 'IA64_DbI4', 0),
+        (8453, 'IA64_DbI5', 0),
+        (8454, 'IA64_DbI6', 0),
+        (8455, 'IA64_DbI7', 0),
+        (8576, 'IA64_DbD0', 0),
+        (8577, 'IA64_DbD1', 0),
+        (8578, 'IA64_DbD2', 0),
+        (8579, 'IA64_DbD3', 0),
+        (8580, 'IA64_DbD4', 0),
+        (8581, 'IA64_DbD5', 0),
+        (8582, 'IA64_DbD6', 0),
+        (8583, 'IA64_DbD7', 0),
+    ),
+    'AM33': (
+        (0, 'AM33_NOREG', 0),
+        (10, 'AM33_E0', 0),
+        (11, 'AM33_E1', 0),
+        (12, 'AM33_E2', 0),
+        (13, 'AM33_E3', 0),
+        (14, 'AM33_E4', 0),
+        (15, 'AM33_E5', 0),
+        (16, 'AM33_E6', 0),
+        (17, 'AM33_E7', 0),
+        (20, 'AM33_A0', 0),
+        (21, 'AM33_A1', 0),
+        (22, 'AM33_A2', 0),
+        (23, 'AM33_A3', 0),
+        (30, 'AM33_D0', 0),
+        (31, 'AM33_D1', 0),
+        (32, 'AM33_D2', 0),
+        (33, 'AM33_D3', 0),
+        (40, 'AM33_FS0', 0),
+        (41, 'AM33_FS1', 0),
+        (42, 'AM33_FS2', 0),
+        (43, 'AM33_FS3', 0),
+        (44, 'AM33_FS4', 0),
+        (45, 'AM33_FS5', 0),
+        (46, 'AM33_FS6', 0),
+        (47, 'AM33_FS7', 0),
+        (48, 'AM33_FS8', 0),
+        (49, 'AM33_FS9', 0),
+        (50, 'AM33_FS10', 0),
+        (51, 'AM33_FS11', 0),
+        (52, 'AM33_FS12', 0),
+        (53, 'AM33_FS13', 0),
+        (54, 'AM33_FS14', 0),
+        (55, 'AM33_FS15', 0),
+        (56, 'AM33_FS16', 0),
+        (57, 'AM33_FS17', 0),
+        (58, 'AM33_FS18', 0),
+        (59, 'AM33_FS19', 0),
+        (60, 'AM33_FS20', 0),
+        (61, 'AM33_FS21', 0),
+        (62, 'AM33_FS22', 0),
+        (63, 'AM33_FS23', 0),
+        (64, 'AM33_FS24', 0),
+        (65, 'AM33_FS25', 0),
+        (66, 'AM33_FS26', 0),
+        (67, 'AM33_FS27', 0),
+        (68, 'AM33_FS28', 0),
+        (69, 'AM33_FS29', 0),
+        (70, 'AM33_FS30', 0),
+        (71, 'AM33_FS31', 0),
+        (80, 'AM33_SP', 0),
+        (81, 'AM33_PC', 0),
+        (82, 'AM33_MDR', 0),
+        (83, 'AM33_MDRQ', 0),
+        (84, 'AM33_MCRH', 0),
+        (85, 'AM33_MCRL', 0),
+        (86, 'AM33_MCVF', 0),
+        (87, 'AM33_EPSW', 0),
+        (88, 'AM33_FPCR', 0),
+        (89, 'AM33_LIR', 0),
+        (90, 'AM33_LAR', 0),
+    ),
+    'M32R': (
+        (0, 'M32R_NOREG', 0),
+        (10, 'M32R_R0', 0),
+        (11, 'M32R_R1', 0),
+        (12, 'M32R_R2', 0),
+        (13, 'M32R_R3', 0),
+        (14, 'M32R_R4', 0),
+        (15, 'M32R_R5', 0),
+        (16, 'M32R_R6', 0),
+        (17, 'M32R_R7', 0),
+        (18, 'M32R_R8', 0),
+        (19, 'M32R_R9', 0),
+        (20, 'M32R_R10', 0),
+        (21, 'M32R_R11', 0),
+        (22, 'M32R_R12', 0),
+        (23, 'M32R_R13', 0),
+        (24, 'M32R_R14', 0),
+        (25, 'M32R_R15', 0),
+        (26, 'M32R_PSW', 0),
+        (27, 'M32R_CBR', 0),
+        (28, 'M32R_SPI', 0),
+        (29, 'M32R_SPU', 0),
+        (30, 'M32R_SPO', 0),
+        (31, 'M32R_BPC', 0),
+        (32, 'M32R_ACHI', 0),
+        (33, 'M32R_ACLO', 0),
+        (34, 'M32R_PC', 0),
+    ),
+    'TRICORE': (
+        (0, 'TRI_NOREG', 0),
+        (10, 'TRI_D0', 0),
+        (11, 'TRI_D1', 0),
+        (12, 'TRI_D2', 0),
+        (13, 'TRI_D3', 0),
+        (14, 'TRI_D4', 0),
+        (15, 'TRI_D5', 0),
+        (16, 'TRI_D6', 0),
+        (17, 'TRI_D7', 0),
+        (18, 'TRI_D8', 0),
+        (19, 'TRI_D9', 0),
+        (20, 'TRI_D10', 0),
+        (21, 'TRI_D11', 0),
+        (22, 'TRI_D12', 0),
+        (23, 'TRI_D13', 0),
+        (24, 'TRI_D14', 0),
+        (25, 'TRI_D15', 0),
+        (26, 'TRI_A0', 0),
+        (27, 'TRI_A1', 0),
+        (28, 'TRI_A2', 0),
+        (29, 'TRI_A3', 0),
+        (30, 'TRI_A4', 0),
+        (31, 'TRI_A5', 0),
+        (32, 'TRI_A6', 0),
+        (33, 'TRI_A7', 0),
+        (34, 'TRI_A8', 0),
+        (35, 'TRI_A9', 0),
+        (36, 'TRI_A10', 0),
+        (37, 'TRI_A11', 0),
+        (38, 'TRI_A12', 0),
+        (39, 'TRI_A13', 0),
+        (40, 'TRI_A14', 0),
+        (41, 'TRI_A15', 0),
+        (42, 'TRI_E0', 0),
+        (43, 'TRI_E2', 0),
+        (44, 'TRI_E4', 0),
+        (45, 'TRI_E6', 0),
+        (46, 'TRI_E8', 0),
+        (47, 'TRI_E10', 0),
+        (48, 'TRI_E12', 0),
+        (49, 'TRI_E14', 0),
+        (50, 'TRI_EA0', 0),
+        (51, 'TRI_EA2', 0),
+        (52, 'TRI_EA4', 0),
+        (53, 'TRI_EA6', 0),
+        (54, 'TRI_EA8', 0),
+        (55, 'TRI_EA10', 0),
+        (56, 'TRI_EA12', 0),
+        (57, 'TRI_EA14', 0),
+        (58, 'TRI_PSW', 0),
+        (59, 'TRI_PCXI', 0),
+        (60, 'TRI_PC', 0),
+        (61, 'TRI_FCX', 0),
+        (62, 'TRI_LCX', 0),
+        (63, 'TRI_ISP', 0),
+        (64, 'TRI_ICR', 0),
+        (65, 'TRI_BIV', 0),
+        (66, 'TRI_BTV', 0),
+        (67, 'TRI_SYSCON', 0),
+        (68, 'TRI_DPRx_0', 0),
+        (69, 'TRI_DPRx_1', 0),
+        (70, 'TRI_DPRx_2', 0),
+        (71, 'TRI_DPRx_3', 0),
+        (72, 'TRI_DBGSSR', 0),
+        (73, 'TRI_EXEVT', 0),
+        (74, 'TRI_SWEVT', 0),
+        (75, 'TRI_CREVT', 0),
+        (76, 'TRI_TRnEVT', 0),
+        (77, 'TRI_MMUCON', 0),
+        (78, 'TRI_ASI', 0),
+        (79, 'TRI_TVA', 0),
+        (80, 'TRI_TPA', 0),
+        (81, 'TRI_TPX', 0),
+        (82, 'TRI_TFA', 0),
+    ),
+    'AMD64': (
+        (1, 'AMD64_AL', 8),
+        (2, 'AMD64_CL', 8),
+        (3, 'AMD64_DL', 8),
+        (4, 'AMD64_BL', 8),
+        (5, 'AMD64_AH', 8),
+        (6, 'AMD64_CH', 8),
+        (7, 'AMD64_DH', 8),
+        (8, 'AMD64_BH', 8),
+        (9, 'AMD64_AX', 16),
+        (10, 'AMD64_CX', 16),
+        (11, 'AMD64_DX', 16),
+        (12, 'AMD64_BX', 16),
+        (13, 'AMD64_SP', 16),
+        (14, 'AMD64_BP', 16),
+        (15, 'AMD64_SI', 16),
+        (16, 'AMD64_DI', 16),
+        (17, 'AMD64_EAX', 32),
+        (18, 'AMD64_ECX', 32),
+        (19, 'AMD64_EDX', 32),
+        (20, 'AMD64_EBX', 32),
+        (21, 'AMD64_ESP', 32),
+        (22, 'AMD64_EBP', 32),
+        (23, 'AMD64_ESI', 32),
+        (24, 'AMD64_EDI', 32),
+        (25, 'AMD64_ES', 16),
+        (26, 'AMD64_CS', 16),
+        (27, 'AMD64_SS', 16),
+        (28, 'AMD64_DS', 16),
+        (29, 'AMD64_FS', 16),
+        (30, 'AMD64_GS', 16),
+        (32, 'AMD64_FLAGS', 16),
+        (33, 'AMD64_RIP', 64),
+        (34, 'AMD64_EFLAGS', 32),
+        (80, 'AMD64_CR0', 64),
+        (81, 'AMD64_CR1', 64),
+        (82, 'AMD64_CR2', 64),
+        (83, 'AMD64_CR3', 64),
+        (84, 'AMD64_CR4', 64),
+        (88, 'AMD64_CR8', 64),
+        (90, 'AMD64_DR0', 64),
+        (91, 'AMD64_DR1', 64),
+        (92, 'AMD64_DR2', 64),
+        (93, 'AMD64_DR3', 64),
+        (94, 'AMD64_DR4', 64),
+        (95, 'AMD64_DR5', 64),
+        (96, 'AMD64_DR6', 64),
+        (97, 'AMD64_DR7', 64),
+        (98, 'AMD64_DR8', 64),
+        (99, 'AMD64_DR9', 64),
+        (100, 'AMD64_DR10', 64),
+        (101, 'AMD64_DR11', 64),
+        (102, 'AMD64_DR12', 64),
+        (103, 'AMD64_DR13', 64),
+        (104, 'AMD64_DR14', 64),
+        (105, 'AMD64_DR15', 64),
+        (110, 'AMD64_GDTR', 64),
+        (111, 'AMD64_GDTL', 16),
+        (112, 'AMD64_IDTR', 64),
+        (113, 'AMD64_IDTL', 16),
+        (114, 'AMD64_LDTR', 16),
+        (115, 'AMD64_TR', 16),
+        (128, 'AMD64_ST0', 80),
+        (129, 'AMD64_ST1', 80),
+        (130, 'AMD64_ST2', 80),
+        (131, 'AMD64_ST3', 80),
+        (132, 'AMD64_ST4', 80),
+        (133, 'AMD64_ST5', 80),
+        (134, 'AMD64_ST6', 80),
+        (135, 'AMD64_ST7', 80),
+        (136, 'AMD64_CTRL', 16),
+        (137, 'AMD64_STAT', 16),
+        (138, 'AMD64_TAG', 16),
+        (139, 'AMD64_FPIP', 32),
+        (140, 'AMD64_FPCS', 16),
+        (141, 'AMD64_FPDO', 32),
+        (142, 'AMD64_FPDS', 16),
+        (143, 'AMD64_ISEM', 16),
+        (144, 'AMD64_FPEIP', 32),
+        (145, 'AMD64_FPEDO', 32),
+        (146, 'AMD64_MM0', 64),
+        (147, 'AMD64_MM1', 64),
+        (148, 'AMD64_MM2', 64),
+        (149, 'AMD64_MM3', 64),
+        (150, 'AMD64_MM4', 64),
+        (151, 'AMD64_MM5', 64),
+        (152, 'AMD64_MM6', 64),
+        (153, 'AMD64_MM7', 64),
+        (154, 'AMD64_XMM0', 128),
+        (155, 'AMD64_XMM1', 128),
+        (156, 'AMD64_XMM2', 128),
+        (157, 'AMD64_XMM3', 128),
+        (158, 'AMD64_XMM4', 128),
+        (159, 'AMD64_XMM5', 128),
+        (160, 'AMD64_XMM6', 128),
+        (161, 'AMD64_XMM7', 128),
+        (162, 'AMD64_XMM0_0', 32),
+        (163, 'AMD64_XMM0_1', 32),
+        (164, 'AMD64_XMM0_2', 32),
+        (165, 'AMD64_XMM0_3', 32),
+        (166, 'AMD64_XMM1_0', 32),
+        (167, 'AMD64_XMM1_1', 32),
+        (168, 'AMD64_XMM1_2', 32),
+        (169, 'AMD64_XMM1_3', 32),
+        (170, 'AMD64_XMM2_0', 32),
+        (171, 'AMD64_XMM2_1', 32),
+        (172, 'AMD64_XMM2_2', 32),
+        (173, 'AMD64_XMM2_3', 32),
+        (174, 'AMD64_XMM3_0', 32),
+        (175, 'AMD64_XMM3_1', 32),
+        (176, 'AMD64_XMM3_2', 32),
+        (177, 'AMD64_XMM3_3', 32),
+        (178, 'AMD64_XMM4_0', 32),
+        (179, 'AMD64_XMM4_1', 32),
+        (180, 'AMD64_XMM4_2', 32),
+        (181, 'AMD64_XMM4_3', 32),
+        (182, 'AMD64_XMM5_0', 32),
+        (183, 'AMD64_XMM5_1', 32),
+        (184, 'AMD64_XMM5_2', 32),
+        (185, 'AMD64_XMM5_3', 32),
+        (186, 'AMD64_XMM6_0', 32),
+        (187, 'AMD64_XMM6_1', 32),
+        (188, 'AMD64_XMM6_2', 32),
+        (189, 'AMD64_XMM6_3', 32),
+        (190, 'AMD64_XMM7_0', 32),
+        (191, 'AMD64_XMM7_1', 32),
+        (192, 'AMD64_XMM7_2', 32),
+        (193, 'AMD64_XMM7_3', 32),
+        (194, 'AMD64_XMM0L', 64),
+        (195, 'AMD64_XMM1L', 64),
+        (196, 'AMD64_XMM2L', 64),
+        (197, 'AMD64_XMM3L', 64),
+        (198, 'AMD64_XMM4L', 64),
+        (199, 'AMD64_XMM5L', 64),
+        (200, 'AMD64_XMM6L', 64),
+        (201, 'AMD64_XMM7L', 64),
+        (202, 'AMD64_XMM0H', 64),
+        (203, 'AMD64_XMM1H', 64),
+        (204, 'AMD64_XMM2H', 64),
+        (205, 'AMD64_XMM3H', 64),
+        (206, 'AMD64_XMM4H', 64),
+        (207, 'AMD64_XMM5H', 64),
+        (208, 'AMD64_XMM6H', 64),
+        (209, 'AMD64_XMM7H', 64),
+        (211, 'AMD64_MXCSR', 32),
+        (220, 'AMD64_EMM0L', 64),
+        (221, 'AMD64_EMM1L', 64),
+        (222, 'AMD64_EMM2L', 64),
+        (223, 'AMD64_EMM3L', 64),
+        (224, 'AMD64_EMM4L', 64),
+        (225, 'AMD64_EMM5L', 64),
+        (226, 'AMD64_EMM6L', 64),
+        (227, 'AMD64_EMM7L', 64),
+        (228, 'AMD64_EMM0H', 64),
+        (229, 'AMD64_EMM1H', 64),
+        (230, 'AMD64_EMM2H', 64),
+        (231, 'AMD64_EMM3H', 64),
+        (232, 'AMD64_EMM4H', 64),
+        (233, 'AMD64_EMM5H', 64),
+        (234, 'AMD64_EMM6H', 64),
+        (235, 'AMD64_EMM7H', 64),
+        (236, 'AMD64_MM00', 32),
+        (237, 'AMD64_MM01', 32),
+        (238, 'AMD64_MM10', 32),
+        (239, 'AMD64_MM11', 32),
+        (240, 'AMD64_MM20', 32),
+        (241, 'AMD64_MM21', 32),
+        (242, 'AMD64_MM30', 32),
+        (243, 'AMD64_MM31', 32),
+        (244, 'AMD64_MM40', 32),
+        (245, 'AMD64_MM41', 32),
+        (246, 'AMD64_MM50', 32),
+        (247, 'AMD64_MM51', 32),
+        (248, 'AMD64_MM60', 32),
+        (249, 'AMD64_MM61', 32),
+        (250, 'AMD64_MM70', 32),
+        (251, 'AMD64_MM71', 32),
+        (252, 'AMD64_XMM8', 128),
+        (253, 'AMD64_XMM9', 128),
+        (254, 'AMD64_XMM10', 128),
+        (255, 'AMD64_XMM11', 128),
+        (256, 'AMD64_XMM12', 128),
+        (257, 'AMD64_XMM13', 128),
+        (258, 'AMD64_XMM14', 128),
+        (259, 'AMD64_XMM15', 128),
+        (260, 'AMD64_XMM8_0', 32),
+        (261, 'AMD64_XMM8_1', 32),
+        (262, 'AMD64_XMM8_2', 32),
+        (263, 'AMD64_XMM8_3', 32),
+        (264, 'AMD64_XMM9_0', 32),
+        (265, 'AMD64_XMM9_1', 32),
+        (266, 'AMD64_XMM9_2', 32),
+        (267, 'AMD64_XMM9_3', 32),
+        (268, 'AMD64_XMM10_0', 32),
+        (269, 'AMD64_XMM10_1', 32),
+        (270, 'AMD64_XMM10_2', 32),
+        (271, 'AMD64_XMM10_3', 32),
+        (272, 'AMD64_XMM11_0', 32),
+        (273, 'AMD64_XMM11_1', 32),
+        (274, 'AMD64_XMM11_2', 32),
+        (275, 'AMD64_XMM11_3', 32),
+        (276, 'AMD64_XMM12_0', 32),
+        (277, 'AMD64_XMM12_1', 32),
+        (278, 'AMD64_XMM12_2', 32),
+        (279, 'AMD64_XMM12_3', 32),
+        (280, 'AMD64_XMM13_0', 32),
+        (281, 'AMD64_XMM13_1', 32),
+        (282, 'AMD64_XMM13_2', 32),
+        (283, 'AMD64_XMM13_3', 32),
+        (284, 'AMD64_XMM14_0', 32),
+        (285, 'AMD64_XMM14_1', 32),
+        (286, 'AMD64_XMM14_2', 32),
+        (287, 'AMD64_XMM14_3', 32),
+        (288, 'AMD64_XMM15_0', 32),
+        (289, 'AMD64_XMM15_1', 32),
+        (290, 'AMD64_XMM15_2', 32),
+        (291, 'AMD64_XMM15_3', 32),
+        (292, 'AMD64_XMM8L', 64),
+        (293, 'AMD64_XMM9L', 64),
+        (294, 'AMD64_XMM10L', 64),
+        (295, 'AMD64_XMM11L', 64),
+        (296, 'AMD64_XMM12L', 64),
+        (297, 'AMD64_XMM13L', 64),
+        (298, 'AMD64_XMM14L', 64),
+        (299, 'AMD64_XMM15L', 64),
+        (300, 'AMD64_XMM8H', 64),
+        (301, 'AMD64_XMM9H', 64),
+        (302, 'AMD64_XMM10H', 64),
+        (303, 'AMD64_XMM11H', 64),
+        (304, 'AMD64_XMM12H', 64),
+        (305, 'AMD64_XMM13H', 64),
+        (306, 'AMD64_XMM14H', 64),
+        (307, 'AMD64_XMM15H', 64),
+        (308, 'AMD64_EMM8L', 64),
+        (309, 'AMD64_EMM9L', 64),
+        (310, 'AMD64_EMM10L', 64),
+        (311, 'AMD64_EMM11L', 64),
+        (312, 'AMD64_EMM12L', 64),
+        (313, 'AMD64_EMM13L', 64),
+        (314, 'AMD64_EMM14L', 64),
+        (315, 'AMD64_EMM15L', 64),
+        (316, 'AMD64_EMM8H', 64),
+        (317, 'AMD64_EMM9H', 64),
+        (318, 'AMD64_EMM10H', 64),
+        (319, 'AMD64_EMM11H', 64),
+        (320, 'AMD64_EMM12H', 64),
+        (321, 'AMD64_EMM13H', 64),
+        (322, 'AMD64_EMM14H', 64),
+        (323, 'AMD64_EMM15H', 64),
+        (324, 'AMD64_SIL', 8),
+        (325, 'AMD64_DIL', 8),
+        (326, 'AMD64_BPL', 8),
+        (327, 'AMD64_SPL', 8),
+        (328, 'AMD64_RAX', 64),
+        (329, 'AMD64_RBX', 64),
+        (330, 'AMD64_RCX', 64),
+        (331, 'AMD64_RDX', 64),
+        (332, 'AMD64_RSI', 64),
+        (333, 'AMD64_RDI', 64),
+        (334, 'AMD64_RBP', 64),
+        (335, 'AMD64_RSP', 64),
+        (336, 'AMD64_R8', 64),
+        (337, 'AMD64_R9', 64),
+        (338, 'AMD64_R10', 64),
+        (339, 'AMD64_R11', 64),
+        (340, 'AMD64_R12', 64),
+        (341, 'AMD64_R13', 64),
+        (342, 'AMD64_R14', 64),
+        (343, 'AMD64_R15', 64),
+        (344, 'AMD64_R8B', 8),
+        (345, 'AMD64_R9B', 8),
+        (346, 'AMD64_R10B', 8),
+        (347, 'AMD64_R11B', 8),
+        (348, 'AMD64_R12B', 8),
+        (349, 'AMD64_R13B', 8),
+        (350, 'AMD64_R14B', 8),
+        (351, 'AMD64_R15B', 8),
+        (352, 'AMD64_R8W', 16),
+        (353, 'AMD64_R9W', 16),
+        (354, 'AMD64_R10W', 16),
+        (355, 'AMD64_R11W', 16),
+        (356, 'AMD64_R12W', 16),
+        (357, 'AMD64_R13W', 16),
+        (358, 'AMD64_R14W', 16),
+        (359, 'AMD64_R15W', 16),
+        (360, 'AMD64_R8D', 32),
+        (361, 'AMD64_R9D', 32),
+        (362, 'AMD64_R10D', 32),
+        (363, 'AMD64_R11D', 32),
+        (364, 'AMD64_R12D', 32),
+        (365, 'AMD64_R13D', 32),
+        (366, 'AMD64_R14D', 32),
+        (367, 'AMD64_R15D', 32),
+        (368, 'AMD64_YMM0', 256),
+        (369, 'AMD64_YMM1', 256),
+        (370, 'AMD64_YMM2', 256),
+        (371, 'AMD64_YMM3', 256),
+        (372, 'AMD64_YMM4', 256),
+        (373, 'AMD64_YMM5', 256),
+        (374, 'AMD64_YMM6', 256),
+        (375, 'AMD64_YMM7', 256),
+        (376, 'AMD64_YMM8', 256),
+        (377, 'AMD64_YMM9', 256),
+        (378, 'AMD64_YMM10', 256),
+        (379, 'AMD64_YMM11', 256),
+        (380, 'AMD64_YMM12', 256),
+        (381, 'AMD64_YMM13', 256),
+        (382, 'AMD64_YMM14', 256),
+        (383, 'AMD64_YMM15', 256),
+        (384, 'AMD64_YMM0H', 128),
+        (385, 'AMD64_YMM1H', 128),
+        (386, 'AMD64_YMM2H', 128),
+        (387, 'AMD64_YMM3H', 128),
+        (388, 'AMD64_YMM4H', 128),
+        (389, 'AMD64_YMM5H', 128),
+        (390, 'AMD64_YMM6H', 128),
+        (391, 'AMD64_YMM7H', 128),
+        (392, 'AMD64_YMM8H', 128),
+        (393, 'AMD64_YMM9H', 128),
+        (394, 'AMD64_YMM10H', 128),
+        (395, 'AMD64_YMM11H', 128),
+        (396, 'AMD64_YMM12H', 128),
+        (397, 'AMD64_YMM13H', 128),
+        (398, 'AMD64_YMM14H', 128),
+        (399, 'AMD64_YMM15H', 128),
+        (400, 'AMD64_XMM0IL', 64),
+        (401, 'AMD64_XMM1IL', 64),
+        (402, 'AMD64_XMM2IL', 64),
+        (403, 'AMD64_XMM3IL', 64),
+        (404, 'AMD64_XMM4IL', 64),
+        (405, 'AMD64_XMM5IL', 64),
+        (406, 'AMD64_XMM6IL', 64),
+        (407, 'AMD64_XMM7IL', 64),
+        (408, 'AMD64_XMM8IL', 64),
+        (409, 'AMD64_XMM9IL', 64),
+        (410, 'AMD64_XMM10IL', 64),
+        (411, 'AMD64_XMM11IL', 64),
+        (412, 'AMD64_XMM12IL', 64),
+        (413, 'AMD64_XMM13IL', 64),
+        (414, 'AMD64_XMM14IL', 64),
+        (415, 'AMD64_XMM15IL', 64),
+        (416, 'AMD64_XMM0IH', 64),
+        (417, 'AMD64_XMM1IH', 64),
+        (418, 'AMD64_XMM2IH', 64),
+        (419, 'AMD64_XMM3IH', 64),
+        (420, 'AMD64_XMM4IH', 64),
+        (421, 'AMD64_XMM5IH', 64),
+        (422, 'AMD64_XMM6IH', 64),
+        (423, 'AMD64_XMM7IH', 64),
+        (424, 'AMD64_XMM8IH', 64),
+        (425, 'AMD64_XMM9IH', 64),
+        (426, 'AMD64_XMM10IH', 64),
+        (427, 'AMD64_XMM11IH', 64),
+        (428, 'AMD64_XMM12IH', 64),
+        (429, 'AMD64_XMM13IH', 64),
+        (430, 'AMD64_XMM14IH', 64),
+        (431, 'AMD64_XMM15IH', 64),
+        (432, 'AMD64_YMM0I0', 64),
+        (433, 'AMD64_YMM0I1', 64),
+        (434, 'AMD64_YMM0I2', 64),
+        (435, 'AMD64_YMM0I3', 64),
+        (436, 'AMD64_YMM1I0', 64),
+        (437, 'AMD64_YMM1I1', 64),
+        (438, 'AMD64_YMM1I2', 64),
+        (439, 'AMD64_YMM1I3', 64),
+        (440, 'AMD64_YMM2I0', 64),
+        (441, 'AMD64_YMM2I1', 64),
+        (442, 'AMD64_YMM2I2', 64),
+        (443, 'AMD64_YMM2I3', 64),
+        (444, 'AMD64_YMM3I0', 64),
+        (445, 'AMD64_YMM3I1', 64),
+        (446, 'AMD64_YMM3I2', 64),
+        (447, 'AMD64_YMM3I3', 64),
+        (448, 'AMD64_YMM4I0', 64),
+        (449, 'AMD64_YMM4I1', 64),
+        (450, 'AMD64_YMM4I2', 64),
+        (451, 'AMD64_YMM4I3', 64),
+        (452, 'AMD64_YMM5I0', 64),
+        (453, 'AMD64_YMM5I1', 64),
+        (454, 'AMD64_YMM5I2', 64),
+        (455, 'AMD64_YMM5I3', 64),
+        (456, 'AMD64_YMM6I0', 64),
+        (457, 'AMD64_YMM6I1', 64),
+        (458, 'AMD64_YMM6I2', 64),
+        (459, 'AMD64_YMM6I3', 64),
+        (460, 'AMD64_YMM7I0', 64),
+        (461, 'AMD64_YMM7I1', 64),
+        (462, 'AMD64_YMM7I2', 64),
+        (463, 'AMD64_YMM7I3', 64),
+        (464, 'AMD64_YMM8I0', 64),
+        (465, 'AMD64_YMM8I1', 64),
+        (466, 'AMD64_YMM8I2', 64),
+        (467, 'AMD64_YMM8I3', 64),
+        (468, 'AMD64_YMM9I0', 64),
+        (469, 'AMD64_YMM9I1', 64),
+        (470, 'AMD64_YMM9I2', 64),
+        (471, 'AMD64_YMM9I3', 64),
+        (472, 'AMD64_YMM10I0', 64),
+        (473, 'AMD64_YMM10I1', 64),
+        (474, 'AMD64_YMM10I2', 64),
+        (475, 'AMD64_YMM10I3', 64),
+        (476, 'AMD64_YMM11I0', 64),
+        (477, 'AMD64_YMM11I1', 64),
+        (478, 'AMD64_YMM11I2', 64),
+        (479, 'AMD64_YMM11I3', 64),
+        (480, 'AMD64_YMM12I0', 64),
+        (481, 'AMD64_YMM12I1', 64),
+        (482, 'AMD64_YMM12I2', 64),
+        (483, 'AMD64_YMM12I3', 64),
+        (484, 'AMD64_YMM13I0', 64),
+        (485, 'AMD64_YMM13I1', 64),
+        (486, 'AMD64_YMM13I2', 64),
+        (487, 'AMD64_YMM13I3', 64),
+        (488, 'AMD64_YMM14I0', 64),
+        (489, 'AMD64_YMM14I1', 64),
+        (490, 'AMD64_YMM14I2', 64),
+        (491, 'AMD64_YMM14I3', 64),
+        (492, 'AMD64_YMM15I0', 64),
+        (493, 'AMD64_YMM15I1', 64),
+        (494, 'AMD64_YMM15I2', 64),
+        (495, 'AMD64_YMM15I3', 64),
+        (496, 'AMD64_YMM0F0', 32),
+        (497, 'AMD64_YMM0F1', 32),
+        (498, 'AMD64_YMM0F2', 32),
+        (499, 'AMD64_YMM0F3', 32),
+        (500, 'AMD64_YMM0F4', 32),
+        (501, 'AMD64_YMM0F5', 32),
+        (502, 'AMD64_YMM0F6', 32),
+        (503, 'AMD64_YMM0F7', 32),
+        (504, 'AMD64_YMM1F0', 32),
+        (505, 'AMD64_YMM1F1', 32),
+        (506, 'AMD64_YMM1F2', 32),
+        (507, 'AMD64_YMM1F3', 32),
+        (508, 'AMD64_YMM1F4', 32),
+        (509, 'AMD64_YMM1F5', 32),
+        (510, 'AMD64_YMM1F6', 32),
+        (511, 'AMD64_YMM1F7', 32),
+        (512, 'AMD64_YMM2F0', 32),
+        (513, 'AMD64_YMM2F1', 32),
+        (514, 'AMD64_YMM2F2', 32),
+        (515, 'AMD64_YMM2F3', 32),
+        (516, 'AMD64_YMM2F4', 32),
+        (517, 'AMD64_YMM2F5', 32),
+        (518, 'AMD64_YMM2F6', 32),
+        (519, 'AMD64_YMM2F7', 32),
+        (520, 'AMD64_YMM3F0', 32),
+        (521, 'AMD64_YMM3F1', 32),
+        (522, 'AMD64_YMM3F2', 32),
+        (523, 'AMD64_YMM3F3', 32),
+        (524, 'AMD64_YMM3F4', 32),
+        (525, 'AMD64_YMM3F5', 32),
+        (526, 'AMD64_YMM3F6', 32),
+        (527, 'AMD64_YMM3F7', 32),
+        (528, 'AMD64_YMM4F0', 32),
+        (529, 'AMD64_YMM4F1', 32),
+        (530, 'AMD64_YMM4F2', 32),
+        (531, 'AMD64_YMM4F3', 32),
+        (532, 'AMD64_YMM4F4', 32),
+        (533, 'AMD64_YMM4F5', 32),
+        (534, 'AMD64_YMM4F6', 32),
+        (535, 'AMD64_YMM4F7', 32),
+        (536, 'AMD64_YMM5F0', 32),
+        (537, 'AMD64_YMM5F1', 32),
+        (538, 'AMD64_YMM5F2', 32),
+        (539, 'AMD64_YMM5F3', 32),
+        (540, 'AMD64_YMM5F4', 32),
+        (541, 'AMD64_YMM5F5', 32),
+        (542, 'AMD64_YMM5F6', 32),
+        (543, 'AMD64_YMM5F7', 32),
+        (544, 'AMD64_YMM6F0', 32),
+        (545, 'AMD64_YMM6F1', 32),
+        (546, 'AMD64_YMM6F2', 32),
+        (547, 'AMD64_YMM6F3', 32),
+        (548, 'AMD64_YMM6F4', 32),
+        (549, 'AMD64_YMM6F5', 32),
+        (550, 'AMD64_YMM6F6', 32),
+        (551, 'AMD64_YMM6F7', 32),
+        (552, 'AMD64_YMM7F0', 32),
+        (553, 'AMD64_YMM7F1', 32),
+        (554, 'AMD64_YMM7F2', 32),
+        (555, 'AMD64_YMM7F3', 32),
+        (556, 'AMD64_YMM7F4', 32),
+        (557, 'AMD64_YMM7F5', 32),
+        (558, 'AMD64_YMM7F6', 32),
+        (559, 'AMD64_YMM7F7', 32),
+        (560, 'AMD64_YMM8F0', 32),
+        (561, 'AMD64_YMM8F1', 32),
+        (562, 'AMD64_YMM8F2', 32),
+        (563, 'AMD64_YMM8F3', 32),
+        (564, 'AMD64_YMM8F4', 32),
+        (565, 'AMD64_YMM8F5', 32),
+        (566, 'AMD64_YMM8F6', 32),
+        (567, 'AMD64_YMM8F7', 32),
+        (568, 'AMD64_YMM9F0', 32),
+        (569, 'AMD64_YMM9F1', 32),
+        (570, 'AMD64_YMM9F2', 32),
+        (571, 'AMD64_YMM9F3', 32),
+        (572, 'AMD64_YMM9F4', 32),
+        (573, 'AMD64_YMM9F5', 32),
+        (574, 'AMD64_YMM9F6', 32),
+        (575, 'AMD64_YMM9F7', 32),
+        (576, 'AMD64_YMM10F0', 32),
+        (577, 'AMD64_YMM10F1', 32),
+        (578, 'AMD64_YMM10F2', 32),
+        (579, 'AMD64_YMM10F3', 32),
+        (580, 'AMD64_YMM10F4', 32),
+        (581, 'AMD64_YMM10F5', 32),
+        (582, 'AMD64_YMM10F6', 32),
+        (583, 'AMD64_YMM10F7', 32),
+        (584, 'AMD64_YMM11F0', 32),
+        (585, 'AMD64_YMM11F1', 32),
+        (586, 'AMD64_YMM11F2', 32),
+        (587, 'AMD64_YMM11F3', 32),
+        (588, 'AMD64_YMM11F4', 32),
+        (589, 'AMD64_YMM11F5', 32),
+        (590, 'AMD64_YMM11F6', 32),
+        (591, 'AMD64_YMM11F7', 32),
+        (592, 'AMD64_YMM12F0', 32),
+        (593, 'AMD64_YMM12F1', 32),
+        (594, 'AMD64_YMM12F2', 32),
+        (595, 'AMD64_YMM12F3', 32),
+        (596, 'AMD64_YMM12F4', 32),
+        (597, 'AMD64_YMM12F5', 32),
+        (598, 'AMD64_YMM12F6', 32),
+        (599, 'AMD64_YMM12F7', 32),
+        (600, 'AMD64_YMM13F0', 32),
+        (601, 'AMD64_YMM13F1', 32),
+        (602, 'AMD64_YMM13F2', 32),
+        (603, 'AMD64_YMM13F3', 32),
+        (604, 'AMD64_YMM13F4', 32),
+        (605, 'AMD64_YMM13F5', 32),
+        (606, 'AMD64_YMM13F6', 32),
+        (607, 'AMD64_YMM13F7', 32),
+        (608, 'AMD64_YMM14F0', 32),
+        (609, 'AMD64_YMM14F1', 32),
+        (610, 'AMD64_YMM14F2', 32),
+        (611, 'AMD64_YMM14F3', 32),
+        (612, 'AMD64_YMM14F4', 32),
+        (613, 'AMD64_YMM14F5', 32),
+        (614, 'AMD64_YMM14F6', 32),
+        (615, 'AMD64_YMM14F7', 32),
+        (616, 'AMD64_YMM15F0', 32),
+        (617, 'AMD64_YMM15F1', 32),
+        (618, 'AMD64_YMM15F2', 32),
+        (619, 'AMD64_YMM15F3', 32),
+        (620, 'AMD64_YMM15F4', 32),
+        (621, 'AMD64_YMM15F5', 32),
+        (622, 'AMD64_YMM15F6', 32),
+        (623, 'AMD64_YMM15F7', 32),
+        (624, 'AMD64_YMM0D0', 64),
+        (625, 'AMD64_YMM0D1', 64),
+        (626, 'AMD64_YMM0D2', 64),
+        (627, 'AMD64_YMM0D3', 64),
+        (628, 'AMD64_YMM1D0', 64),
+        (629, 'AMD64_YMM1D1', 64),
+        (630, 'AMD64_YMM1D2', 64),
+        (631, 'AMD64_YMM1D3', 64),
+        (632, 'AMD64_YMM2D0', 64),
+        (633, 'AMD64_YMM2D1', 64),
+        (634, 'AMD64_YMM2D2', 64),
+        (635, 'AMD64_YMM2D3', 64),
+        (636, 'AMD64_YMM3D0', 64),
+        (637, 'AMD64_YMM3D1', 64),
+        (638, 'AMD64_YMM3D2', 64),
+        (639, 'AMD64_YMM3D3', 64),
+        (640, 'AMD64_YMM4D0', 64),
+        (641, 'AMD64_YMM4D1', 64),
+        (642, 'AMD64_YMM4D2', 64),
+        (643, 'AMD64_YMM4D3', 64),
+        (644, 'AMD64_YMM5D0', 64),
+        (645, 'AMD64_YMM5D1', 64),
+        (646, 'AMD64_YMM5D2', 64),
+        (647, 'AMD64_YMM5D3', 64),
+        (648, 'AMD64_YMM6D0', 64),
+        (649, 'AMD64_YMM6D1', 64),
+        (650, 'AMD64_YMM6D2', 64),
+        (651, 'AMD64_YMM6D3', 64),
+        (652, 'AMD64_YMM7D0', 64),
+        (653, 'AMD64_YMM7D1', 64),
+        (654, 'AMD64_YMM7D2', 64),
+        (655, 'AMD64_YMM7D3', 64),
+        (656, 'AMD64_YMM8D0', 64),
+        (657, 'AMD64_YMM8D1', 64),
+        (658, 'AMD64_YMM8D2', 64),
+        (659, 'AMD64_YMM8D3', 64),
+        (660, 'AMD64_YMM9D0', 64),
+        (661, 'AMD64_YMM9D1', 64),
+        (662, 'AMD64_YMM9D2', 64),
+        (663, 'AMD64_YMM9D3', 64),
+        (664, 'AMD64_YMM10D0', 64),
+        (665, 'AMD64_YMM10D1', 64),
+        (666, 'AMD64_YMM10D2', 64),
+        (667, 'AMD64_YMM10D3', 64),
+        (668, 'AMD64_YMM11D0', 64),
+        (669, 'AMD64_YMM11D1', 64),
+        (670, 'AMD64_YMM11D2', 64),
+        (671, 'AMD64_YMM11D3', 64),
+        (672, 'AMD64_YMM12D0', 64),
+        (673, 'AMD64_YMM12D1', 64),
+        (674, 'AMD64_YMM12D2', 64),
+        (675, 'AMD64_YMM12D3', 64),
+        (676, 'AMD64_YMM13D0', 64),
+        (677, 'AMD64_YMM13D1', 64),
+        (678, 'AMD64_YMM13D2', 64),
+        (679, 'AMD64_YMM13D3', 64),
+        (680, 'AMD64_YMM14D0', 64),
+        (681, 'AMD64_YMM14D1', 64),
+        (682, 'AMD64_YMM14D2', 64),
+        (683, 'AMD64_YMM14D3', 64),
+        (684, 'AMD64_YMM15D0', 64),
+        (685, 'AMD64_YMM15D1', 64),
+        (686, 'AMD64_YMM15D2', 64),
+        (687, 'AMD64_YMM15D3', 64),
+        (688, 'AMD64_BND0', 128),
+        (689, 'AMD64_BND1', 128),
+        (690, 'AMD64_BND2', 128),
+        (691, 'AMD64_BND3', 128),
+        (692, 'AMD64_BNDCFGU', 64),
+        (693, 'AMD64_BNDSTATUS', 64),
+        (694, 'AMD64_XMM16', 128),
+        (695, 'AMD64_XMM17', 128),
+        (696, 'AMD64_XMM18', 128),
+        (697, 'AMD64_XMM19', 128),
+        (698, 'AMD64_XMM20', 128),
+        (699, 'AMD64_XMM21', 128),
+        (700, 'AMD64_XMM22', 128),
+        (701, 'AMD64_XMM23', 128),
+        (702, 'AMD64_XMM24', 128),
+        (703, 'AMD64_XMM25', 128),
+        (704, 'AMD64_XMM26', 128),
+        (705, 'AMD64_XMM27', 128),
+        (706, 'AMD64_XMM28', 128),
+        (707, 'AMD64_XMM29', 128),
+        (708, 'AMD64_XMM30', 128),
+        (709, 'AMD64_XMM31', 128),
+        (710, 'AMD64_YMM16', 256),
+        (711, 'AMD64_YMM17', 256),
+        (712, 'AMD64_YMM18', 256),
+        (713, 'AMD64_YMM19', 256),
+        (714, 'AMD64_YMM20', 256),
+        (715, 'AMD64_YMM21', 256),
+        (716, 'AMD64_YMM22', 256),
+        (717, 'AMD64_YMM23', 256),
+        (718, 'AMD64_YMM24', 256),
+        (719, 'AMD64_YMM25', 256),
+        (720, 'AMD64_YMM26', 256),
+        (721, 'AMD64_YMM27', 256),
+        (722, 'AMD64_YMM28', 256),
+        (723, 'AMD64_YMM29', 256),
+        (724, 'AMD64_YMM30', 256),
+        (725, 'AMD64_YMM31', 256),
+        (726, 'AMD64_ZMM0', 512),
+        (727, 'AMD64_ZMM1', 512),
+        (728, 'AMD64_ZMM2', 512),
+        (729, 'AMD64_ZMM3', 512),
+        (730, 'AMD64_ZMM4', 512),
+        (731, 'AMD64_ZMM5', 512),
+        (732, 'AMD64_ZMM6', 512),
+        (733, 'AMD64_ZMM7', 512),
+        (734, 'AMD64_ZMM8', 512),
+        (735, 'AMD64_ZMM9', 512),
+        (736, 'AMD64_ZMM10', 512),
+        (737, 'AMD64_ZMM11', 512),
+        (738, 'AMD64_ZMM12', 512),
+        (739, 'AMD64_ZMM13', 512),
+        (740, 'AMD64_ZMM14', 512),
+        (741, 'AMD64_ZMM15', 512),
+        (742, 'AMD64_ZMM16', 512),
+        (743, 'AMD64_ZMM17', 512),
+        (744, 'AMD64_ZMM18', 512),
+        (745, 'AMD64_ZMM19', 512),
+        (746, 'AMD64_ZMM20', 512),
+        (747, 'AMD64_ZMM21', 512),
+        (748, 'AMD64_ZMM22', 512),
+        (749, 'AMD64_ZMM23', 512),
+        (750, 'AMD64_ZMM24', 512),
+        (751, 'AMD64_ZMM25', 512),
+        (752, 'AMD64_ZMM26', 512),
+        (753, 'AMD64_ZMM27', 512),
+        (754, 'AMD64_ZMM28', 512),
+        (755, 'AMD64_ZMM29', 512),
+        (756, 'AMD64_ZMM30', 512),
+        (757, 'AMD64_ZMM31', 512),
+        (758, 'AMD64_K0', 64),
+        (759, 'AMD64_K1', 64),
+        (760, 'AMD64_K2', 64),
+        (761, 'AMD64_K3', 64),
+        (762, 'AMD64_K4', 64),
+        (763, 'AMD64_K5', 64),
+        (764, 'AMD64_K6', 64),
+        (765, 'AMD64_K7', 64),
+        (766, 'AMD64_ZMM0H', 256),
+        (767, 'AMD64_ZMM1H', 256),
+        (768, 'AMD64_ZMM2H', 256),
+        (769, 'AMD64_ZMM3H', 256),
+        (770, 'AMD64_ZMM4H', 256),
+        (771, 'AMD64_ZMM5H', 256),
+        (772, 'AMD64_ZMM6H', 256),
+        (773, 'AMD64_ZMM7H', 256),
+        (774, 'AMD64_ZMM8H', 256),
+        (775, 'AMD64_ZMM9H', 256),
+        (776, 'AMD64_ZMM10H', 256),
+        (777, 'AMD64_ZMM11H', 256),
+        (778, 'AMD64_ZMM12H', 256),
+        (779, 'AMD64_ZMM13H', 256),
+        (780, 'AMD64_ZMM14H', 256),
+        (781, 'AMD64_ZMM15H', 256),
+        (782, 'AMD64_XMM16L', 64),
+        (783, 'AMD64_XMM17L', 64),
+        (784, 'AMD64_XMM18L', 64),
+        (785, 'AMD64_XMM19L', 64),
+        (786, 'AMD64_XMM20L', 64),
+        (787, 'AMD64_XMM21L', 64),
+        (788, 'AMD64_XMM22L', 64),
+        (789, 'AMD64_XMM23L', 64),
+        (790, 'AMD64_XMM24L', 64),
+        (791, 'AMD64_XMM25L', 64),
+        (792, 'AMD64_XMM26L', 64),
+        (793, 'AMD64_XMM27L', 64),
+        (794, 'AMD64_XMM28L', 64),
+        (795, 'AMD64_XMM29L', 64),
+        (796, 'AMD64_XMM30L', 64),
+        (797, 'AMD64_XMM31L', 64),
+        (798, 'AMD64_XMM16_0', 32),
+        (799, 'AMD64_XMM17_0', 32),
+        (800, 'AMD64_XMM18_0', 32),
+        (801, 'AMD64_XMM19_0', 32),
+        (802, 'AMD64_XMM20_0', 32),
+        (803, 'AMD64_XMM21_0', 32),
+        (804, 'AMD64_XMM22_0', 32),
+        (805, 'AMD64_XMM23_0', 32),
+        (806, 'AMD64_XMM24_0', 32),
+        (807, 'AMD64_XMM25_0', 32),
+        (808, 'AMD64_XMM26_0', 32),
+        (809, 'AMD64_XMM27_0', 32),
+        (810, 'AMD64_XMM28_0', 32),
+        (811, 'AMD64_XMM29_0', 32),
+        (812, 'AMD64_XMM30_0', 32),
+        (813, 'AMD64_XMM31_0', 32),
+        (814, 'AMD64_XMM16H', 64),
+        (815, 'AMD64_XMM17H', 64),
+        (816, 'AMD64_XMM18H', 64),
+        (817, 'AMD64_XMM19H', 64),
+        (818, 'AMD64_XMM20H', 64),
+        (819, 'AMD64_XMM21H', 64),
+        (820, 'AMD64_XMM22H', 64),
+        (821, 'AMD64_XMM23H', 64),
+        (822, 'AMD64_XMM24H', 64),
+        (823, 'AMD64_XMM25H', 64),
+        (824, 'AMD64_XMM26H', 64),
+        (825, 'AMD64_XMM27H', 64),
+        (826, 'AMD64_XMM28H', 64),
+        (827, 'AMD64_XMM29H', 64),
+        (828, 'AMD64_XMM30H', 64),
+        (829, 'AMD64_XMM31H', 64),
+        (830, 'AMD64_EMM16H', 64),
+        (831, 'AMD64_EMM17H', 64),
+        (832, 'AMD64_EMM18H', 64),
+        (833, 'AMD64_EMM19H', 64),
+        (834, 'AMD64_EMM20H', 64),
+        (835, 'AMD64_EMM21H', 64),
+        (836, 'AMD64_EMM22H', 64),
+        (837, 'AMD64_EMM23H', 64),
+        (838, 'AMD64_EMM24H', 64),
+        (839, 'AMD64_EMM25H', 64),
+        (840, 'AMD64_EMM26H', 64),
+        (841, 'AMD64_EMM27H', 64),
+        (842, 'AMD64_EMM28H', 64),
+        (843, 'AMD64_EMM29H', 64),
+        (844, 'AMD64_EMM30H', 64),
+        (845, 'AMD64_EMM31H', 64),
+        (846, 'AMD64_SSP', 32),
+        (847, 'AMD64_TMM0', 8192),
+        (848, 'AMD64_TMM1', 8192),
+        (849, 'AMD64_TMM2', 8192),
+        (850, 'AMD64_TMM3', 8192),
+        (851, 'AMD64_TMM4', 8192),
+        (852, 'AMD64_TMM5', 8192),
+        (853, 'AMD64_TMM6', 8192),
+        (854, 'AMD64_TMM7', 8192),
+    ),
+    'ARM64': (
+        (0, 'ARM64_NOREG', 0),
+        (10, 'ARM64_W0', 32),
+        (11, 'ARM64_W1', 32),
+        (12, 'ARM64_W2', 32),
+        (13, 'ARM64_W3', 32),
+        (14, 'ARM64_W4', 32),
+        (15, 'ARM64_W5', 32),
+        (16, 'ARM64_W6', 32),
+        (17, 'ARM64_W7', 32),
+        (18, 'ARM64_W8', 32),
+        (19, 'ARM64_W9', 32),
+        (20, 'ARM64_W10', 32),
+        (21, 'ARM64_W11', 32),
+        (22, 'ARM64_W12', 32),
+        (23, 'ARM64_W13', 32),
+        (24, 'ARM64_W14', 32),
+        (25, 'ARM64_W15', 32),
+        (26, 'ARM64_W16', 32),
+        (27, 'ARM64_W17', 32),
+        (28, 'ARM64_W18', 32),
+        (29, 'ARM64_W19', 32),
+        (30, 'ARM64_W20', 32),
+        (31, 'ARM64_W21', 32),
+        (32, 'ARM64_W22', 32),
+        (33, 'ARM64_W23', 32),
+        (34, 'ARM64_W24', 32),
+        (35, 'ARM64_W25', 32),
+        (36, 'ARM64_W26', 32),
+        (37, 'ARM64_W27', 32),
+        (38, 'ARM64_W28', 32),
+        (39, 'ARM64_W29', 32),
+        (40, 'ARM64_W30', 32),
+        (41, 'ARM64_WZR', 32),
+        (50, 'ARM64_X0', 64),
+        (51, 'ARM64_X1', 64),
+        (52, 'ARM64_X2', 64),
+        (53, 'ARM64_X3', 64),
+        (54, 'ARM64_X4', 64),
+        (55, 'ARM64_X5', 64),
+        (56, 'ARM64_X6', 64),
+        (57, 'ARM64_X7', 64),
+        (58, 'ARM64_X8', 64),
+        (59, 'ARM64_X9', 64),
+        (60, 'ARM64_X10', 64),
+        (61, 'ARM64_X11', 64),
+        (62, 'ARM64_X12', 64),
+        (63, 'ARM64_X13', 64),
+        (64, 'ARM64_X14', 64),
+        (65, 'ARM64_X15', 64),
+        (66, 'ARM64_IP0', 64),
+        (67, 'ARM64_IP1', 64),
+        (68, 'ARM64_X18', 64),
+        (69, 'ARM64_X19', 64),
+        (70, 'ARM64_X20', 64),
+        (71, 'ARM64_X21', 64),
+        (72, 'ARM64_X22', 64),
+        (73, 'ARM64_X23', 64),
+        (74, 'ARM64_X24', 64),
+        (75, 'ARM64_X25', 64),
+        (76, 'ARM64_X26', 64),
+        (77, 'ARM64_X27', 64),
+        (78, 'ARM64_X28', 64),
+        (79, 'ARM64_FP', 64),
+        (80, 'ARM64_LR', 64),
+        (81, 'ARM64_SP', 64),
+        (82, 'ARM64_ZR', 64),
+        (83, 'ARM64_PC', 64),
+        (90, 'ARM64_NZCV', 32),
+        (91, 'ARM64_CPSR', 32),
+        (100, 'ARM64_S0', 32),
+        (101, 'ARM64_S1', 32),
+        (102, 'ARM64_S2', 32),
+        (103, 'ARM64_S3', 32),
+        (104, 'ARM64_S4', 32),
+        (105, 'ARM64_S5', 32),
+        (106, 'ARM64_S6', 32),
+        (107, 'ARM64_S7', 32),
+        (108, 'ARM64_S8', 32),
+        (109, 'ARM64_S9', 32),
+        (110, 'ARM64_S10', 32),
+        (111, 'ARM64_S11', 32),
+        (112, 'ARM64_S12', 32),
+        (113, 'ARM64_S13', 32),
+        (114, 'ARM64_S14', 32),
+        (115, 'ARM64_S15', 32),
+        (116, 'ARM64_S16', 32),
+        (117, 'ARM64_S17', 32),
+        (118, 'ARM64_S18', 32),
+        (119, 'ARM64_S19', 32),
+        (120, 'ARM64_S20', 32),
+        (121, 'ARM64_S21', 32),
+        (122, 'ARM64_S22', 32),
+        (123, 'ARM64_S23', 32),
+        (124, 'ARM64_S24', 32),
+        (125, 'ARM64_S25', 32),
+        (126, 'ARM64_S26', 32),
+        (127, 'ARM64_S27', 32),
+        (128, 'ARM64_S28', 32),
+        (129, 'ARM64_S29', 32),
+        (130, 'ARM64_S30', 32),
+        (131, 'ARM64_S31', 32),
+        (140, 'ARM64_D0', 64),
+        (141, 'ARM64_D1', 64),
+        (142, 'ARM64_D2', 64),
+        (143, 'ARM64_D3', 64),
+        (144, 'ARM64_D4', 64),
+        (145, 'ARM64_D5', 64),
+        (146, 'ARM64_D6', 64),
+        (147, 'ARM64_D7', 64),
+        (148, 'ARM64_D8', 64),
+        (149, 'ARM64_D9', 64),
+        (150, 'ARM64_D10', 64),
+        (151, 'ARM64_D11', 64),
+        (152, 'ARM64_D12', 64),
+        (153, 'ARM64_D13', 64),
+        (154, 'ARM64_D14', 64),
+        (155, 'ARM64_D15', 64),
+        (156, 'ARM64_D16', 64),
+        (157, 'ARM64_D17', 64),
+        (158, 'ARM64_D18', 64),
+        (159, 'ARM64_D19', 64),
+        (160, 'ARM64_D20', 64),
+        (161, 'ARM64_D21', 64),
+        (162, 'ARM64_D22', 64),
+        (163, 'ARM64_D23', 64),
+        (164, 'ARM64_D24', 64),
+        (165, 'ARM64_D25', 64),
+        (166, 'ARM64_D26', 64),
+        (167, 'ARM64_D27', 64),
+        (168, 'ARM64_D28', 64),
+        (169, 'ARM64_D29', 64),
+        (170, 'ARM64_D30', 64),
+        (171, 'ARM64_D31', 64),
+        (180, 'ARM64_Q0', 128),
+        (181, 'ARM64_Q1', 128),
+        (182, 'ARM64_Q2', 128),
+        (183, 'ARM64_Q3', 128),
+        (184, 'ARM64_Q4', 128),
+        (185, 'ARM64_Q5', 128),
+        (186, 'ARM64_Q6', 128),
+        (187, 'ARM64_Q7', 128),
+        (188, 'ARM64_Q8', 128),
+        (189, 'ARM64_Q9', 128),
+        (190, 'ARM64_Q10', 128),
+        (191, 'ARM64_Q11', 128),
+        (192, 'ARM64_Q12', 128),
+        (193, 'ARM64_Q13', 128),
+        (194, 'ARM64_Q14', 128),
+        (195, 'ARM64_Q15', 128),
+        (196, 'ARM64_Q16', 128),
+        (197, 'ARM64_Q17', 128),
+        (198, 'ARM64_Q18', 128),
+        (199, 'ARM64_Q19', 128),
+        (200, 'ARM64_Q20', 128),
+        (201, 'ARM64_Q21', 128),
+        (202, 'ARM64_Q22', 128),
+        (203, 'ARM64_Q23', 128),
+        (204, 'ARM64_Q24', 128),
+        (205, 'ARM64_Q25', 128),
+        (206, 'ARM64_Q26', 128),
+        (207, 'ARM64_Q27', 128),
+        (208, 'ARM64_Q28', 128),
+        (209, 'ARM64_Q29', 128),
+        (210, 'ARM64_Q30', 128),
+        (211, 'ARM64_Q31', 128),
+        (220, 'ARM64_FPSR', 32),
+        (221, 'ARM64_FPCR', 32),
+        (230, 'ARM64_B0', 8),
+        (231, 'ARM64_B1', 8),
+        (232, 'ARM64_B2', 8),
+        (233, 'ARM64_B3', 8),
+        (234, 'ARM64_B4', 8),
+        (235, 'ARM64_B5', 8),
+        (236, 'ARM64_B6', 8),
+        (237, 'ARM64_B7', 8),
+        (238, 'ARM64_B8', 8),
+        (239, 'ARM64_B9', 8),
+        (240, 'ARM64_B10', 8),
+        (241, 'ARM64_B11', 8),
+        (242, 'ARM64_B12', 8),
+        (243, 'ARM64_B13', 8),
+        (244, 'ARM64_B14', 8),
+        (245, 'ARM64_B15', 8),
+        (246, 'ARM64_B16', 8),
+        (247, 'ARM64_B17', 8),
+        (248, 'ARM64_B18', 8),
+        (249, 'ARM64_B19', 8),
+        (250, 'ARM64_B20', 8),
+        (251, 'ARM64_B21', 8),
+        (252, 'ARM64_B22', 8),
+        (253, 'ARM64_B23', 8),
+        (254, 'ARM64_B24', 8),
+        (255, 'ARM64_B25', 8),
+        (256, 'ARM64_B26', 8),
+        (257, 'ARM64_B27', 8),
+        (258, 'ARM64_B28', 8),
+        (259, 'ARM64_B29', 8),
+        (260, 'ARM64_B30', 8),
+        (261, 'ARM64_B31', 8),
+        (270, 'ARM64_H0', 16),
+        (271, 'ARM64_H1', 16),
+        (272, 'ARM64_H2', 16),
+        (273, 'ARM64_H3', 16),
+        (274, 'ARM64_H4', 16),
+        (275, 'ARM64_H5', 16),
+        (276, 'ARM64_H6', 16),
+        (277, 'ARM64_H7', 16),
+        (278, 'ARM64_H8', 16),
+        (279, 'ARM64_H9', 16),
+        (280, 'ARM64_H10', 16),
+        (281, 'ARM64_H11', 16),
+        (282, 'ARM64_H12', 16),
+        (283, 'ARM64_H13', 16),
+        (284, 'ARM64_H14', 16),
+        (285, 'ARM64_H15', 16),
+        (286, 'ARM64_H16', 16),
+        (287, 'ARM64_H17', 16),
+        (288, 'ARM64_H18', 16),
+        (289, 'ARM64_H19', 16),
+        (290, 'ARM64_H20', 16),
+        (291, 'ARM64_H21', 16),
+        (292, 'ARM64_H22', 16),
+        (293, 'ARM64_H23', 16),
+        (294, 'ARM64_H24', 16),
+        (295, 'ARM64_H25', 16),
+        (296, 'ARM64_H26', 16),
+        (297, 'ARM64_H27', 16),
+        (298, 'ARM64_H28', 16),
+        (299, 'ARM64_H29', 16),
+        (300, 'ARM64_H30', 16),
+        (301, 'ARM64_H31', 16),
+        (310, 'ARM64_V0', 128),
+        (311, 'ARM64_V1', 128),
+        (312, 'ARM64_V2', 128),
+        (313, 'ARM64_V3', 128),
+        (314, 'ARM64_V4', 128),
+        (315, 'ARM64_V5', 128),
+        (316, 'ARM64_V6', 128),
+        (317, 'ARM64_V7', 128),
+        (318, 'ARM64_V8', 128),
+        (319, 'ARM64_V9', 128),
+        (320, 'ARM64_V10', 128),
+        (321, 'ARM64_V11', 128),
+        (322, 'ARM64_V12', 128),
+        (323, 'ARM64_V13', 128),
+        (324, 'ARM64_V14', 128),
+        (325, 'ARM64_V15', 128),
+        (326, 'ARM64_V16', 128),
+        (327, 'ARM64_V17', 128),
+        (328, 'ARM64_V18', 128),
+        (329, 'ARM64_V19', 128),
+        (330, 'ARM64_V20', 128),
+        (331, 'ARM64_V21', 128),
+        (332, 'ARM64_V22', 128),
+        (333, 'ARM64_V23', 128),
+        (334, 'ARM64_V24', 128),
+        (335, 'ARM64_V25', 128),
+        (336, 'ARM64_V26', 128),
+        (337, 'ARM64_V27', 128),
+        (338, 'ARM64_V28', 128),
+        (339, 'ARM64_V29', 128),
+        (340, 'ARM64_V30', 128),
+        (341, 'ARM64_V31', 128),
+        (350, 'ARM64_Q0H', 64),
+        (351, 'ARM64_Q1H', 64),
+        (352, 'ARM64_Q2H', 64),
+        (353, 'ARM64_Q3H', 64),
+        (354, 'ARM64_Q4H', 64),
+        (355, 'ARM64_Q5H', 64),
+        (356, 'ARM64_Q6H', 64),
+        (357, 'ARM64_Q7H', 64),
+        (358, 'ARM64_Q8H', 64),
+        (359, 'ARM64_Q9H', 64),
+        (360, 'ARM64_Q10H', 64),
+        (361, 'ARM64_Q11H', 64),
+        (362, 'ARM64_Q12H', 64),
+        (363, 'ARM64_Q13H', 64),
+        (364, 'ARM64_Q14H', 64),
+        (365, 'ARM64_Q15H', 64),
+        (366, 'ARM64_Q16H', 64),
+        (367, 'ARM64_Q17H', 64),
+        (368, 'ARM64_Q18H', 64),
+        (369, 'ARM64_Q19H', 64),
+        (370, 'ARM64_Q20H', 64),
+        (371, 'ARM64_Q21H', 64),
+        (372, 'ARM64_Q22H', 64),
+        (373, 'ARM64_Q23H', 64),
+        (374, 'ARM64_Q24H', 64),
+        (375, 'ARM64_Q25H', 64),
+        (376, 'ARM64_Q26H', 64),
+        (377, 'ARM64_Q27H', 64),
+        (378, 'ARM64_Q28H', 64),
+        (379, 'ARM64_Q29H', 64),
+        (380, 'ARM64_Q30H', 64),
+        (381, 'ARM64_Q31H', 64),
+    ),
+}
+
+
+ALLREG = (
+    (30000, 'ALLREG_ERR', 0),
+    (30001, 'ALLREG_TEB', 0),
+    (30002, 'ALLREG_TIMER', 0),
+    (30003, 'ALLREG_EFAD1', 0),
+    (30004, 'ALLREG_EFAD2', 0),
+    (30005, 'ALLREG_EFAD3', 0),
+    (30006, 'ALLREG_VFRAME', 0),
+    (30007, 'ALLREG_HANDLE', 0),
+    (30008, 'ALLREG_PARAMS', 0),
+    (30009, 'ALLREG_LOCALS', 0),
+    (30010, 'ALLREG_TID', 0),
+    (30011, 'ALLREG_ENV', 0),
+    (30012, 'ALLREG_CMDLN', 0),
+)
@@ -0,0 +1,775 @@
+"""
+Record layouts and enums from ``cvinfo.h``, generated by ``scripts/generate_cvconst.py``.
+
+Each record has a precompiled :class:`struct.Struct` ``<NAME>`` of its fixed size part, a
+``<NAME>_FIELDS`` tuple of the field names matching ``<NAME>.unpack_from()``, and for records with
+bitfields a ``<NAME>_BITS`` dict of bitfield name -> ``(field index, shift, width)``. Structs of
+bitfields (e.g. ``CV_prop_t``) and unions are kept as a single integer field.
+"""
+
+from enum import IntEnum, auto
+from struct import Struct
+
+
+class LeafKind(IntEnum):
+    LF_MODIFIER_16t = 0x0001
+    LF_POINTER_16t = 0x0002
+    LF_ARRAY_16t = 0x0003
+    LF_CLASS_16t = 0x0004
+    LF_STRUCTURE_16t = 0x0005
+    LF_UNION_16t = 0x0006
+    LF_ENUM_16t = 0x0007
+    LF_PROCEDURE_16t = 0x0008
+    LF_MFUNCTION_16t = 0x0009
+    LF_VTSHAPE = 0x000a
+    LF_COBOL0_16t = 0x000b
+    LF_COBOL1 = 0x000c
+    LF_BARRAY_16t = 0x000d
+    LF_LABEL = 0x000e
+    LF_NULL = 0x000f
+    LF_NOTTRAN = 0x0010
+    LF_DIMARRAY_16t = 0x0011
+    LF_VFTPATH_16t = 0x0012
+    LF_PRECOMP_16t = 0x0013
+    LF_ENDPRECOMP = 0x0014
+    LF_OEM_16t = 0x0015
+    LF_TYPESERVER_ST = 0x0016
+    LF_SKIP_16t = 0x0200
+    LF_ARGLIST_16t = 0x0201
+    LF_DEFARG_16t = 0x0202
+    LF_LIST = 0x0203
+    LF_FIELDLIST_16t = 0x0204
+    LF_DERIVED_16t = 0x0205
+    LF_BITFIELD_16t = 0x0206
+    LF_METHODLIST_16t = 0x0207
+    LF_DIMCONU_16t = 0x0208
+    LF_DIMCONLU_16t = 0x0209
+    LF_DIMVARU_16t = 0x020a
+    LF_DIMVARLU_16t = 0x020b
+    LF_REFSYM = 0x020c
+    LF_BCLASS_16t = 0x0400
+    LF_VBCLASS_16t = 0x0401
+    LF_IVBCLASS_16t = 0x0402
+    LF_ENUMERATE_ST = 0x0403
+    LF_FRIENDFCN_16t = 0x0404
+    LF_INDEX_16t = 0x0405
+    LF_MEMBER_16t = 0x0406
+    LF_STMEMBER_16t = 0x0407
+    LF_METHOD_16t = 0x0408
+    LF_NESTTYPE_16t = 0x0409
+    LF_VFUNCTAB_16t = 0x040a
+    LF_FRIENDCLS_16t = 0x040b
+    LF_ONEMETHOD_16t = 0x040c
+    LF_VFUNCOFF_16t = 0x040d
+    LF_TI16_MAX = 0x1000
+    LF_MODIFIER = 0x1001
+    LF_POINTER = 0x1002
+    LF_ARRAY_ST = 0x1003
+    LF_CLASS_ST = 0x1004
+    LF_STRUCTURE_ST = 0x1005
+    LF_UNION_ST = 0x1006
+    LF_ENUM_ST = 0x1007
+    LF_PROCEDURE = 0x1008
+    LF_MFUNCTION = 0x1009
+    LF_COBOL0 = 0x100a
+    LF_BARRAY = 0x100b
+    LF_DIMARRAY_ST = 0x100c
+    LF_VFTPATH = 0x100d
+    LF_PRECOMP_ST = 0x100e
+    LF_OEM = 0x100f
+    LF_ALIAS_ST = 0x1010
+    LF_OEM2 = 0x1011
+    LF_SKIP = 0x1200
+    LF_ARGLIST = 0x1201
+    LF_DEFARG_ST = 0x1202
+    LF_FIELDLIST = 0x1203
+    LF_DERIVED = 0x1204
+    LF_BITFIELD = 0x1205
+    LF_METHODLIST = 0x1206
+    LF_DIMCONU = 0x1207
+    LF_DIMCONLU = 0x1208
+    LF_DIMVARU = 0x1209
+    LF_DIMVARLU = 0x120a
+    LF_BCLASS = 0x1400
+    LF_VBCLASS = 0x1401
+    LF_IVBCLASS = 0x1402
+    LF_FRIENDFCN_ST = 0x1403
+    LF_INDEX = 0x1404
+    LF_MEMBER_ST = 0x1405
+    LF_STMEMBER_ST = 0x1406
+    LF_METHOD_ST = 0x1407
+    LF_NESTTYPE_ST = 0x1408
+    LF_VFUNCTAB = 0x1409
+    LF_FRIENDCLS = 0x140a
+    LF_ONEMETHOD_ST = 0x140b
+    LF_VFUNCOFF = 0x140c
+    LF_NESTTYPEEX_ST = 0x140d
+    LF_MEMBERMODIFY_ST = 0x140e
+    LF_MANAGED_ST = 0x140f
+    LF_ST_MAX = 0x1500
+    LF_TYPESERVER = 0x1501
+    LF_ENUMERATE = 0x1502
+    LF_ARRAY = 0x1503
+    LF_CLASS = 0x1504
+    LF_STRUCTURE = 0x1505
+    LF_UNION = 0x1506
+    LF_ENUM = 0x1507
+    LF_DIMARRAY = 0x1508
+    LF_PRECOMP = 0x1509
+    LF_ALIAS = 0x150a
+    LF_DEFARG = 0x150b
+    LF_FRIENDFCN = 0x150c
+    LF_MEMBER = 0x150d
+    LF_STMEMBER = 0x150e
+    LF_METHOD = 0x150f
+    LF_NESTTYPE = 0x1510
+    LF_ONEMETHOD = 0x1511
+    LF_NESTTYPEEX = 0x1512
+    LF_MEMBERMODIFY = 0x1513
+    LF_MANAGED = 0x1514
+    LF_TYPESERVER2 = 0x1515
+    LF_STRIDED_ARRAY = 0x1516
+    LF_HLSL = 0x1517
+    LF_MODIFIER_EX = 0x1518
+    LF_INTERFACE = 0x1519
+    LF_BINTERFACE = 0x151a
+    LF_VECTOR = 0x151b
+    LF_MATRIX = 0x151c
+    LF_VFTABLE = 0x151d
+    LF_ENDOFLEAFRECORD = LF_VFTABLE
+    LF_TYPE_LAST = auto()
+    LF_TYPE_MAX = LF_TYPE_LAST - 1
+    LF_FUNC_ID = 0x1601
+    LF_MFUNC_ID = 0x1602
+    LF_BUILDINFO = 0x1603
+    LF_SUBSTR_LIST = 0x1604
+    LF_STRING_ID = 0x1605
+    LF_UDT_SRC_LINE = 0x1606
+    LF_UDT_MOD_SRC_LINE = 0x1607
+    LF_ID_LAST = auto()
+    LF_ID_MAX = LF_ID_LAST - 1
+    LF_NUMERIC = 0x8000
+    LF_CHAR = 0x8000
+    LF_SHORT = 0x8001
+    LF_USHORT = 0x8002
+    LF_LONG = 0x8003
+    LF_ULONG = 0x8004
+    LF_REAL32 = 0x8005
+    LF_REAL64 = 0x8006
+    LF_REAL80 = 0x8007
+    LF_REAL128 = 0x8008
+    LF_QUADWORD = 0x8009
+    LF_UQUADWORD = 0x800a
+    LF_REAL48 = 0x800b
+    LF_COMPLEX32 = 0x800c
+    LF_COMPLEX64 = 0x800d
+    LF_COMPLEX80 = 0x800e
+    LF_COMPLEX128 = 0x800f
+    LF_VARSTRING = 0x8010
+    LF_OCTWORD = 0x8017
+    LF_UOCTWORD = 0x8018
+    LF_DECIMAL = 0x8019
+    LF_DATE = 0x801a
+    LF_UTF8STRING = 0x801b
+    LF_REAL16 = 0x801c
+    LF_PAD0 = 0xf0
+    LF_PAD1 = 0xf1
+    LF_PAD2 = 0xf2
+    LF_PAD3 = 0xf3
+    LF_PAD4 = 0xf4
+    LF_PAD5 = 0xf5
+    LF_PAD6 = 0xf6
+    LF_PAD7 = 0xf7
+    LF_PAD8 = 0xf8
+    LF_PAD9 = 0xf9
+    LF_PAD10 = 0xfa
+    LF_PAD11 = 0xfb
+    LF_PAD12 = 0xfc
+    LF_PAD13 = 0xfd
+    LF_PAD14 = 0xfe
+    LF_PAD15 = 0xff
+
+
+class PointerType(IntEnum):
+    PTR_NEAR = 0x00
+    PTR_FAR = 0x01
+    PTR_HUGE = 0x02
+    PTR_BASE_SEG = 0x03
+    PTR_BASE_VAL = 0x04
+    PTR_BASE_SEGVAL = 0x05
+    PTR_BASE_ADDR = 0x06
+    PTR_BASE_SEGADDR = 0x07
+    PTR_BASE_TYPE = 0x08
+    PTR_BASE_SELF = 0x09
+    PTR_NEAR32 = 0x0a
+    PTR_FAR32 = 0x0b
+    PTR_64 = 0x0c
+    PTR_UNUSEDPTR = 0x0d
+
+
+class PointerMode(IntEnum):
+    PTR = 0x00
+    REF = 0x01
+    LVREF = 0x01
+    PMEM = 0x02
+    PMFUNC = 0x03
+    RVREF = 0x04
+    RESERVED = 0x05
+
+
+class SymKind(IntEnum):
+    S_COMPILE = 0x0001
+    S_REGISTER_16t = 0x0002
+    S_CONSTANT_16t = 0x0003
+    S_UDT_16t = 0x0004
+    S_SSEARCH = 0x0005
+    S_END = 0x0006
+    S_SKIP = 0x0007
+    S_CVRESERVE = 0x0008
+    S_OBJNAME_ST = 0x0009
+    S_ENDARG = 0x000a
+    S_COBOLUDT_16t = 0x000b
+    S_MANYREG_16t = 0x000c
+    S_RETURN = 0x000d
+    S_ENTRYTHIS = 0x000e
+    S_BPREL16 = 0x0100
+    S_LDATA16 = 0x0101
+    S_GDATA16 = 0x0102
+    S_PUB16 = 0x0103
+    S_LPROC16 = 0x0104
+    S_GPROC16 = 0x0105
+    S_THUNK16 = 0x0106
+    S_BLOCK16 = 0x0107
+    S_WITH16 = 0x0108
+    S_LABEL16 = 0x0109
+    S_CEXMODEL16 = 0x010a
+    S_VFTABLE16 = 0x010b
+    S_REGREL16 = 0x010c
+    S_BPREL32_16t = 0x0200
+    S_LDATA32_16t = 0x0201
+    S_GDATA32_16t = 0x0202
+    S_PUB32_16t = 0x0203
+    S_LPROC32_16t = 0x0204
+    S_GPROC32_16t = 0x0205
+    S_THUNK32_ST = 0x0206
+    S_BLOCK32_ST = 0x0207
+    S_WITH32_ST = 0x0208
+    S_LABEL32_ST = 0x0209
+    S_CEXMODEL32 = 0x020a
+    S_VFTABLE32_16t = 0x020b
+    S_REGREL32_16t = 0x020c
+    S_LTHREAD32_16t = 0x020d
+    S_GTHREAD32_16t = 0x020e
+    S_SLINK32 = 0x020f
+    S_LPROCMIPS_16t = 0x0300
+    S_GPROCMIPS_16t = 0x0301
+    S_PROCREF_ST = 0x0400
+    S_DATAREF_ST = 0x0401
+    S_ALIGN = 0x0402
+    S_LPROCREF_ST = 0x0403
+    S_OEM = 0x0404
+    S_TI16_MAX = 0x1000
+    S_REGISTER_ST = 0x1001
+    S_CONSTANT_ST = 0x1002
+    S_UDT_ST = 0x1003
+    S_COBOLUDT_ST = 0x1004
+    S_MANYREG_ST = 0x1005
+    S_BPREL32_ST = 0x1006
+    S_LDATA32_ST = 0x1007
+    S_GDATA32_ST = 0x1008
+    S_PUB32_ST = 0x1009
+    S_LPROC32_ST = 0x100a
+    S_GPROC32_ST = 0x100b
+    S_VFTABLE32 = 0x100c
+    S_REGREL32_ST = 0x100d
+    S_LTHREAD32_ST = 0x100e
+    S_GTHREAD32_ST = 0x100f
+    S_LPROCMIPS_ST = 0x1010
+    S_GPROCMIPS_ST = 0x1011
+    S_FRAMEPROC = 0x1012
+    S_COMPILE2_ST = 0x1013
+    S_MANYREG2_ST = 0x1014
+    S_LPROCIA64_ST = 0x1015
+    S_GPROCIA64_ST = 0x1016
+    S_LOCALSLOT_ST = 0x1017
+    S_PARAMSLOT_ST = 0x1018
+    S_ANNOTATION = 0x1019
+    S_GMANPROC_ST = 0x101a
+    S_LMANPROC_ST = 0x101b
+    S_RESERVED1 = 0x101c
+    S_RESERVED2 = 0x101d
+    S_RESERVED3 = 0x101e
+    S_RESERVED4 = 0x101f
+    S_LMANDATA_ST = 0x1020
+    S_GMANDATA_ST = 0x1021
+    S_MANFRAMEREL_ST = 0x1022
+    S_MANREGISTER_ST = 0x1023
+    S_MANSLOT_ST = 0x1024
+    S_MANMANYREG_ST = 0x1025
+    S_MANREGREL_ST = 0x1026
+    S_MANMANYREG2_ST = 0x1027
+    S_MANTYPREF = 0x1028
+    S_UNAMESPACE_ST = 0x1029
+    S_ST_MAX = 0x1100
+    S_OBJNAME = 0x1101
+    S_THUNK32 = 0x1102
+    S_BLOCK32 = 0x1103
+    S_WITH32 = 0x1104
+    S_LABEL32 = 0x1105
+    S_REGISTER = 0x1106
+    S_CONSTANT = 0x1107
+    S_UDT = 0x1108
+    S_COBOLUDT = 0x1109
+    S_MANYREG = 0x110a
+    S_BPREL32 = 0x110b
+    S_LDATA32 = 0x110c
+    S_GDATA32 = 0x110d
+    S_PUB32 = 0x110e
+    S_LPROC32 = 0x110f
+    S_GPROC32 = 0x1110
+    S_REGREL32 = 0x1111
+    S_LTHREAD32 = 0x1112
+    S_GTHREAD32 = 0x1113
+    S_LPROCMIPS = 0x1114
+    S_GPROCMIPS = 0x1115
+    S_COMPILE2 = 0x1116
+    S_MANYREG2 = 0x1117
+    S_LPROCIA64 = 0x1118
+    S_GPROCIA64 = 0x1119
+    S_LOCALSLOT = 0x111a
+    S_SLOT = S_LOCALSLOT
+    S_PARAMSLOT = 0x111b
+    S_LMANDATA = 0x111c
+    S_GMANDATA = 0x111d
+    S_MANFRAMEREL = 0x111e
+    S_MANREGISTER = 0x111f
+    S_MANSLOT = 0x1120
+    S_MANMANYREG = 0x1121
+    S_MANREGREL = 0x1122
+    S_MANMANYREG2 = 0x1123
+    S_UNAMESPACE = 0x1124
+    S_PROCREF = 0x1125
+    S_DATAREF = 0x1126
+    S_LPROCREF = 0x1127
+    S_ANNOTATIONREF = 0x1128
+    S_TOKENREF = 0x1129
+    S_GMANPROC = 0x112a
+    S_LMANPROC = 0x112b
+    S_TRAMPOLINE = 0x112c
+    S_MANCONSTANT = 0x112d
+    S_ATTR_FRAMEREL = 0x112e
+    S_ATTR_REGISTER = 0x112f
+    S_ATTR_REGREL = 0x1130
+    S_ATTR_MANYREG = 0x1131
+    S_SEPCODE = 0x1132
+    S_LOCAL_2005 = 0x1133
+    S_DEFRANGE_2005 = 0x1134
+    S_DEFRANGE2_2005 = 0x1135
+    S_SECTION = 0x1136
+    S_COFFGROUP = 0x1137
+    S_EXPORT = 0x1138
+    S_CALLSITEINFO = 0x1139
+    S_FRAMECOOKIE = 0x113a
+    S_DISCARDED = 0x113b
+    S_COMPILE3 = 0x113c
+    S_ENVBLOCK = 0x113d
+    S_LOCAL = 0x113e
+    S_DEFRANGE = 0x113f
+    S_DEFRANGE_SUBFIELD = 0x1140
+    S_DEFRANGE_REGISTER = 0x1141
+    S_DEFRANGE_FRAMEPOINTER_REL = 0x1142
+    S_DEFRANGE_SUBFIELD_REGISTER = 0x1143
+    S_DEFRANGE_FRAMEPOINTER_REL_FULL_SCOPE = 0x1144
+    S_DEFRANGE_REGISTER_REL = 0x1145
+    S_LPROC32_ID = 0x1146
+    S_GPROC32_ID = 0x1147
+    S_LPROCMIPS_ID = 0x1148
+    S_GPROCMIPS_ID = 0x1149
+    S_LPROCIA64_ID = 0x114a
+    S_GPROCIA64_ID = 0x114b
+    S_BUILDINFO = 0x114c
+    S_INLINESITE = 0x114d
+    S_INLINESITE_END = 0x114e
+    S_PROC_ID_END = 0x114f
+    S_DEFRANGE_HLSL = 0x1150
+    S_GDATA_HLSL = 0x1151
+    S_LDATA_HLSL = 0x1152
+    S_FILESTATIC = 0x1153
+    S_LOCAL_DPC_GROUPSHARED = 0x1154
+    S_LPROC32_DPC = 0x1155
+    S_LPROC32_DPC_ID = 0x1156
+    S_DEFRANGE_DPC_PTR_TAG = 0x1157
+    S_DPC_SYM_TAG_MAP = 0x1158
+    S_ARMSWITCHTABLE = 0x1159
+    S_CALLEES = 0x115a
+    S_CALLERS = 0x115b
+    S_POGODATA = 0x115c
+    S_INLINESITE2 = 0x115d
+    S_HEAPALLOCSITE = 0x115e
+    S_MOD_TYPEREF = 0x115f
+    S_REF_MINIPDB = 0x1160
+    S_PDBMAP = 0x1161
+    S_GDATA_HLSL32 = 0x1162
+    S_LDATA_HLSL32 = 0x1163
+    S_GDATA_HLSL32_EX = 0x1164
+    S_LDATA_HLSL32_EX = 0x1165
+    S_FASTLINK = 0x1167
+    S_INLINEES = 0x1168
+    S_RECTYPE_MAX = auto()
+    S_RECTYPE_LAST = S_RECTYPE_MAX - 1
+    S_RECTYPE_PAD = S_RECTYPE_MAX + 0x100
+
+
+class DebugSubsectionKind(IntEnum):
+    DEBUG_S_IGNORE = 0x80000000
+    DEBUG_S_SYMBOLS = 0xf1
+    DEBUG_S_LINES = 0xf2
+    DEBUG_S_STRINGTABLE = 0xf3
+    DEBUG_S_FILECHKSMS = 0xf4
+    DEBUG_S_FRAMEDATA = 0xf5
+    DEBUG_S_INLINEELINES = 0xf6
+    DEBUG_S_CROSSSCOPEIMPORTS = 0xf7
+    DEBUG_S_CROSSSCOPEEXPORTS = 0xf8
+    DEBUG_S_IL_LINES = 0xf9
+    DEBUG_S_FUNC_MDTOKEN_MAP = 0xfa
+    DEBUG_S_TYPE_MDTOKEN_MAP = 0xfb
+    DEBUG_S_MERGED_ASSEMBLYINPUT = 0xfc
+    DEBUG_S_COFF_SYMBOL_RVA = 0xfd
+
+
+#: SYMTYPE, followed by data
+SYMTYPE = Struct('<HH')
+SYMTYPE_FIELDS = (
+    'reclen', 'rectyp',
+)
+
+#: PROCSYM32, followed by name
+PROCSYM32 = Struct('<HHIIIIIIIIHB')
+PROCSYM32_FIELDS = (
+    'reclen', 'rectyp', 'pParent', 'pEnd', 'pNext', 'len', 'DbgStart', 'DbgEnd', 'typind', 'off',
+    'seg', 'flags',
+)
+
+#: THUNKSYM32, followed by name
+THUNKSYM32 = Struct('<HHIIIIHHB')
+THUNKSYM32_FIELDS = (
+    'reclen', 'rectyp', 'pParent', 'pEnd', 'pNext', 'off', 'seg', 'len', 'ord',
+)
+
+#: BLOCKSYM32, followed by name
+BLOCKSYM32 = Struct('<HHIIIIH')
+BLOCKSYM32_FIELDS = (
+    'reclen', 'rectyp', 'pParent', 'pEnd', 'len', 'off', 'seg',
+)
+
+#: LABELSYM32, followed by name
+LABELSYM32 = Struct('<HHIHB')
+LABELSYM32_FIELDS = (
+    'reclen', 'rectyp', 'off', 'seg', 'flags',
+)
+
+#: DATASYM32, followed by name
+DATASYM32 = Struct('<HHIIH')
+DATASYM32_FIELDS = (
+    'reclen', 'rectyp', 'typind', 'off', 'seg',
+)
+
+#: THREADSYM32, followed by name
+THREADSYM32 = Struct('<HHIIH')
+THREADSYM32_FIELDS = (
+    'reclen', 'rectyp', 'typind', 'off', 'seg',
+)
+
+#: PUBSYM32, followed by name
+PUBSYM32 = Struct('<HHIIH')
+PUBSYM32_FIELDS = (
+    'reclen', 'rectyp', 'pubsymflags', 'off', 'seg',
+)
+
+#: REFSYM2, followed by name
+REFSYM2 = Struct('<HHIIH')
+REFSYM2_FIELDS = (
+    'reclen', 'rectyp', 'sumName', 'ibSym', 'imod',
+)
+
+#: UDTSYM, followed by name
+UDTSYM = Struct('<HHI')
+UDTSYM_FIELDS = (
+    'reclen', 'rectyp', 'typind',
+)
+
+#: CONSTSYM, followed by name
+CONSTSYM = Struct('<HHIH')
+CONSTSYM_FIELDS = (
+    'reclen', 'rectyp', 'typind', 'value',
+)
+
+#: REGSYM, followed by name
+REGSYM = Struct('<HHIH')
+REGSYM_FIELDS = (
+    'reclen', 'rectyp', 'typind', 'reg',
+)
+
+#: REGREL32, followed by name
+REGREL32 = Struct('<HHIIH')
+REGREL32_FIELDS = (
+    'reclen', 'rectyp', 'off', 'typind', 'reg',
+)
+
+#: BPRELSYM32, followed by name
+BPRELSYM32 = Struct('<HHiI')
+BPRELSYM32_FIELDS = (
+    'reclen', 'rectyp', 'off', 'typind',
+)
+
+#: LOCALSYM, followed by name
+LOCALSYM = Struct('<HHIH')
+LOCALSYM_FIELDS = (
+    'reclen', 'rectyp', 'typind', 'flags',
+)
+
+#: OBJNAMESYM, followed by name
+OBJNAMESYM = Struct('<HHI')
+OBJNAMESYM_FIELDS = (
+    'reclen', 'rectyp', 'signature',
+)
+
+#: COMPILESYM3, followed by verSz
+COMPILESYM3 = Struct('<HHIHHHHHHHHH')
+COMPILESYM3_FIELDS = (
+    'reclen', 'rectyp', 'flags', 'machine', 'verFEMajor', 'verFEMinor', 'verFEBuild', 'verFEQFE',
+    'verMajor', 'verMinor', 'verBuild', 'verQFE',
+)
+
+#: FRAMEPROCSYM
+FRAMEPROCSYM = Struct('<HHIIIIIHI')
+FRAMEPROCSYM_FIELDS = (
+    'reclen', 'rectyp', 'cbFrame', 'cbPad', 'offPad', 'cbSaveRegs', 'offExHdlr', 'sectExHdlr',
+    'flags',
+)
+
+#: INLINESITESYM, followed by binaryAnnotations
+INLINESITESYM = Struct('<HHIII')
+INLINESITESYM_FIELDS = (
+    'reclen', 'rectyp', 'pParent', 'pEnd', 'inlinee',
+)
+
+#: BUILDINFOSYM
+BUILDINFOSYM = Struct('<HHI')
+BUILDINFOSYM_FIELDS = (
+    'reclen', 'rectyp', 'id',
+)
+
+#: SECTIONSYM, followed by name
+SECTIONSYM = Struct('<HHHBBIII')
+SECTIONSYM_FIELDS = (
+    'reclen', 'rectyp', 'isec', 'align', 'bReserved', 'rva', 'cb', 'characteristics',
+)
+
+#: COFFGROUPSYM, followed by name
+COFFGROUPSYM = Struct('<HHIIIH')
+COFFGROUPSYM_FIELDS = (
+    'reclen', 'rectyp', 'cb', 'characteristics', 'off', 'seg',
+)
+
+#: TYPTYPE, followed by data
+TYPTYPE = Struct('<HH')
+TYPTYPE_FIELDS = (
+    'len', 'leaf',
+)
+
+#: lfModifier
+lfModifier = Struct('<HIH')
+lfModifier_FIELDS = (
+    'leaf', 'type', 'attr',
+)
+
+#: lfPointer, followed by pbase
+lfPointer = Struct('<HII')
+lfPointer_FIELDS = (
+    'leaf', 'utype', 'attr',
+)
+
+#: lfArray, followed by data
+lfArray = Struct('<HII')
+lfArray_FIELDS = (
+    'leaf', 'elemtype', 'idxtype',
+)
+
+#: lfClass, followed by data
+lfClass = Struct('<HHHIII')
+lfClass_FIELDS = (
+    'leaf', 'count', 'property', 'field', 'derived', 'vshape',
+)
+
+#: lfUnion, followed by data
+lfUnion = Struct('<HHHI')
+lfUnion_FIELDS = (
+    'leaf', 'count', 'property', 'field',
+)
+
+#: lfEnum, followed by Name
+lfEnum = Struct('<HHHII')
+lfEnum_FIELDS = (
+    'leaf', 'count', 'property', 'utype', 'field',
+)
+
+#: lfProc
+lfProc = Struct('<HIBBHI')
+lfProc_FIELDS = (
+    'leaf', 'rvtype', 'calltype', 'funcattr', 'parmcount', 'arglist',
+)
+
+#: lfMFunc
+lfMFunc = Struct('<HIIIBBHIi')
+lfMFunc_FIELDS = (
+    'leaf', 'rvtype', 'classtype', 'thistype', 'calltype', 'funcattr', 'parmcount', 'arglist',
+    'thisadjust',
+)
+
+#: lfVTShape, followed by desc
+lfVTShape = Struct('<HH')
+lfVTShape_FIELDS = (
+    'leaf', 'count',
+)
+
+#: lfArgList, followed by arg
+lfArgList = Struct('<HI')
+lfArgList_FIELDS = (
+    'leaf', 'count',
+)
+
+#: lfFieldList, followed by data
+lfFieldList = Struct('<H')
+lfFieldList_FIELDS = (
+    'leaf',
+)
+
+#: lfBitfield
+lfBitfield = Struct('<HIBB')
+lfBitfield_FIELDS = (
+    'leaf', 'type', 'length', 'position',
+)
+
+#: lfBClass, followed by offset
+lfBClass = Struct('<HHI')
+lfBClass_FIELDS = (
+    'leaf', 'attr', 'index',
+)
+
+#: lfEnumerate, followed by value
+lfEnumerate = Struct('<HH')
+lfEnumerate_FIELDS = (
+    'leaf', 'attr',
+)
+
+#: lfIndex
+lfIndex = Struct('<HHI')
+lfIndex_FIELDS = (
+    'leaf', 'pad0', 'index',
+)
+
+#: lfMember, followed by offset
+lfMember = Struct('<HHI')
+lfMember_FIELDS = (
+    'leaf', 'attr', 'index',
+)
+
+#: lfSTMember, followed by Name
+lfSTMember = Struct('<HHI')
+lfSTMember_FIELDS = (
+    'leaf', 'attr', 'index',
+)
+
+#: lfMethod, followed by Name
+lfMethod = Struct('<HHI')
+lfMethod_FIELDS = (
+    'leaf', 'count', 'mList',
+)
+
+#: lfOneMethod, followed by vbaseoff
+lfOneMethod = Struct('<HHI')
+lfOneMethod_FIELDS = (
+    'leaf', 'attr', 'index',
+)
+
+#: lfNestType, followed by Name
+lfNestType = Struct('<HHI')
+lfNestType_FIELDS = (
+    'leaf', 'pad0', 'index',
+)
+
+#: lfVFuncTab
+lfVFuncTab = Struct('<HHI')
+lfVFuncTab_FIELDS = (
+    'leaf', 'pad0', 'type',
+)
+
+#: lfFuncId, followed by name
+lfFuncId = Struct('<HII')
+lfFuncId_FIELDS = (
+    'leaf', 'scopeId', 'type',
+)
+
+#: lfMFuncId, followed by name
+lfMFuncId = Struct('<HII')
+lfMFuncId_FIELDS = (
+    'leaf', 'parentType', 'type',
+)
+
+#: lfStringId, followed by name
+lfStringId = Struct('<HI')
+lfStringId_FIELDS = (
+    'leaf', 'id',
+)
+
+#: lfUdtSrcLine
+lfUdtSrcLine = Struct('<HIII')
+lfUdtSrcLine_FIELDS = (
+    'leaf', 'type', 'src', 'line',
+)
+
+#: lfUdtModSrcLine
+lfUdtModSrcLine = Struct('<HIIIH')
+lfUdtModSrcLine_FIELDS = (
+    'leaf', 'type', 'src', 'line', 'imod',
+)
+
+#: lfBuildInfo, followed by arg
+lfBuildInfo = Struct('<HH')
+lfBuildInfo_FIELDS = (
+    'leaf', 'count',
+)
+
+#: CV_DebugSSubsectionHeader_t
+CV_DebugSSubsectionHeader_t = Struct('<Ii')
+CV_DebugSSubsectionHeader_t_FIELDS = (
+    'type', 'cbLen',
+)
+
+#: CV_DebugSLinesHeader_t
+CV_DebugSLinesHeader_t = Struct('<iHHi')
+CV_DebugSLinesHeader_t_FIELDS = (
+    'offCon', 'segCon', 'flags', 'cbCon',
+)
+
+#: CV_DebugSLinesFileBlockHeader_t
+CV_DebugSLinesFileBlockHeader_t = Struct('<iii')
+CV_DebugSLinesFileBlockHeader_t_FIELDS = (
+    'offFile', 'nLines', 'cbBlock',
+)
+
+#: CV_Line_t
+CV_Line_t = Struct('<II')
+CV_Line_t_FIELDS = (
+    'offset', 'linenumStart',
+)
+CV_Line_t_BITS = {
+    'linenumStart': (1, 0, 24), 'deltaLineEnd': (1, 24, 7), 'fStatement': (1, 31, 1),
+}
+
+#: CV_Column_t
+CV_Column_t = Struct('<HH')
+CV_Column_t_FIELDS = (
+    'offColumnStart', 'offColumnEnd',
+)
@@ -0,0 +1,621 @@
+"""
+Pure Python reader of the DBI (Debug info) stream of PDB files.
+
+The module infos are decoded into :class:`ModuleInfo` records in a single pass, and the section
+contributions into parallel NumPy arrays (See :class:`SectionContributions`), both on first use.
+:meth:`DbiStream.contribution_index` indexes the section contributions by RVA to find the module
+that contributed an address.
+"""
+
+import struct
+from enum import IntEnum
+
+from . import _cache
+
+
+#: The stream index of the DBI stream.
+DBI_STREAM = 3
+
+_HEADER = struct.Struct('<iIIHHHHHHiiiiiIiiHHI')
+_MODULE_INFO = struct.Struct('<I28sHHIIIH2sIII')
+_SECTION_MAP_HEADER = struct.Struct('<HH')
+_SECTION_MAP_ENTRY = struct.Struct('<HHHHHHII')
+
+_SECTION_CONTRIBUTIONS_V60 = 0xeffe0000 + 19970605
+_SECTION_CONTRIBUTIONS_V2 = 0xeffe0000 + 20140516
+
+# Stream index of a stream that doesn't exist
+_NIL_STREAM = 0xffff
+
+# IMAGE_SECTION_HEADER
+_SECTION_HEADER = struct.Struct('<8sIIIIIIHHI')
+
+_CONTRIBUTION_INDEX_CACHE_MAGIC = b'PYDIASCI'
+# Version 2: The starts are source RVAs (Of the original section headers) when the PDB has OMAP
+_CONTRIBUTION_INDEX_CACHE_VERSION = 2
+_CONTRIBUTION_INDEX_CACHE_HEADER = struct.Struct('<8sII')
+
+
+class DebugStream(IntEnum):
+    """The streams listed in the optional debug header of the DBI stream."""
+    FPO = 0
+    EXCEPTION = 1
+    FIXUP = 2
+    OMAP_TO_SRC = 3
+    OMAP_FROM_SRC = 4
+    SECTION_HDR = 5
+    TOKEN_RID_MAP = 6
+    XDATA = 7
+    PDATA = 8
+    NEW_FPO = 9
+    SECTION_HDR_ORIG = 10
+
+
+class ModuleInfo:
+    """
+    A module (Compiland) of the DBI stream. The fixed size fields are unpacked together, and the
+    names are only decoded on first access.
+    """
+
+    __slots__ = ('index', '_data', '_fields', '_name_offset', '_name_end', '_object_name_end')
+
+    def __init__(self, index, data, fields, name_offset, name_end, object_name_end):
+        #: The index of the module.
+        self.index = index
+        self._data = data
+        self._fields = fields
+        self._name_offset = name_offset
+        self._name_end = name_end
+        self._object_name_end = object_name_end
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} index={self.index} name={self.name!r}>"
+
+    @property
+    def name(self):
+        """The name of the module, usually the path of its object file."""
+        return self._data[self._name_offset:self._name_end].decode('utf-8', 'replace')
+
+    @property
+    def object_name(self):
+        """The path of the object file, or of the library the module comes from."""
+        return self._data[self._name_end + 1:self._object_name_end].decode('utf-8', 'replace')
+
+    @property
+    def flags(self):
+        """The module flags."""
+        return self._fields[2]
+
+    @property
+    def symbol_stream(self):
+        """The index of the stream with the symbols and line info of the module, or ``None``."""
+        stream = self._fields[3]
+        return None if stream == _NIL_STREAM else stream
+
+    @property
+    def symbol_byte_size(self):
+        """The size of the CodeView symbols in :attr:`symbol_stream`."""
+        return self._fields[4]
+
+    @property
+    def c11_byte_size(self):
+        """The size of the C11 line info in :attr:`symbol_stream`."""
+        return self._fields[5]
+
+    @property
+    def c13_byte_size(self):
+        """The size of the C13 line info in :attr:`symbol_stream`."""
+        return self._fields[6]
+
+    @property
+    def source_file_count(self):
+        """The number of source files of the module."""
+        return self._fields[7]
+
+    @property
+    def source_file_name_index(self):
+        """The ``/names`` offset of the source file name."""
+        return self._fields[10]
+
+    @property
+    def pdb_file_path_name_index(self):
+        """The ``/names`` offset of the PDB file path."""
+        return self._fields[11]
+
+
+class SectionContributions:
+    """
+    The section contributions of the DBI stream, as parallel NumPy arrays sorted like in the
+    stream (By section and offset).
+    """
+
+    def __init__(self, section, offset, size, characteristics, module):
+        #: The section numbers (1 based).
+        self.section = section
+        #: The offsets in the section.
+        self.offset = offset
+        #: The sizes of the contributions.
+        self.size = size
+        #: The section characteristics (``IMAGE_SCN_*``).
+        self.characteristics = characteristics
+        #: The index of the contributing :class:`ModuleInfo`.
+        self.module = module
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={len(self)}>"
+
+    def __len__(self):
+        return len(self.section)
+
+
+class ContributionIndex:
+    """
+    An index of the section contributions by RVA, for finding the module that contributed an
+    address. Get one using :meth:`DbiStream.contribution_index`.
+    """
+
+    def __init__(self, starts, ends, modules, omap=None):
+        #: The sorted start RVAs of the contributions.
+        self.starts = starts
+        #: The end RVAs (Exclusive) of the contributions.
+        self.ends = ends
+        #: The module indices of the contributions.
+        self.modules = modules
+        #: The :class:`~pydia2.omap.Omap` that the RVAs looked up are translated with, in which
+        #: case :attr:`starts` and :attr:`ends` are source RVAs.
+        self.omap = omap
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={len(self)}>"
+
+    def __len__(self):
+        return len(self.starts)
+
+    def module_at(self, rva):
+        """The index of the module that contributed *rva*, or ``None``."""
+        if self.omap is not None:
+            rva = self.omap.to_source(rva)
+            if rva is None:
+                return None
+
+        i = int(self.starts.searchsorted(rva, 'right')) - 1
+        if i < 0 or rva >= self.ends[i]:
+            return None
+
+        return int(self.modules[i])
+
+    def modules_at(self, rvas):
+        """
+        The indices of the modules that contributed each of *rvas*, as a NumPy array with -1 for
+        RVAs that no module contributed.
+        """
+        import numpy as np
+
+        rvas = np.asarray(rvas, dtype=np.int64)
+        if not len(self):
+            return np.full(rvas.shape, -1, np.int32)
+
+        if self.omap is not None:
+            rvas = self.omap.to_source_many(rvas)
+
+        i = self.starts.searchsorted(rvas, 'right') - 1
+        clipped = np.maximum(i, 0)
+        found = (i >= 0) & (rvas >= 0) & (rvas < self.ends[clipped])
+        return np.where(found, self.modules[clipped].astype(np.int32), -1)
+
+
+class SectionMapEntry:
+    """An entry of the section map of the DBI stream."""
+
+    __slots__ = ('flags', 'overlay', 'group', 'frame', 'section_name', 'class_name', 'offset',
+                 'length')
+
+    def __init__(self, flags, overlay, group, frame, section_name, class_name, offset, length):
+        self.flags = flags
+        self.overlay = overlay
+        self.group = group
+        self.frame = frame
+        self.section_name = section_name
+        self.class_name = class_name
+        self.offset = offset
+        self.length = length
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} frame={self.frame} offset={self.offset:#x} "
+            f"length={self.length:#x}>")
+
+
+class SectionHeader:
+    """A section header (``IMAGE_SECTION_HEADER``) of the binary of the PDB."""
+
+    __slots__ = ('name', 'virtual_size', 'virtual_address', 'size_of_raw_data',
+                 'pointer_to_raw_data', 'pointer_to_relocations', 'pointer_to_line_numbers',
+                 'number_of_relocations', 'number_of_line_numbers', 'characteristics')
+
+    def __init__(self, name, virtual_size, virtual_address, size_of_raw_data, pointer_to_raw_data,
+                 pointer_to_relocations, pointer_to_line_numbers, number_of_relocations,
+                 number_of_line_numbers, characteristics):
+        self.name = name
+        self.virtual_size = virtual_size
+        self.virtual_address = virtual_address
+        self.size_of_raw_data = size_of_raw_data
+        self.pointer_to_raw_data = pointer_to_raw_data
+        self.pointer_to_relocations = pointer_to_relocations
+        self.pointer_to_line_numbers = pointer_to_line_numbers
+        self.number_of_relocations = number_of_relocations
+        self.number_of_line_numbers = number_of_line_numbers
+        self.characteristics = characteristics
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} name={self.name!r} "
+            f"virtual_address={self.virtual_address:#x} virtual_size={self.virtual_size:#x}>")
+
+
+class DbiStream:
+    """The DBI stream of the :class:`~pydia2.msf.MsfFile` *msf*."""
+
+    def __init__(self, msf, stream_index=DBI_STREAM):
+        self.msf = msf
+        self._stream = msf.stream(stream_index)
+        if len(self._stream) < _HEADER.size:
+            raise ValueError(f"Stream {stream_index} is not a DBI stream")
+
+        (self.version_signature, self.version, self.age, self.global_stream_index,
+            self.build_number, self.public_stream_index, self.pdb_dll_version,
+            self.symbol_record_stream_index, self.pdb_dll_rebuild, self._module_info_size,
+            self._section_contribution_size, self._section_map_size, self._source_info_size,
+            self._type_server_map_size, self.mfc_type_server_index,
+            self._optional_debug_header_size, self._ec_substream_size, self.flags, self.machine,
+            _) = _HEADER.unpack_from(self._stream.read(0, _HEADER.size))
+
+        # The offsets of the substreams, which follow each other in this order
+        offset = _HEADER.size
+        self._substreams = {}
+        for name, size in (
+                ('module_info', self._module_info_size),
+                ('section_contribution', self._section_contribution_size),
+                ('section_map', self._section_map_size),
+                ('source_info', self._source_info_size),
+                ('type_server_map', self._type_server_map_size),
+                ('ec', self._ec_substream_size),
+                ('optional_debug_header', self._optional_debug_header_size)):
+            if size < 0 or offset + size > len(self._stream):
+                raise ValueError(f"DBI {name} substream is out of bounds")
+
+            self._substreams[name] = offset, size
+            offset += size
+
+        self._modules = None
+        self._section_contributions = None
+        self._section_map = None
+        self._source_files = None
+        self._debug_streams = None
+        self._contribution_index = None
+        self._omap = None
+        self._omap_loaded = False
+        self._section_headers = {}
+        self._section_addresses = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} age={self.age} machine={self.machine:#x}>"
+
+    def _substream(self, name):
+        offset, size = self._substreams[name]
+        return self._stream.read(offset, size)
+
+    @property
+    def modules(self):
+        """The list of :class:`ModuleInfo` of the modules, decoded on first access."""
+        if self._modules is None:
+            data = bytes(self._substream('module_info'))
+            modules = []
+            offset = 0
+            unpack_from = _MODULE_INFO.unpack_from
+            find = data.find
+            while offset + _MODULE_INFO.size <= len(data):
+                name_offset = offset + _MODULE_INFO.size
+                name_end = find(b'\0', name_offset)
+                object_name_end = find(b'\0', name_end + 1)
+                if name_end < 0 or object_name_end < 0:
+                    raise ValueError(f"DBI module info {len(modules)} is truncated")
+
+                modules.append(ModuleInfo(
+                    len(modules), data, unpack_from(data, offset), name_offset, name_end,
+                    object_name_end))
+                offset = (object_name_end + 4) & ~3
+
+            self._modules = modules
+
+        return self._modules
+
+    @property
+    def section_contributions(self):
+        """The :class:`SectionContributions`, decoded on first access. Requires NumPy."""
+        if self._section_contributions is None:
+            import numpy as np
+
+            data = self._substream('section_contribution')
+            if len(data) < 4:
+                version = _SECTION_CONTRIBUTIONS_V60
+            else:
+                version = struct.unpack_from('<I', data)[0]
+
+            if version == _SECTION_CONTRIBUTIONS_V60:
+                entry_size = 28
+            elif version == _SECTION_CONTRIBUTIONS_V2:
+                # With an additional u32 COFF section index
+                entry_size = 32
+            else:
+                raise ValueError(f"Unknown section contribution version: {version:#x}")
+
+            dtype = np.dtype({
+                'names': ['section', 'offset', 'size', 'characteristics', 'module'],
+                'formats': ['<u2', '<i4', '<i4', '<u4', '<u2'],
+                'offsets': [0, 4, 8, 12, 16],
+                'itemsize': entry_size,
+            })
+            count = max(len(data) - 4, 0) // entry_size
+            entries = np.frombuffer(data, dtype=dtype, count=count, offset=4 if count else 0)
+            self._section_contributions = SectionContributions(*(
+                entries[name].astype(entries.dtype[name].newbyteorder('='))
+                for name in dtype.names))
+
+        return self._section_contributions
+
+    @property
+    def source_files(self):
+        """
+        The source file names of each module (A list of lists, by module index) from the source
+        info substream, decoded on first access.
+        """
+        if self._source_files is None:
+            data = bytes(self._substream('source_info'))
+            if len(data) < 4:
+                self._source_files = [[] for _ in self.modules]
+                return self._source_files
+
+            module_count = struct.unpack_from('<H', data)[0]
+            # The file count in the header and the per module start indices are truncated to 16
+            # bits, so only the per module counts are reliable
+            counts_offset = 4 + 2 * module_count
+            offsets_offset = counts_offset + 2 * module_count
+            if offsets_offset > len(data):
+                raise ValueError("DBI source info substream is truncated")
+
+            counts = struct.unpack_from(f'<{module_count}H', data, counts_offset)
+            if offsets_offset + 4 * sum(counts) > len(data):
+                raise ValueError("DBI source info substream is truncated")
+
+            offsets = struct.unpack_from(f'<{sum(counts)}I', data, offsets_offset)
+            names_offset = offsets_offset + 4 * len(offsets)
+
+            names = {}
+            source_files = []
+            start = 0
+            for count in counts:
+                files = []
+                for offset in offsets[start:start + count]:
+                    name = names.get(offset)
+                    if name is None:
+                        end = data.find(b'\0', names_offset + offset)
+                        if end < 0:
+                            raise ValueError(f"DBI source file name at {offset:#x} is truncated")
+
+                        name = names[offset] = data[names_offset + offset:end].decode(
+                            'utf-8', 'replace')
+
+                    files.append(name)
+
+                source_files.append(files)
+                start += count
+
+            self._source_files = source_files
+
+        return self._source_files
+
+    @property
+    def section_map(self):
+        """The list of :class:`SectionMapEntry` of the section map, decoded on first access."""
+        if self._section_map is None:
+            data = self._substream('section_map')
+            count = 0
+            if len(data) >= _SECTION_MAP_HEADER.size:
+                count = _SECTION_MAP_HEADER.unpack_from(data)[0]
+
+            self._section_map = [
+                SectionMapEntry(*entry) for entry in _SECTION_MAP_ENTRY.iter_unpack(
+                    data[_SECTION_MAP_HEADER.size:
+                         _SECTION_MAP_HEADER.size + count * _SECTION_MAP_ENTRY.size])]
+
+        return self._section_map
+
+    def debug_stream(self, kind):
+        """
+        Return the index of the :class:`DebugStream` *kind* from the optional debug header, or
+        ``None`` if it doesn't exist.
+        """
+        if self._debug_streams is None:
+            data = self._substream('optional_debug_header')
+            self._debug_streams = struct.unpack_from(f'<{len(data) // 2}H', data)
+
+        if kind >= len(self._debug_streams) or self._debug_streams[kind] == _NIL_STREAM:
+            return None
+
+        return self._debug_streams[kind]
+
+    @property
+    def omap(self):
+        """
+        The :class:`~pydia2.omap.Omap` of the PDB, or ``None`` if it has no OMAP tables (The
+        binary wasn't post-link optimized). Requires NumPy.
+        """
+        if not self._omap_loaded:
+            from .omap import Omap, OmapTable
+
+            tables = []
+            for kind in (DebugStream.OMAP_TO_SRC, DebugStream.OMAP_FROM_SRC):
+                stream = self.debug_stream(kind)
+                tables.append(
+                    None if stream is None else OmapTable.from_stream(self.msf.stream(stream)))
+
+            if any(table is not None for table in tables):
+                self._omap = Omap(*tables)
+
+            self._omap_loaded = True
+
+        return self._omap
+
+    def _read_section_headers(self, kind):
+        if kind not in self._section_headers:
+            stream = self.debug_stream(kind)
+            headers = None
+            if stream is not None:
+                data = self.msf.stream(stream).read()
+                headers = [
+                    SectionHeader(name.rstrip(b'\0').decode('utf-8', 'replace'), *fields)
+                    for name, *fields in _SECTION_HEADER.iter_unpack(
+                        data[:len(data) // _SECTION_HEADER.size * _SECTION_HEADER.size])]
+
+            self._section_headers[kind] = headers
+
+        return self._section_headers[kind]
+
+    @property
+    def section_headers(self):
+        """
+        The list of :class:`SectionHeader` of the binary, from the ``SECTION_HDR`` debug stream,
+        read on first access. Empty if the PDB doesn't have them.
+        """
+        return self._read_section_headers(DebugStream.SECTION_HDR) or []
+
+    @property
+    def original_section_headers(self):
+        """
+        The list of :class:`SectionHeader` of the binary before it was post-link optimized, from
+        the ``SECTION_HDR_ORIG`` debug stream, or ``None`` if the PDB doesn't have them (i.e. it has
+        no OMAP). Symbols and line info refer to these sections.
+        """
+        return self._read_section_headers(DebugStream.SECTION_HDR_ORIG)
+
+    def _section_virtual_addresses(self):
+        """
+        The virtual address of each section (By section number - 1) as a NumPy array. With OMAP
+        these are the addresses of the original sections, i.e. source RVAs.
+        """
+        if self._section_addresses is None:
+            import numpy as np
+
+            headers = None
+            if self.omap is not None:
+                headers = self.original_section_headers
+
+            if headers is None:
+                headers = self.section_headers
+
+            self._section_addresses = np.array(
+                [header.virtual_address for header in headers], dtype=np.int64)
+
+        return self._section_addresses
+
+    def to_rva(self, section, offset):
+        """
+        Convert the *section* number (1 based) and *offset* of a symbol to the RVA in the binary,
+        translating it with OMAP if the PDB has it. Returns ``None`` if the section doesn't exist or
+        OMAP doesn't map the address.
+        """
+        addresses = self._section_virtual_addresses()
+        if not 1 <= section <= len(addresses):
+            return None
+
+        rva = int(addresses[section - 1]) + offset
+        if self.omap is not None:
+            return self.omap.from_source(rva)
+
+        return rva
+
+    def to_rvas(self, sections, offsets):
+        """
+        Convert the arrays of *sections* numbers and *offsets* to RVAs at once, see
+        :meth:`to_rva`. Returns a NumPy ``int64`` array with -1 for the ones that can't be
+        converted. Requires NumPy.
+        """
+        import numpy as np
+
+        sections = np.asarray(sections, dtype=np.int64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        addresses = self._section_virtual_addresses()
+        if not len(addresses):
+            return np.full(np.broadcast(sections, offsets).shape, -1, np.int64)
+
+        valid = (sections >= 1) & (sections <= len(addresses))
+        bases = addresses[np.clip(sections - 1, 0, len(addresses) - 1)]
+        rvas = np.where(valid, bases + offsets, -1)
+        if self.omap is not None:
+            rvas = self.omap.from_source_many(rvas)
+
+        return rvas
+
+    def contribution_index(self, cache_dir=None):
+        """
+        Return the :class:`ContributionIndex` of the section contributions, built on first use.
+        Requires NumPy.
+
+        If *cache_dir* is given, the index is loaded from, or saved to, a file in it named after the
+        GUID and age of the PDB, so that it's only built once for each PDB.
+        """
+        if self._contribution_index is None:
+            cache_path = None
+            if cache_dir is not None:
+                cache_path = _cache.path(cache_dir, self.msf, 'contributions')
+                self._contribution_index = self._load_contribution_index(cache_path)
+
+            if self._contribution_index is None:
+                self._contribution_index = self._build_contribution_index()
+                if cache_path is not None:
+                    self._save_contribution_index(cache_path, self._contribution_index)
+
+        return self._contribution_index
+
+    def _build_contribution_index(self):
+        import numpy as np
+
+        contributions = self.section_contributions
+        virtual_addresses = self._section_virtual_addresses()
+        # Contributions to unknown sections (e.g. without section headers) can't be located
+        valid = ((contributions.size > 0) & (contributions.section >= 1)
+                 & (contributions.section <= len(virtual_addresses)))
+        sections = contributions.section[valid].astype(np.int64) - 1
+        starts = virtual_addresses[sections] + contributions.offset[valid]
+        ends = starts + contributions.size[valid]
+        modules = contributions.module[valid]
+
+        order = np.argsort(starts, kind='stable')
+        return ContributionIndex(
+            starts[order].astype(np.uint32), ends[order].astype(np.uint32),
+            modules[order].astype(np.uint32), self.omap)
+
+    def _load_contribution_index(self, path):
+        import numpy as np
+
+        data = _cache.read(path)
+        if data is None or len(data) < _CONTRIBUTION_INDEX_CACHE_HEADER.size:
+            return None
+
+        magic, version, count = _CONTRIBUTION_INDEX_CACHE_HEADER.unpack_from(data)
+        if (magic != _CONTRIBUTION_INDEX_CACHE_MAGIC or version != _CONTRIBUTION_INDEX_CACHE_VERSION
+                or len(data) != _CONTRIBUTION_INDEX_CACHE_HEADER.size + 3 * 4 * count):
+            return None
+
+        arrays = np.frombuffer(
+            data, dtype='<u4', offset=_CONTRIBUTION_INDEX_CACHE_HEADER.size).reshape(3, count)
+        return ContributionIndex(*(array.astype(np.uint32) for array in arrays), self.omap)
+
+    def _save_contribution_index(self, path, index):
+        import numpy as np
+
+        arrays = np.stack((index.starts, index.ends, index.modules)).astype('<u4')
+        _cache.write(path, _CONTRIBUTION_INDEX_CACHE_HEADER.pack(
+            _CONTRIBUTION_INDEX_CACHE_MAGIC, _CONTRIBUTION_INDEX_CACHE_VERSION, len(index)),
+            arrays.tobytes())
@@ -0,0 +1,303 @@
+"""
+Pure Python reader of the x86 stack frame info of PDB files, the ``FPO`` and ``NEW_FPO``
+(FrameData) debug streams, for walking x86 stacks without DIA. Requires NumPy.
+
+:class:`FrameTables` indexes both tables by RVA. The RPN frame programs of FrameData (e.g.
+``$T0 $ebp = $eip $T0 4 + ^ = ...``), which are stored in the ``/names`` string table, are compiled
+into Python functions by :func:`compile_frame_program`, once per distinct program.
+"""
+
+import re
+from functools import lru_cache
+
+from .cvconst import StackFrameType
+from .dbi import DebugStream
+
+
+#: The number of compiled frame programs kept by :func:`compile_frame_program`.
+FRAME_PROGRAM_CACHE_SIZE = 4096
+
+# FPO_DATA
+_FPO_DTYPE = {
+    'names': ['start', 'size', 'locals', 'params', 'attributes'],
+    'formats': ['<u4', '<u4', '<u4', '<u2', '<u2'],
+    'offsets': [0, 4, 8, 12, 14],
+    'itemsize': 16,
+}
+# FRAMEDATA
+_FRAME_DATA_DTYPE = {
+    'names': ['start', 'size', 'locals_size', 'params_size', 'max_stack_size', 'program',
+              'prolog_size', 'saved_registers_size', 'flags'],
+    'formats': ['<u4', '<u4', '<u4', '<u4', '<u4', '<u4', '<u2', '<u2', '<u4'],
+    'offsets': [0, 4, 8, 12, 16, 20, 24, 26, 28],
+    'itemsize': 32,
+}
+
+# FRAMEDATA.flags
+_FRAME_DATA_HAS_SEH = 0x1
+_FRAME_DATA_HAS_EH = 0x2
+_FRAME_DATA_IS_FUNCTION_START = 0x4
+
+_VARIABLE = re.compile(r'[$.]?[A-Za-z_][A-Za-z0-9_]*\Z')
+_BINARY_OPERATORS = {
+    '+': '(({}) + ({})) & 0xffffffff',
+    '-': '(({}) - ({})) & 0xffffffff',
+    '*': '(({}) * ({})) & 0xffffffff',
+    '/': '({}) // ({})',
+    '%': '({}) % ({})',
+    # Align down
+    '@': '({}) & -({})',
+}
+
+
+@lru_cache(maxsize=FRAME_PROGRAM_CACHE_SIZE)
+def compile_frame_program(program):
+    """
+    Compile the RPN frame *program* into a function ``run(registers, read)``, which runs it on the
+    ``{name: value}`` dict *registers* in place (e.g. ``$eip``, ``$esp``, ``$ebp``, and
+    ``.raSearch`` and the other ``.`` values the program uses), reading the u32 at an address of
+    the stack with ``read(address)`` for ``^``.
+
+    Programs are compiled to Python code once, compiled programs are cached by program string.
+    """
+    stack = []
+    statements = []
+    for token in program.split():
+        if token in _BINARY_OPERATORS:
+            if len(stack) < 2:
+                raise ValueError(f"Frame program stack underflow at {token!r}: {program!r}")
+
+            right, _ = stack.pop()
+            left, _ = stack.pop()
+            stack.append((_BINARY_OPERATORS[token].format(left, right), None))
+        elif token == '^':
+            if not stack:
+                raise ValueError(f"Frame program stack underflow at {token!r}: {program!r}")
+
+            address, _ = stack.pop()
+            stack.append((f'read({address})', None))
+        elif token == '=':
+            if len(stack) < 2:
+                raise ValueError(f"Frame program stack underflow at {token!r}: {program!r}")
+
+            value, _ = stack.pop()
+            _, name = stack.pop()
+            if name is None:
+                raise ValueError(f"Frame program assigns to an expression: {program!r}")
+
+            statements.append(f'registers[{name!r}] = {value}')
+        elif _VARIABLE.match(token):
+            stack.append((f'registers[{token!r}]', token))
+        else:
+            try:
+                value = int(token, 16) if token.lower().startswith('0x') else int(token)
+            except ValueError:
+                raise ValueError(f"Invalid frame program token {token!r}: {program!r}") from None
+
+            stack.append((str(value), None))
+
+    if stack:
+        raise ValueError(f"Frame program leaves values on the stack: {program!r}")
+
+    source = 'def run(registers, read):\n' + ''.join(
+        f'    {statement}\n' for statement in statements or ['pass'])
+    namespace = {}
+    exec(compile(source, '<frame program>', 'exec'), namespace)
+    return namespace['run']
+
+
+class FpoData:
+    """An ``FPO_DATA`` entry, describing the frame of a function."""
+
+    __slots__ = ('start', 'size', 'locals', 'params', 'prolog_size', 'saved_registers',
+                 'has_seh', 'uses_bp', 'frame_type')
+
+    def __init__(self, start, size, locals, params, attributes):
+        #: The RVA of the function.
+        self.start = start
+        #: The size of the function.
+        self.size = size
+        #: The number of dwords of locals.
+        self.locals = locals
+        #: The number of dwords of parameters.
+        self.params = params
+        #: The size of the prolog.
+        self.prolog_size = attributes & 0xff
+        #: The number of saved registers.
+        self.saved_registers = (attributes >> 8) & 0x7
+        #: Whether the function has structured exception handling.
+        self.has_seh = bool(attributes & 0x800)
+        #: Whether the function uses EBP as frame pointer.
+        self.uses_bp = bool(attributes & 0x1000)
+        #: The :class:`~pydia2.cvconst.StackFrameType` of the frame.
+        self.frame_type = StackFrameType(attributes >> 14)
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} start={self.start:#x} size={self.size:#x} "
+                f"frame_type={self.frame_type.name}>")
+
+
+class FrameData:
+    """A ``FRAMEDATA`` entry, describing the frame of a range of code with a frame program."""
+
+    __slots__ = ('start', 'size', 'locals_size', 'params_size', 'max_stack_size',
+                 'program_offset', 'prolog_size', 'saved_registers_size', 'has_seh', 'has_eh',
+                 'is_function_start', 'program')
+
+    #: The :class:`~pydia2.cvconst.StackFrameType` of the frame.
+    frame_type = StackFrameType.FrameData
+
+    def __init__(self, start, size, locals_size, params_size, max_stack_size, program_offset,
+                 prolog_size, saved_registers_size, flags, program):
+        #: The RVA of the code.
+        self.start = start
+        #: The size of the code.
+        self.size = size
+        #: The size of the locals in bytes.
+        self.locals_size = locals_size
+        #: The size of the parameters in bytes.
+        self.params_size = params_size
+        #: The maximum size of the stack.
+        self.max_stack_size = max_stack_size
+        #: The ``/names`` offset of the frame program.
+        self.program_offset = program_offset
+        #: The size of the prolog.
+        self.prolog_size = prolog_size
+        #: The size of the saved registers in bytes.
+        self.saved_registers_size = saved_registers_size
+        #: Whether the code has structured exception handling.
+        self.has_seh = bool(flags & _FRAME_DATA_HAS_SEH)
+        #: Whether the code has C++ exception handling.
+        self.has_eh = bool(flags & _FRAME_DATA_HAS_EH)
+        #: Whether this is the start of a function.
+        self.is_function_start = bool(flags & _FRAME_DATA_IS_FUNCTION_START)
+        #: The frame program string.
+        self.program = program
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} start={self.start:#x} size={self.size:#x} "
+                f"program={self.program!r}>")
+
+    def unwind(self, registers, read):
+        """
+        Run the compiled frame program on a copy of *registers* (See
+        :func:`compile_frame_program`), with ``.cbLocals``, ``.cbParams`` and ``.cbSavedRegs``
+        from this entry, and return it.
+        """
+        registers = dict(registers)
+        registers.setdefault('.cbLocals', self.locals_size)
+        registers.setdefault('.cbParams', self.params_size)
+        registers.setdefault('.cbSavedRegs', self.saved_registers_size)
+        compile_frame_program(self.program)(registers, read)
+        return registers
+
+
+def _sorted_entries(np, data, dtype):
+    entries = np.frombuffer(data, dtype=np.dtype(dtype), count=len(data) // dtype['itemsize'])
+    return entries[np.argsort(entries['start'], kind='stable')]
+
+
+class FrameTables:
+    """
+    The ``FPO`` and ``NEW_FPO`` (FrameData) tables of the :class:`~pydia2.dbi.DbiStream` *dbi* of
+    the :class:`~pydia2.msf.MsfFile` *msf*, indexed by RVA. *names* is the ``/names``
+    :class:`~pydia2.strtab.StringTable` with the frame programs, opened on first use if not given.
+
+    Lookups prefer FrameData over FPO, like DIA, and translate RVAs with OMAP if the PDB has it.
+    """
+
+    def __init__(self, msf, dbi, names=None):
+        import numpy as np
+
+        self.msf = msf
+        self.dbi = dbi
+        self._names = names
+        empty = bytes(0)
+
+        stream = dbi.debug_stream(DebugStream.FPO)
+        data = empty if stream is None else msf.stream(stream).read()
+        #: The FPO entries as a NumPy structured array sorted by start RVA.
+        self.fpo = _sorted_entries(np, data, _FPO_DTYPE)
+
+        stream = dbi.debug_stream(DebugStream.NEW_FPO)
+        data = empty if stream is None else msf.stream(stream).read()
+        if len(data) % _FRAME_DATA_DTYPE['itemsize']:
+            # Starts with a relocation pointer
+            data = data[4:]
+
+        #: The FrameData entries as a NumPy structured array sorted by start RVA.
+        self.frame_data = _sorted_entries(np, data, _FRAME_DATA_DTYPE)
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} fpo={len(self.fpo)} "
+                f"frame_data={len(self.frame_data)}>")
+
+    @property
+    def names(self):
+        """The ``/names`` :class:`~pydia2.strtab.StringTable` of the frame programs."""
+        if self._names is None:
+            from .strtab import open_names
+
+            self._names = open_names(self.msf)
+            if self._names is None:
+                raise ValueError("PDB has no /names stream")
+
+        return self._names
+
+    def fpo_entry(self, i):
+        """Decode the :class:`FpoData` at index *i* of :attr:`fpo`."""
+        return FpoData(*(int(value) for value in self.fpo[i].tolist()))
+
+    def frame_data_entry(self, i):
+        """Decode the :class:`FrameData` at index *i* of :attr:`frame_data`."""
+        fields = [int(value) for value in self.frame_data[i].tolist()]
+        return FrameData(*fields, self.names[fields[5]])
+
+    def _to_source(self, rvas):
+        omap = self.dbi.omap
+        return rvas if omap is None else omap.to_source_many(rvas)
+
+    @staticmethod
+    def _indices(np, entries, rvas):
+        """The index in *entries* of the entry covering each of *rvas*, or -1."""
+        if not len(entries):
+            return np.full(rvas.shape, -1, np.int64)
+
+        starts = entries['start'].astype(np.int64)
+        i = starts.searchsorted(rvas, 'right') - 1
+        clipped = np.maximum(i, 0)
+        found = (i >= 0) & (rvas >= 0) & (rvas < starts[clipped] + entries['size'][clipped])
+        return np.where(found, i, -1)
+
+    def lookup(self, rvas):
+        """
+        Find the frame info of all of *rvas* at once.
+
+        Returns a ``(frame_types, indices)`` tuple of NumPy ``int64`` arrays with the shape of
+        *rvas*: the :class:`~pydia2.cvconst.StackFrameType` of each (``StackFrameType.FrameData``
+        for FrameData, ``StackFrameType.Unknown`` without frame info), and the index of the entry in
+        :attr:`frame_data` or :attr:`fpo` respectively.
+        """
+        import numpy as np
+
+        rvas = self._to_source(np.asarray(rvas, dtype=np.int64))
+        frame_data = self._indices(np, self.frame_data, rvas)
+        fpo = self._indices(np, self.fpo, rvas)
+        frame_types = np.full(rvas.shape, StackFrameType.Unknown, np.int64)
+        found = fpo >= 0
+        # The frame type of FPO_DATA is in the top 2 bits of the attributes
+        frame_types[found] = self.fpo['attributes'][fpo[found]] >> 14
+        frame_types[frame_data >= 0] = StackFrameType.FrameData
+        return frame_types, np.where(frame_data >= 0, frame_data, fpo)
+
+    def find(self, rva):
+        """Return the :class:`FrameData` or :class:`FpoData` of *rva*, or ``None``."""
+        frame_types, indices = self.lookup([rva])
+        frame_type, i = int(frame_types[0]), int(indices[0])
+        if frame_type == StackFrameType.Unknown:
+            return None
+
+        if frame_type == StackFrameType.FrameData:
+            return self.frame_data_entry(i)
+
+        return self.fpo_entry(i)
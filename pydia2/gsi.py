@@ -0,0 +1,394 @@
+"""
+Pure Python reader of the global symbol (GSI) and public symbol (PSGSI) streams of PDB files.
+Requires NumPy.
+
+The address map of the publics stream, the offsets of the ``S_PUB32`` records sorted by address, is
+turned into a NumPy array of RVAs once, so that finding the public symbol at or below an RVA is a
+binary search, for one address or many at once.
+
+Both streams have a :class:`NameHash` table which finds symbols by name by hashing the name with
+:func:`name_hash` and only comparing the names of the symbols in its bucket.
+"""
+
+import struct
+from functools import reduce
+from operator import xor
+
+from .cvinfo import LeafKind, SymKind, PUBSYM32
+from .symbols import SymbolRecord, _SYM_KINDS
+
+
+_PUBLICS_HEADER = struct.Struct('<IIIIHHII')
+_HASH_HEADER = struct.Struct('<IIII')
+_HASH_SIGNATURE = 0xffffffff
+_HASH_VERSION = 0xeffe0000 + 19990810
+# The number of hash buckets, there is one more for the bitmap of non empty buckets
+_HASH_BUCKETS = 4096
+# The size of the in memory hash records that the bucket offsets are in units of
+_HASH_RECORD_SIZE = 12
+
+# The offset of the name in the records of the symbol kinds that have a fixed size prefix
+_NAME_OFFSETS = {
+    SymKind.S_PUB32: 14,
+    SymKind.S_GDATA32: 14,
+    SymKind.S_LDATA32: 14,
+    SymKind.S_GTHREAD32: 14,
+    SymKind.S_LTHREAD32: 14,
+    SymKind.S_GMANDATA: 14,
+    SymKind.S_LMANDATA: 14,
+    SymKind.S_PROCREF: 14,
+    SymKind.S_LPROCREF: 14,
+    SymKind.S_DATAREF: 14,
+    SymKind.S_ANNOTATIONREF: 14,
+    SymKind.S_TOKENREF: 14,
+    SymKind.S_UDT: 8,
+    SymKind.S_COBOLUDT: 8,
+}
+# The symbol kinds with the name following a type index and a numeric leaf
+_CONSTANT_KINDS = frozenset({SymKind.S_CONSTANT, SymKind.S_MANCONSTANT})
+
+# The size of the value of the numeric leaves
+_NUMERIC_SIZES = {
+    LeafKind.LF_CHAR: 1, LeafKind.LF_SHORT: 2, LeafKind.LF_USHORT: 2, LeafKind.LF_LONG: 4,
+    LeafKind.LF_ULONG: 4, LeafKind.LF_REAL16: 2, LeafKind.LF_REAL32: 4, LeafKind.LF_REAL48: 6,
+    LeafKind.LF_REAL64: 8, LeafKind.LF_REAL80: 10, LeafKind.LF_REAL128: 16,
+    LeafKind.LF_QUADWORD: 8, LeafKind.LF_UQUADWORD: 8, LeafKind.LF_OCTWORD: 16,
+    LeafKind.LF_UOCTWORD: 16, LeafKind.LF_COMPLEX32: 8, LeafKind.LF_COMPLEX64: 16,
+    LeafKind.LF_COMPLEX80: 20, LeafKind.LF_COMPLEX128: 32, LeafKind.LF_DECIMAL: 16,
+    LeafKind.LF_DATE: 8,
+}
+
+# Stream index of a stream that doesn't exist
+_NIL_STREAM = 0xffff
+
+
+class PublicSymbol:
+    """A public symbol (``S_PUB32`` record)."""
+
+    __slots__ = ('offset', 'flags', 'section', 'section_offset', 'rva', 'name')
+
+    def __init__(self, offset, flags, section, section_offset, rva, name):
+        #: The offset of the record in the symbol record stream.
+        self.offset = offset
+        #: The ``CV_PUBSYMFLAGS`` of the symbol.
+        self.flags = flags
+        #: The section number of the symbol.
+        self.section = section
+        #: The offset of the symbol in its section.
+        self.section_offset = section_offset
+        #: The RVA of the symbol, ``None`` if OMAP doesn't map it.
+        self.rva = rva
+        #: The (Decorated) name of the symbol.
+        self.name = name
+
+    def __repr__(self):
+        rva = 'None' if self.rva is None else f'{self.rva:#x}'
+        return f"<{self.__class__.__name__} rva={rva} name={self.name!r}>"
+
+
+def name_hash(name):
+    """
+    The PDB name hash (``hashStringV1``) of *name* (:class:`str` or :class:`bytes`), as used by
+    the GSI hash tables. It's case insensitive for ASCII letters.
+    """
+    if isinstance(name, str):
+        name = name.encode('utf-8')
+
+    words = len(name) // 4
+    result = reduce(xor, struct.unpack_from(f'<{words}I', name), 0)
+    remainder = len(name) % 4
+    if remainder >= 2:
+        result ^= struct.unpack_from('<H', name, 4 * words)[0]
+
+    if remainder & 1:
+        result ^= name[-1]
+
+    result |= 0x20202020
+    result ^= result >> 11
+    return (result ^ (result >> 16)) & 0xffffffff
+
+
+def _record_name(kind, data):
+    """The name of the symbol record *data* of *kind* as :class:`bytes`, or ``None``."""
+    offset = _NAME_OFFSETS.get(kind)
+    if offset is None:
+        if kind not in _CONSTANT_KINDS:
+            return None
+
+        leaf = struct.unpack_from('<H', data, 8)[0]
+        offset = 10
+        if leaf == LeafKind.LF_VARSTRING:
+            offset += 2 + struct.unpack_from('<H', data, offset)[0]
+        elif leaf >= LeafKind.LF_NUMERIC:
+            size = _NUMERIC_SIZES.get(leaf)
+            if size is None:
+                return None
+
+            offset += size
+
+    end = data.find(b'\0', offset)
+    return data[offset:end if end >= 0 else len(data)]
+
+
+class NameHash:
+    """
+    The name hash table of a GSI, in *data*, of the symbol records in the
+    :class:`~pydia2.msf.MsfStream` *records*.
+    """
+
+    def __init__(self, data, records):
+        import numpy as np
+
+        if len(data) < _HASH_HEADER.size:
+            raise ValueError("GSI hash table is truncated")
+
+        signature, version, records_size, buckets_size = _HASH_HEADER.unpack_from(data)
+        if signature != _HASH_SIGNATURE or version != _HASH_VERSION:
+            raise ValueError(f"Unsupported GSI hash table version: {version:#x}")
+
+        bitmap_size = (_HASH_BUCKETS + 1 + 31) // 32 * 4
+        if (_HASH_HEADER.size + records_size + buckets_size > len(data)
+                or buckets_size < bitmap_size):
+            raise ValueError("GSI hash table is truncated")
+
+        self._records = records
+        # The hash records are (offset + 1, reference count) pairs, grouped by bucket
+        self._offsets = np.frombuffer(
+            data, dtype='<i4', count=records_size // 8 * 2,
+            offset=_HASH_HEADER.size)[::2].astype(np.int64) - 1
+        offset = _HASH_HEADER.size + records_size
+        bitmap = np.frombuffer(data, dtype='<u4', count=bitmap_size // 4, offset=offset)
+        present = np.flatnonzero(
+            (bitmap[:, None] >> np.arange(32, dtype=np.uint32)) & 1)[:_HASH_BUCKETS + 1]
+        starts = np.frombuffer(
+            data, dtype='<u4', count=min(len(present), (buckets_size - bitmap_size) // 4),
+            offset=offset + bitmap_size) // _HASH_RECORD_SIZE
+        # Empty buckets end where the next non empty one starts
+        bucket_starts = np.full(_HASH_BUCKETS + 2, len(self._offsets), dtype=np.int64)
+        bucket_starts[present[:len(starts)]] = starts
+        self._bucket_starts = np.minimum.accumulate(bucket_starts[::-1])[::-1]
+        self._names = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={len(self._offsets)}>"
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def _bucket(self, bucket):
+        """The ``(record, name)`` of the symbols in *bucket*, decoded on first use."""
+        entries = self._names.get(bucket)
+        if entries is None:
+            entries = []
+            first, last = self._bucket_starts[bucket], self._bucket_starts[bucket + 1]
+            for offset in self._offsets[first:last].tolist():
+                length, kind = struct.unpack_from('<HH', self._records.read(offset, 4))
+                data = self._records.read(offset, 2 + length)
+                kind = _SYM_KINDS.get(kind, kind)
+                entries.append((SymbolRecord(offset, kind, data), _record_name(kind, bytes(data))))
+
+            self._names[bucket] = entries
+
+        return entries
+
+    def find(self, name, kinds=None):
+        """
+        Return the list of :class:`~pydia2.symbols.SymbolRecord` of the symbols named *name*
+        (Case sensitive), only the ones of *kinds* (:class:`~pydia2.cvinfo.SymKind` values) if
+        given.
+        """
+        encoded = name.encode('utf-8') if isinstance(name, str) else bytes(name)
+        return [
+            record for record, record_name in self._bucket(name_hash(encoded) % _HASH_BUCKETS)
+            if record_name == encoded and (kinds is None or record.kind in kinds)]
+
+    def lookup(self, names, kinds=None):
+        """Look up each of *names* with :meth:`find`, returning a list of the results."""
+        return [self.find(name, kinds) for name in names]
+
+
+class PublicsStream:
+    """
+    The public symbol stream of the :class:`~pydia2.dbi.DbiStream` *dbi* of the
+    :class:`~pydia2.msf.MsfFile` *msf*.
+    """
+
+    def __init__(self, msf, dbi):
+        if dbi.public_stream_index == _NIL_STREAM:
+            raise ValueError("PDB has no public symbol stream")
+
+        if dbi.symbol_record_stream_index == _NIL_STREAM:
+            raise ValueError("PDB has no symbol record stream")
+
+        self.msf = msf
+        self.dbi = dbi
+        self._stream = msf.stream(dbi.public_stream_index)
+        if len(self._stream) < _PUBLICS_HEADER.size:
+            raise ValueError(f"Stream {dbi.public_stream_index} is not a public symbol stream")
+
+        (self._hash_size, self._address_map_size, self.thunk_count, self.thunk_size,
+            self.thunk_table_section, _, self.thunk_table_offset,
+            self.section_count) = _PUBLICS_HEADER.unpack_from(
+                self._stream.read(0, _PUBLICS_HEADER.size))
+        if _PUBLICS_HEADER.size + self._hash_size + self._address_map_size > len(self._stream):
+            raise ValueError("Public symbol stream is truncated")
+
+        self._records = msf.stream(dbi.symbol_record_stream_index)
+        self._offsets = None
+        self._rvas = None
+        self._name_hash = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={self._address_map_size // 4}>"
+
+    def __len__(self):
+        return len(self.rvas)
+
+    @property
+    def name_hash(self):
+        """The :class:`NameHash` of the public symbols, for finding them by name."""
+        if self._name_hash is None:
+            self._name_hash = NameHash(
+                self._stream.read(_PUBLICS_HEADER.size, self._hash_size), self._records)
+
+        return self._name_hash
+
+    @property
+    def address_map(self):
+        """
+        The offsets of the ``S_PUB32`` records in the symbol record stream, sorted by address, as a
+        NumPy ``uint32`` array.
+        """
+        import numpy as np
+
+        data = self._stream.read(
+            _PUBLICS_HEADER.size + self._hash_size, self._address_map_size // 4 * 4)
+        return np.frombuffer(data, dtype='<u4').astype(np.uint32)
+
+    def _build_index(self):
+        import numpy as np
+
+        offsets = self.address_map
+        if len(offsets) and int(offsets.max()) + PUBSYM32.size > len(self._records):
+            raise ValueError("Public symbol address map refers past the symbol records")
+
+        # Only read the offset and section of each record, the records are 4 byte aligned so that
+        # these don't cross block boundaries, and the other symbol records aren't touched
+        positions = offsets.astype(np.int64)
+        section_offsets = self._records.gather(positions + 8, '<u4').astype(np.int64)
+        sections = self._records.gather(positions + 12, '<u2').astype(np.int64)
+        virtual_addresses = self.dbi._section_virtual_addresses()
+        # Publics in unknown sections (e.g. absolute symbols) have no RVA
+        valid = (sections >= 1) & (sections <= len(virtual_addresses))
+        rvas = virtual_addresses[sections[valid] - 1] + section_offsets[valid]
+        # The address map is sorted by section and offset, which is usually but not necessarily the
+        # RVA order
+        order = np.argsort(rvas, kind='stable')
+        self._offsets = offsets[valid][order]
+        self._rvas = rvas[order]
+
+    @property
+    def rvas(self):
+        """
+        The sorted RVAs of the public symbols as a NumPy ``int64`` array, built on first use. With
+        OMAP these are source RVAs, which :meth:`find` and :meth:`lookup` translate to.
+        """
+        if self._rvas is None:
+            self._build_index()
+
+        return self._rvas
+
+    @property
+    def offsets(self):
+        """The offsets of the records of the public symbols of :attr:`rvas` as a NumPy array."""
+        if self._offsets is None:
+            self._build_index()
+
+        return self._offsets
+
+    def symbol(self, i):
+        """Decode the :class:`PublicSymbol` at index *i* of :attr:`rvas`."""
+        offset = int(self.offsets[i])
+        length = struct.unpack_from('<H', self._records.read(offset, 2))[0]
+        data = bytes(self._records.read(offset, 2 + length))
+        _, _, flags, section_offset, section = PUBSYM32.unpack_from(data)
+        end = data.find(b'\0', PUBSYM32.size)
+        name = data[PUBSYM32.size:end if end >= 0 else len(data)].decode('utf-8', 'replace')
+        rva = int(self.rvas[i])
+        omap = self.dbi.omap
+        if omap is not None:
+            rva = omap.from_source(rva)
+
+        return PublicSymbol(offset, flags, section, section_offset, rva, name)
+
+    def find(self, rva):
+        """
+        Find the nearest public symbol at or below *rva*, returning a ``(symbol, displacement)``
+        tuple of the :class:`PublicSymbol` and the distance of *rva* from it, or ``None``.
+        """
+        omap = self.dbi.omap
+        if omap is not None:
+            rva = omap.to_source(rva)
+            if rva is None:
+                return None
+
+        i = int(self.rvas.searchsorted(rva, 'right')) - 1
+        if i < 0:
+            return None
+
+        return self.symbol(i), rva - int(self.rvas[i])
+
+    def lookup(self, rvas):
+        """
+        Find the nearest public symbols at or below all of *rvas* at once.
+
+        Returns an ``(indices, displacements)`` tuple of NumPy ``int64`` arrays with the shape of
+        *rvas*, of the indices of the symbols for :meth:`symbol`, and the distance of the RVAs from
+        them. Both are -1 for RVAs below the first public symbol.
+        """
+        import numpy as np
+
+        rvas = np.asarray(rvas, dtype=np.int64)
+        if not len(self.rvas):
+            return np.full(rvas.shape, -1, np.int64), np.full(rvas.shape, -1, np.int64)
+
+        omap = self.dbi.omap
+        if omap is not None:
+            rvas = omap.to_source_many(rvas)
+
+        indices = self.rvas.searchsorted(rvas, 'right') - 1
+        indices[rvas < 0] = -1
+        displacements = np.where(indices >= 0, rvas - self.rvas[np.maximum(indices, 0)], -1)
+        return indices, displacements
+
+
+class GlobalsStream:
+    """
+    The global symbol stream of the :class:`~pydia2.dbi.DbiStream` *dbi* of the
+    :class:`~pydia2.msf.MsfFile` *msf*, which indexes the global symbols (e.g. ``S_GDATA32``,
+    ``S_PROCREF``, ``S_UDT``) by name.
+    """
+
+    def __init__(self, msf, dbi):
+        if dbi.global_stream_index == _NIL_STREAM:
+            raise ValueError("PDB has no global symbol stream")
+
+        if dbi.symbol_record_stream_index == _NIL_STREAM:
+            raise ValueError("PDB has no symbol record stream")
+
+        self.msf = msf
+        #: The :class:`NameHash` of the global symbols.
+        self.name_hash = NameHash(
+            msf.stream(dbi.global_stream_index).read(),
+            msf.stream(dbi.symbol_record_stream_index))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={len(self.name_hash)}>"
+
+    def find(self, name, kinds=None):
+        """See :meth:`NameHash.find`."""
+        return self.name_hash.find(name, kinds)
+
+    def lookup(self, names, kinds=None):
+        """See :meth:`NameHash.lookup`."""
+        return self.name_hash.lookup(names, kinds)
@@ -0,0 +1,486 @@
+"""
+Pure Python reader of the C13 line info (``DEBUG_S_LINES`` and ``DEBUG_S_FILECHKSMS``) of the
+modules of PDB files. Requires NumPy.
+
+:class:`LineTables` decodes the line info of each module into parallel NumPy arrays
+(:class:`ModuleLines`), and combines them into one :class:`LineIndex` sorted by RVA for looking up
+many addresses at once.
+
+Files are identified by the ``/names`` offset of their name, as stored in the file checksums.
+
+:attr:`LineTables.source_index` is the reverse :class:`SourceIndex`, from source file and line to
+RVA ranges.
+"""
+
+import os
+import struct
+import ntpath
+
+from . import cvinfo
+from .cvinfo import DebugSubsectionKind
+
+
+# CV_DebugSLinesHeader_t.flags
+_CV_LINES_HAVE_COLUMNS = 0x0001
+
+_FILE_CHECKSUM = struct.Struct('<IBB')
+
+# Line numbers from this one on (e.g. 0xfeefee) mark code that doesn't belong to a source line
+_SPECIAL_LINE = 0xf00f00
+
+
+def normalize_path(path):
+    """
+    Normalize the source file path *path* the way :class:`SourceIndex` keys files, as a case
+    insensitive Windows path.
+    """
+    return ntpath.normcase(ntpath.normpath(os.fspath(path)))
+
+
+class ModuleLines:
+    """
+    The line info of a module as parallel NumPy arrays, one entry per line record, sorted by
+    :attr:`starts`. With OMAP the RVAs are source RVAs, see :mod:`pydia2.omap`.
+    """
+
+    def __init__(self, module, starts, ends, files, lines, columns):
+        #: The index of the module.
+        self.module = module
+        #: The start RVAs of the line records.
+        self.starts = starts
+        #: The end RVAs (Exclusive) of the line records.
+        self.ends = ends
+        #: The ``/names`` offsets of the file names.
+        self.files = files
+        #: The line numbers.
+        self.lines = lines
+        #: The start columns, or 0 if the module has no column info.
+        self.columns = columns
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} module={self.module} count={len(self)}>"
+
+    def __len__(self):
+        return len(self.starts)
+
+
+class LineIndex(ModuleLines):
+    """
+    The line info of many modules combined into one index sorted by RVA, see
+    :attr:`LineTables.index`. :attr:`module` holds the module index of each entry. Line records
+    with special line numbers (e.g. ``0xfeefee`` for hidden code) are left out.
+
+    If the :class:`~pydia2.omap.Omap` *omap* is given, the RVAs looked up are translated with it
+    first, :attr:`starts` and :attr:`ends` are source RVAs.
+    """
+
+    def __init__(self, module, starts, ends, files, lines, columns, omap=None):
+        super().__init__(module, starts, ends, files, lines, columns)
+        #: The :class:`~pydia2.omap.Omap` that the RVAs looked up are translated with, or ``None``.
+        self.omap = omap
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={len(self)}>"
+
+    def find(self, rva):
+        """Return the ``(file, line, column)`` of *rva*, or ``None`` if it has no line info."""
+        if self.omap is not None:
+            rva = self.omap.to_source(rva)
+            if rva is None:
+                return None
+
+        i = int(self.starts.searchsorted(rva, 'right')) - 1
+        if i < 0 or rva >= self.ends[i]:
+            return None
+
+        return int(self.files[i]), int(self.lines[i]), int(self.columns[i])
+
+    def lookup(self, rvas):
+        """
+        Look up the line info of all of *rvas* at once.
+
+        Returns a ``(files, lines, columns)`` tuple of NumPy ``int64`` arrays with the shape of
+        *rvas*, with -1 in all three for RVAs without line info.
+        """
+        import numpy as np
+
+        rvas = np.asarray(rvas, dtype=np.int64)
+        if not len(self):
+            return tuple(np.full(rvas.shape, -1, np.int64) for _ in range(3))
+
+        if self.omap is not None:
+            rvas = self.omap.to_source_many(rvas)
+
+        i = self.starts.searchsorted(rvas, 'right') - 1
+        clipped = np.maximum(i, 0)
+        found = (i >= 0) & (rvas >= 0) & (rvas < self.ends[clipped])
+        return tuple(
+            np.where(found, array[clipped].astype(np.int64), -1)
+            for array in (self.files, self.lines, self.columns))
+
+
+class SourceLines:
+    """
+    The line records of a source file as parallel NumPy arrays, sorted by :attr:`lines`, see
+    :meth:`SourceIndex.source_lines`.
+    """
+
+    def __init__(self, path, lines, starts, ends, modules):
+        #: The normalized path of the file.
+        self.path = path
+        #: The line numbers.
+        self.lines = lines
+        #: The start RVAs of the line records.
+        self.starts = starts
+        #: The end RVAs (Exclusive) of the line records.
+        self.ends = ends
+        #: The module indices of the line records.
+        self.modules = modules
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path!r} count={len(self)}>"
+
+    def __len__(self):
+        return len(self.lines)
+
+    def find(self, line):
+        """Return the list of ``(start, end)`` RVA ranges of *line*."""
+        first = int(self.lines.searchsorted(line, 'left'))
+        last = int(self.lines.searchsorted(line, 'right'))
+        return [(int(start), int(end))
+                for start, end in zip(self.starts[first:last], self.ends[first:last])]
+
+
+class SourceIndex:
+    """
+    The reverse of the line info of :class:`LineTables` *tables*, from source file and line to RVA
+    ranges, with the file names from the ``/names`` :class:`~pydia2.strtab.StringTable` *names*.
+    See :attr:`LineTables.source_index`.
+
+    Files are keyed by :func:`normalize_path`. The line info of a module is only decoded when one of
+    its source files (As listed by :attr:`pydia2.dbi.DbiStream.source_files`) is first looked up.
+    With OMAP, the ranges are translated to RVAs of the binary.
+    """
+
+    def __init__(self, tables, names):
+        self.tables = tables
+        self.names = names
+        self._file_modules = None
+        self._module_files = {}
+        self._files = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} files={len(self._files)}>"
+
+    def _modules_of(self, path):
+        """The modules that may have line info for the normalized *path*."""
+        if self._file_modules is None:
+            file_modules = {}
+            normalized = {}
+            for module, files in zip(self.tables.dbi.modules, self.tables.dbi.source_files):
+                for name in files:
+                    key = normalized.get(name)
+                    if key is None:
+                        key = normalized[name] = normalize_path(name)
+
+                    modules = file_modules.setdefault(key, [])
+                    if not modules or modules[-1] is not module:
+                        modules.append(module)
+
+            self._file_modules = file_modules
+
+        if not self._file_modules:
+            # Without source info any module may have line info for any file
+            return self.tables.dbi.modules
+
+        return self._file_modules.get(path, ())
+
+    def _files_of(self, module):
+        """The ``{path: (lines, starts, ends)}`` of the line records of *module*, sorted by line."""
+        files = self._module_files.get(module.index)
+        if files is None:
+            import numpy as np
+
+            table = self.tables.module_lines(module)
+            valid = table.lines < _SPECIAL_LINE
+            lines = table.lines[valid]
+            starts = table.starts[valid]
+            ends = table.ends[valid]
+            offsets, inverse = np.unique(table.files[valid], return_inverse=True)
+            order = np.lexsort((starts, lines, inverse))
+            bounds = inverse[order].searchsorted(np.arange(len(offsets) + 1))
+
+            files = {}
+            for i, name in enumerate(self.names.strings(offsets)):
+                selected = order[bounds[i]:bounds[i + 1]]
+                files[normalize_path(name)] = (lines[selected], starts[selected], ends[selected])
+
+            self._module_files[module.index] = files
+
+        return files
+
+    def source_lines(self, path):
+        """Return the :class:`SourceLines` of the source file *path*, empty if it's unknown."""
+        import numpy as np
+
+        path = normalize_path(path)
+        source = self._files.get(path)
+        if source is None:
+            parts = []
+            for module in self._modules_of(path):
+                arrays = self._files_of(module).get(path)
+                if arrays is not None:
+                    parts.append(arrays + (np.full(len(arrays[0]), module.index, np.uint32),))
+
+            if parts:
+                lines, starts, ends, modules = (np.concatenate(arrays) for arrays in zip(*parts))
+                omap = self.tables.dbi.omap
+                if omap is not None:
+                    # The line info has source RVAs, leave out the lines whose code was removed
+                    starts = omap.from_source_many(starts)
+                    ends = omap.from_source_many(ends - 1) + 1
+                    mapped = (starts >= 0) & (ends > starts)
+                    lines, starts, ends, modules = (
+                        lines[mapped], starts[mapped], ends[mapped], modules[mapped])
+
+                order = np.lexsort((starts, lines))
+                source = SourceLines(
+                    path, lines[order], starts[order], ends[order], modules[order])
+            else:
+                source = SourceLines(
+                    path, np.zeros(0, np.uint32), np.zeros(0, np.int64), np.zeros(0, np.int64),
+                    np.zeros(0, np.uint32))
+
+            self._files[path] = source
+
+        return source
+
+    def find(self, path, line):
+        """Return the list of ``(start, end)`` RVA ranges of *line* of the source file *path*."""
+        return self.source_lines(path).find(line)
+
+    def lookup(self, paths, lines):
+        """
+        Look up the RVA ranges of many source lines at once, e.g. all the lines of a coverage
+        report. *paths* is either the path of the source file of all of *lines*, or a sequence of
+        paths with one for each of *lines*.
+
+        Returns a ``(queries, starts, ends)`` tuple of NumPy ``int64`` arrays with one entry for
+        each RVA range found, where ``queries`` is the index in *lines* that the range belongs to.
+        The ranges are ordered by query.
+        """
+        import numpy as np
+
+        lines = np.asarray(lines, dtype=np.int64).ravel()
+        if isinstance(paths, (str, os.PathLike)):
+            groups = [(paths, np.arange(len(lines)))]
+        else:
+            unique, inverse = np.unique(np.asarray(paths, dtype=str), return_inverse=True)
+            if len(inverse) != len(lines):
+                raise ValueError("paths and lines have different lengths")
+
+            order = np.argsort(inverse, kind='stable')
+            bounds = inverse[order].searchsorted(np.arange(len(unique) + 1))
+            groups = [(path, order[bounds[i]:bounds[i + 1]]) for i, path in enumerate(unique)]
+
+        results = [(np.zeros(0, np.int64),) * 3]
+        for path, queries in groups:
+            source = self.source_lines(path)
+            first = source.lines.searchsorted(lines[queries], 'left')
+            counts = source.lines.searchsorted(lines[queries], 'right') - first
+            # The index of each range: the first one of its query plus its position within it
+            total = int(counts.sum())
+            ranges = np.repeat(first - (np.cumsum(counts) - counts), counts) + np.arange(total)
+            results.append((np.repeat(queries, counts).astype(np.int64),
+                            source.starts[ranges].astype(np.int64),
+                            source.ends[ranges].astype(np.int64)))
+
+        queries, starts, ends = (np.concatenate(arrays) for arrays in zip(*results))
+        order = np.argsort(queries, kind='stable')
+        return queries[order], starts[order], ends[order]
+
+
+def _iter_subsections(data):
+    """Iterate the ``(kind, data)`` of the C13 subsections in *data*."""
+    header = cvinfo.CV_DebugSSubsectionHeader_t
+    pos = 0
+    while pos + header.size <= len(data):
+        kind, length = header.unpack_from(data, pos)
+        pos += header.size
+        if length < 0 or pos + length > len(data):
+            raise ValueError("C13 subsection is out of bounds")
+
+        if not kind & DebugSubsectionKind.DEBUG_S_IGNORE:
+            yield kind, data[pos:pos + length]
+
+        pos = (pos + length + 3) & ~3
+
+
+def _parse_file_checksums(data):
+    """Map the offsets of the file checksum entries in *data* to the ``/names`` offsets."""
+    files = {}
+    pos = 0
+    while pos + _FILE_CHECKSUM.size <= len(data):
+        name, checksum_size, _ = _FILE_CHECKSUM.unpack_from(data, pos)
+        files[pos] = name
+        pos = (pos + _FILE_CHECKSUM.size + checksum_size + 3) & ~3
+
+    return files
+
+
+def _parse_lines(np, data, section_addresses, files):
+    """Parse a ``DEBUG_S_LINES`` subsection into (starts, ends, files, lines, columns) arrays."""
+    header = cvinfo.CV_DebugSLinesHeader_t
+    block_header = cvinfo.CV_DebugSLinesFileBlockHeader_t
+    offset, section, flags, size = header.unpack_from(data)
+    if not 1 <= section <= len(section_addresses):
+        return None
+
+    has_columns = flags & _CV_LINES_HAVE_COLUMNS
+    blocks = []
+    pos = header.size
+    while pos + block_header.size <= len(data):
+        file, count, block_size = block_header.unpack_from(data, pos)
+        if file not in files:
+            raise ValueError(f"Line block refers to unknown file checksum offset {file:#x}")
+
+        entries = np.frombuffer(
+            data, dtype='<u4', count=2 * count, offset=pos + block_header.size).reshape(-1, 2)
+        if has_columns:
+            columns = np.frombuffer(
+                data, dtype='<u2', count=2 * count,
+                offset=pos + block_header.size + 8 * count).reshape(-1, 2)[:, 0]
+        else:
+            columns = np.zeros(count, dtype=np.uint16)
+
+        blocks.append((
+            entries[:, 0], np.full(count, files[file], dtype=np.uint32),
+            entries[:, 1] & 0xffffff, columns))
+        pos += block_size
+
+    if not blocks:
+        return None
+
+    starts, file_names, lines, columns = (np.concatenate(arrays) for arrays in zip(*blocks))
+    order = np.argsort(starts, kind='stable')
+    starts = starts[order].astype(np.int64)
+    # A line record extends up to the next one, the last one up to the end of the contribution
+    ends = np.append(starts[1:], size)
+    base = int(section_addresses[section - 1]) + offset
+    return (starts + base, ends + base, file_names[order], lines[order].astype(np.uint32),
+            columns[order].astype(np.uint16))
+
+
+class LineTables:
+    """
+    The line info of the modules of the :class:`~pydia2.dbi.DbiStream` *dbi* of the
+    :class:`~pydia2.msf.MsfFile` *msf*, decoded on first use.
+
+    *names* is the ``/names`` :class:`~pydia2.strtab.StringTable` for the file names, opened on
+    first use if not given.
+    """
+
+    def __init__(self, msf, dbi, names=None):
+        self.msf = msf
+        self.dbi = dbi
+        self._names = names
+        self._section_addresses = None
+        self._index = None
+        self._source_index = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} modules={len(self.dbi.modules)}>"
+
+    def module_lines(self, module):
+        """Decode the :class:`ModuleLines` of the :class:`~pydia2.dbi.ModuleInfo` *module*."""
+        import numpy as np
+
+        if self._section_addresses is None:
+            self._section_addresses = self.dbi._section_virtual_addresses()
+
+        tables = []
+        if module.symbol_stream is not None and module.c13_byte_size:
+            data = self.msf.stream(module.symbol_stream).read(
+                module.symbol_byte_size + module.c11_byte_size, module.c13_byte_size)
+            subsections = list(_iter_subsections(data))
+            files = {}
+            for kind, subsection in subsections:
+                if kind == DebugSubsectionKind.DEBUG_S_FILECHKSMS:
+                    files = _parse_file_checksums(subsection)
+
+            for kind, subsection in subsections:
+                if kind == DebugSubsectionKind.DEBUG_S_LINES:
+                    table = _parse_lines(np, subsection, self._section_addresses, files)
+                    if table is not None:
+                        tables.append(table)
+
+        if not tables:
+            return ModuleLines(
+                module.index, np.zeros(0, np.int64), np.zeros(0, np.int64),
+                np.zeros(0, np.uint32), np.zeros(0, np.uint32), np.zeros(0, np.uint16))
+
+        starts, ends, files, lines, columns = (np.concatenate(arrays) for arrays in zip(*tables))
+        order = np.argsort(starts, kind='stable')
+        return ModuleLines(
+            module.index, starts[order], ends[order], files[order], lines[order], columns[order])
+
+    @property
+    def index(self):
+        """The :class:`LineIndex` of all modules, built on first access."""
+        if self._index is None:
+            import numpy as np
+
+            tables = [self.module_lines(module) for module in self.dbi.modules]
+            tables = [table for table in tables if len(table)]
+            if tables:
+                modules = np.concatenate([
+                    np.full(len(table), table.module, dtype=np.uint32) for table in tables])
+                arrays = [
+                    np.concatenate([getattr(table, name) for table in tables])
+                    for name in ('starts', 'ends', 'files', 'lines', 'columns')]
+            else:
+                modules = np.zeros(0, np.uint32)
+                arrays = [np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.uint32),
+                          np.zeros(0, np.uint32), np.zeros(0, np.uint16)]
+
+            # Code at special line numbers (e.g. 0xfeefee) has no line info, like in SourceIndex
+            valid = arrays[3] < _SPECIAL_LINE
+            modules = modules[valid]
+            arrays = [array[valid] for array in arrays]
+            order = np.argsort(arrays[0], kind='stable')
+            self._index = LineIndex(
+                modules[order], *(array[order] for array in arrays), omap=self.dbi.omap)
+
+        return self._index
+
+    @property
+    def names(self):
+        """The ``/names`` :class:`~pydia2.strtab.StringTable` of the file names."""
+        if self._names is None:
+            from .strtab import open_names
+
+            self._names = open_names(self.msf)
+            if self._names is None:
+                raise ValueError("PDB has no /names stream")
+
+        return self._names
+
+    def file_names(self, files):
+        """
+        Decode the file names of *files*, an array of ``/names`` offsets (e.g. from
+        :meth:`LineIndex.lookup`), into a list with ``None`` for the -1 of missing line info.
+        """
+        import numpy as np
+
+        files = np.asarray(files, dtype=np.int64).ravel()
+        found = files >= 0
+        names = iter(self.names.strings(files[found]))
+        return [next(names) if file_found else None for file_found in found.tolist()]
+
+    @property
+    def source_index(self):
+        """The reverse :class:`SourceIndex`, from source file and line to RVA ranges."""
+        if self._source_index is None:
+            self._source_index = SourceIndex(self, self.names)
+
+        return self._source_index
@@ -0,0 +1,485 @@
+"""
+Reader for the MSF (Multi-Stream File) container of PDB files, the "BigMsf" (MSF 7.00) variant.
+
+This is pure Python and doesn't use DIA, so it also works on platforms other than Windows. Files
+opened by path are mapped with :mod:`mmap`, in memory buffers are used in place, and file objects
+are read through a bounded :class:`BlockCache`, so a PDB doesn't need to be written to disk first.
+Only the superblock and stream directory are parsed on open, stream data is only touched when read.
+"""
+
+import os
+import sys
+import mmap
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+
+
+#: The magic at the start of an MSF 7.00 file.
+MAGIC = b"Microsoft C/C++ MSF 7.00\r\n\x1aDS\0\0\0"
+
+_SUPERBLOCK = struct.Struct('<32sIIIIII')
+_U32 = struct.Struct('<I')
+
+# Size of a stream that doesn't exist (Deleted or never written)
+_NIL_STREAM_SIZE = 0xffffffff
+
+
+def _u32_array(view):
+    """View little endian u32s in *view* as an indexable sequence, without copying if possible."""
+    if sys.byteorder == 'little':
+        return view.cast('I')
+
+    result = array('I', bytes(view))
+    result.byteswap()
+    return result
+
+
+#: The default byte budget of the :class:`BlockCache` of file objects.
+DEFAULT_CACHE_SIZE = 32 * 1024 * 1024
+
+
+def _block_count(size, block_size):
+    return (size + block_size - 1) // block_size
+
+
+class BlockCache:
+    """
+    An LRU cache of the blocks of an MSF file read from the binary file object *file*, holding at
+    most *max_bytes* bytes of blocks (But always at least one block).
+
+    This is used for file objects that can't be memory mapped, the :attr:`hits`, :attr:`misses` and
+    :attr:`evictions` counters tell how well it works for an access pattern.
+    """
+
+    def __init__(self, file, block_size, max_bytes=DEFAULT_CACHE_SIZE):
+        self._file = file
+        self._lock = threading.Lock()
+        self._blocks = OrderedDict()
+        self.block_size = block_size
+        #: The byte budget of the cache.
+        self.max_bytes = max_bytes
+        #: The number of bytes of blocks currently cached.
+        self.size = 0
+        #: The number of block reads served from the cache.
+        self.hits = 0
+        #: The number of block reads that had to read the file.
+        self.misses = 0
+        #: The number of blocks evicted to stay within :attr:`max_bytes`.
+        self.evictions = 0
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} size={self.size} max_bytes={self.max_bytes} "
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions}>")
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def get(self, block):
+        """Return the contents of *block* as :class:`bytes`, reading it from the file if needed."""
+        with self._lock:
+            data = self._blocks.get(block)
+            if data is not None:
+                self._blocks.move_to_end(block)
+                self.hits += 1
+                return data
+
+            self.misses += 1
+            self._file.seek(block * self.block_size)
+            data = self._file.read(self.block_size)
+            if len(data) != self.block_size:
+                raise ValueError("MSF file is truncated")
+
+            while self._blocks and self.size + len(data) > self.max_bytes:
+                _, evicted = self._blocks.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+            self._blocks[block] = data
+            self.size += len(data)
+            return data
+
+    def clear(self):
+        """Drop all cached blocks, the counters are kept."""
+        with self._lock:
+            self._blocks.clear()
+            self.size = 0
+
+
+class MsfStream:
+    """
+    A stream of an :class:`MsfFile`, get one using :meth:`MsfFile.stream`.
+
+    Reads return a :class:`memoryview` into the file when the requested range lies in contiguous
+    blocks (Or in a single block for file objects), and only copy (Stitch the blocks together) when
+    it doesn't.
+    """
+
+    def __init__(self, msf, index, size, blocks):
+        #: The :class:`MsfFile` this stream belongs to.
+        self.msf = msf
+        #: The index of the stream.
+        self.index = index
+        #: The size of the stream in bytes.
+        self.size = size
+        #: The block numbers of the stream.
+        self.blocks = blocks
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} index={self.index} size={self.size}>"
+
+    def __len__(self):
+        return self.size
+
+    def read(self, offset=0, size=None):
+        """
+        Read *size* bytes (Up to the end of the stream by default) at *offset* as a
+        :class:`memoryview`.
+        """
+        if size is None:
+            size = self.size - offset
+
+        if offset < 0 or size < 0 or offset + size > self.size:
+            raise ValueError(
+                f"Read of {size} bytes at offset {offset} is out of bounds for stream {self.index} "
+                f"of size {self.size}")
+
+        if size == 0:
+            return memoryview(b'')
+
+        return self.msf._read_blocks(self.blocks, offset, size)
+
+    def gather(self, offsets, dtype):
+        """
+        Read a value of the NumPy *dtype* at each of *offsets* (Typically spread over the stream) as
+        a NumPy array, only touching the blocks of the values. Values may not cross block
+        boundaries, which holds for naturally aligned ones. Requires NumPy.
+        """
+        import numpy as np
+
+        offsets = np.asarray(offsets, dtype=np.int64)
+        itemsize = np.dtype(dtype).itemsize
+        bs = self.msf.block_size
+        if offsets.size and (offsets.min() < 0 or offsets.max() + itemsize > self.size):
+            raise ValueError(f"Gather from stream {self.index} is out of bounds")
+
+        if ((offsets % bs) + itemsize > bs).any():
+            raise ValueError(f"Gathered values cross block boundaries in stream {self.index}")
+
+        blocks = np.asarray(self.blocks, dtype=np.int64)[offsets // bs]
+        return self.msf._gather_blocks(blocks, offsets % bs, dtype)
+
+    def is_contiguous(self, offset=0, size=None):
+        """Whether reading *size* bytes at *offset* doesn't need to copy."""
+        if size is None:
+            size = self.size - offset
+
+        if size == 0:
+            return True
+
+        return self.msf._is_zero_copy(self.blocks, offset, size)
+
+
+class MsfFile:
+    """
+    An MSF 7.00 file (e.g. a PDB) opened from *source*, which is one of:
+
+    * A path (:class:`str` or :class:`os.PathLike`), which is memory mapped.
+    * A :class:`bytes`, :class:`bytearray` or :class:`memoryview` (Or any other object supporting
+      the buffer protocol), which is read in place.
+    * A seekable binary file object, which is read block by block through a :class:`BlockCache` of
+      *cache_size* bytes.
+
+    If *track_reads* is true, the blocks read are recorded for :attr:`bytes_read`.
+
+    File objects and buffers are not closed or released by :meth:`close`.
+
+    Note that :class:`memoryview` objects returned by reads reference the mapping of the file, if
+    any are still alive on :meth:`close` the mapping is only unmapped once they are garbage
+    collected.
+    """
+
+    def __init__(self, source, cache_size=DEFAULT_CACHE_SIZE, track_reads=False):
+        self._file = None
+        self._mmap = None
+        self._data = None
+        # The superblock is always read
+        self._read_block_set = {0} if track_reads else None
+        #: The :class:`BlockCache` used when reading from a file object, otherwise ``None``.
+        self.cache = None
+
+        if hasattr(source, 'read'):
+            self._open_file_object(source, cache_size)
+        elif isinstance(source, (str, os.PathLike)):
+            self._open_path(source)
+        else:
+            self._open_buffer(source)
+
+        try:
+            self._load_directory()
+        except BaseException:
+            self.close()
+            raise
+
+    def _open_path(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            self._file.close()
+            raise ValueError(f"{path!r} is not an MSF 7.00 file") from None
+
+        self._data = memoryview(self._mmap)
+        try:
+            self._load_superblock(self._data[:_SUPERBLOCK.size], len(self._data))
+        except BaseException:
+            self.close()
+            raise
+
+    def _open_buffer(self, buffer):
+        self._data = memoryview(buffer).cast('B')
+        self._load_superblock(self._data[:_SUPERBLOCK.size], len(self._data))
+
+    def _open_file_object(self, file, cache_size):
+        if not file.seekable():
+            raise ValueError("MSF file objects must be seekable")
+
+        file.seek(0)
+        superblock = file.read(_SUPERBLOCK.size)
+        file_size = file.seek(0, 2)
+        self._load_superblock(superblock, file_size)
+        self.cache = BlockCache(file, self.block_size, cache_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the file."""
+        self._block_map = self._stream_sizes = None
+        if self.cache is not None:
+            self.cache.clear()
+            self.cache = None
+
+        if self._data is not None:
+            self._data.release()
+            self._data = None
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    # Views returned by reads are still alive, the mapping is closed when they are
+                    # freed
+                    pass
+                self._mmap = None
+            if self._file is not None:
+                self._file.close()
+
+    @property
+    def bytes_read(self):
+        """
+        The number of bytes of the distinct blocks read so far, or ``None`` if the file wasn't
+        opened with *track_reads*.
+        """
+        if self._read_block_set is None:
+            return None
+
+        return len(self._read_block_set) * self.block_size
+
+    def _load_superblock(self, superblock, file_size):
+        if len(superblock) < _SUPERBLOCK.size:
+            raise ValueError("Not an MSF 7.00 file")
+
+        (magic, self.block_size, self.free_block_map_block, self.num_blocks,
+            self.num_directory_bytes, _, self.block_map_addr) = _SUPERBLOCK.unpack_from(superblock)
+
+        if magic != MAGIC:
+            raise ValueError("Not an MSF 7.00 file")
+
+        if self.block_size not in (512, 1024, 2048, 4096, 8192, 16384, 32768):
+            raise ValueError(f"Invalid MSF block size: {self.block_size}")
+
+        if self.num_blocks * self.block_size > file_size:
+            raise ValueError("MSF file is truncated")
+
+    def _check_blocks(self, blocks, what):
+        if blocks and max(blocks) >= self.num_blocks:
+            raise ValueError(f"Block {max(blocks)} of {what} is out of the MSF file")
+
+    def _load_directory(self):
+        if self.num_directory_bytes < 4:
+            raise ValueError("MSF stream directory is truncated")
+
+        # The block map is the list of the blocks of the stream directory
+        bs = self.block_size
+        num_directory_blocks = _block_count(self.num_directory_bytes, bs)
+        if self.block_map_addr + _block_count(num_directory_blocks * 4, bs) > self.num_blocks:
+            raise ValueError(f"MSF block map at block {self.block_map_addr} is out of the file")
+
+        block_map_blocks = range(self.block_map_addr, self.num_blocks)
+        self._block_map = _u32_array(
+            self._read_blocks(block_map_blocks, 0, num_directory_blocks * 4))
+        self._check_blocks(self._block_map, "the MSF stream directory")
+
+        # Only the stream sizes are read now, the block list of a stream is read on first use, so
+        # opening a file only touches the start of a large directory
+        #: The number of streams in the file.
+        self.num_streams = _U32.unpack_from(self._read_blocks(self._block_map, 0, 4))[0]
+        if 4 + self.num_streams * 4 > self.num_directory_bytes:
+            raise ValueError("MSF stream directory is truncated")
+
+        self._stream_sizes = _u32_array(
+            self._read_blocks(self._block_map, 4, self.num_streams * 4))
+        # Offsets of the block list of each stream in the directory, filled in on first use
+        self._stream_block_offsets = None
+
+    def stream_size(self, index):
+        """The size of stream *index*, 0 for nil streams."""
+        size = self._stream_sizes[index]
+        return 0 if size == _NIL_STREAM_SIZE else size
+
+    def stream(self, index):
+        """Return the :class:`MsfStream` of stream *index*."""
+        if not 0 <= index < self.num_streams:
+            raise IndexError(f"Stream index {index} out of range (0-{self.num_streams - 1})")
+
+        if self._stream_block_offsets is None:
+            bs = self.block_size
+            offsets = array('Q', bytes(8 * self.num_streams))
+            offset = 4 + self.num_streams * 4
+            for i in range(self.num_streams):
+                offsets[i] = offset
+                offset += _block_count(self.stream_size(i), bs) * 4
+            self._stream_block_offsets = offsets
+
+        size = self.stream_size(index)
+        offset = self._stream_block_offsets[index]
+        blocks_size = _block_count(size, self.block_size) * 4
+        if offset + blocks_size > self.num_directory_bytes:
+            raise ValueError(f"Block list of stream {index} is out of the MSF stream directory")
+
+        if blocks_size:
+            blocks = _u32_array(self._read_blocks(self._block_map, offset, blocks_size))
+            self._check_blocks(blocks, f"stream {index}")
+        else:
+            blocks = ()
+
+        return MsfStream(self, index, size, blocks)
+
+    def _contiguous_run(self, blocks, offset, size):
+        """The file offset of stream range (*offset*, *size*) if it's contiguous, otherwise None."""
+        bs = self.block_size
+        first = offset // bs
+        last = (offset + size - 1) // bs
+        start_block = blocks[first]
+        for i in range(first + 1, last + 1):
+            if blocks[i] != start_block + (i - first):
+                return None
+
+        return start_block * bs + offset % bs
+
+    def _is_zero_copy(self, blocks, offset, size):
+        if self.cache is not None:
+            return offset // self.block_size == (offset + size - 1) // self.block_size
+
+        return self._contiguous_run(blocks, offset, size) is not None
+
+    def _read_blocks(self, blocks, offset, size):
+        if self._read_block_set is not None:
+            bs = self.block_size
+            self._read_block_set.update(blocks[offset // bs:(offset + size - 1) // bs + 1])
+
+        if self.cache is not None:
+            return self._read_cached_blocks(blocks, offset, size)
+
+        file_offset = self._contiguous_run(blocks, offset, size)
+        if file_offset is not None:
+            data = self._data[file_offset:file_offset + size]
+            if len(data) != size:
+                raise ValueError("MSF file is truncated")
+
+            return data
+
+        # Stitch the blocks together, copying runs of contiguous blocks at once
+        bs = self.block_size
+        result = bytearray(size)
+        pos = 0
+        i = offset // bs
+        block_offset = offset % bs
+        while pos < size:
+            start_block = blocks[i]
+            count = 1
+            while (count * bs - block_offset < size - pos
+                    and blocks[i + count] == start_block + count):
+                count += 1
+
+            run_size = min(count * bs - block_offset, size - pos)
+            file_offset = start_block * bs + block_offset
+            data = self._data[file_offset:file_offset + run_size]
+            if len(data) != run_size:
+                raise ValueError("MSF file is truncated")
+
+            result[pos:pos + run_size] = data
+            pos += run_size
+            i += count
+            block_offset = 0
+
+        return memoryview(result)
+
+    def _read_cached_blocks(self, blocks, offset, size):
+        bs = self.block_size
+        i = offset // bs
+        block_offset = offset % bs
+        if block_offset + size <= bs:
+            return memoryview(self.cache.get(blocks[i]))[block_offset:block_offset + size]
+
+        result = bytearray(size)
+        pos = 0
+        while pos < size:
+            run_size = min(bs - block_offset, size - pos)
+            result[pos:pos + run_size] = \
+                memoryview(self.cache.get(blocks[i]))[block_offset:block_offset + run_size]
+            pos += run_size
+            i += 1
+            block_offset = 0
+
+        return memoryview(result)
+
+    def _gather_blocks(self, blocks, block_offsets, dtype):
+        """Read a value of *dtype* at each of *block_offsets* of *blocks* (NumPy arrays)."""
+        import numpy as np
+
+        bs = self.block_size
+        if self._read_block_set is not None or self.cache is not None:
+            unique, inverse = np.unique(blocks, return_inverse=True)
+            if self._read_block_set is not None:
+                self._read_block_set.update(unique.tolist())
+
+        itemsize = np.dtype(dtype).itemsize
+        columns = np.arange(itemsize)
+        if self.cache is None:
+            data = np.frombuffer(self._data, dtype=np.uint8)
+            values = data[(blocks * bs + block_offsets)[:, None] + columns]
+            return values.view(dtype).reshape(-1)
+
+        # Read the blocks in batches that fit the budget of the cache, not all of them at once
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind='stable')
+        sorted_inverse = inverse[order]
+        batch = max(1, self.cache.max_bytes // bs)
+        values = np.empty((len(inverse), itemsize), dtype=np.uint8)
+        for start in range(0, len(unique), batch):
+            data = np.frombuffer(
+                b''.join([self.cache.get(block) for block in unique[start:start + batch].tolist()]),
+                dtype=np.uint8)
+            lo, hi = sorted_inverse.searchsorted([start, start + batch]).tolist()
+            selected = order[lo:hi]
+            positions = (inverse[selected] - start) * bs + block_offsets[selected]
+            values[selected] = data[positions[:, None] + columns]
+
+        return values.view(dtype).reshape(-1)
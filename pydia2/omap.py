@@ -0,0 +1,127 @@
+"""
+Pure Python reader of the OMAP tables of PDB files of post-link optimized binaries (e.g. by
+BBT/PGO tools that reorder code). Requires NumPy.
+
+The debug info of such a PDB describes the binary as it was linked (The *source* address space),
+while the binary itself (And so the addresses of a running process or a crash dump) is laid out
+differently. The ``OMAP_TO_SRC`` table maps the RVAs of the binary to the source RVAs, and
+``OMAP_FROM_SRC`` the other way. The RVA lookups of this package (e.g.
+:meth:`pydia2.dbi.ContributionIndex.modules_at`) apply them automatically when a PDB has them.
+"""
+
+
+class OmapTable:
+    """
+    An OMAP table, mapping ranges of RVAs starting at :attr:`sources` to :attr:`targets`.
+
+    An RVA maps to the target of the last entry with a source at or below it, plus its distance
+    from that source. RVAs below the first entry, or in entries with a target of 0, aren't mapped
+    (e.g. code that was removed).
+    """
+
+    def __init__(self, sources, targets):
+        #: The sorted source RVAs of the entries.
+        self.sources = sources
+        #: The target RVAs of the entries, 0 for unmapped ones.
+        self.targets = targets
+
+    @classmethod
+    def from_stream(cls, stream):
+        """Read an OMAP table from the :class:`~pydia2.msf.MsfStream` *stream*."""
+        import numpy as np
+
+        data = stream.read()
+        entries = np.frombuffer(
+            data, dtype='<u4', count=len(data) // 8 * 2).reshape(-1, 2).astype(np.int64)
+        sources, targets = entries[:, 0], entries[:, 1]
+        if (sources[1:] < sources[:-1]).any():
+            order = np.argsort(sources, kind='stable')
+            sources, targets = sources[order], targets[order]
+
+        return cls(sources, targets)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={len(self)}>"
+
+    def __len__(self):
+        return len(self.sources)
+
+    def find(self, rva):
+        """Translate *rva*, returning ``None`` if it isn't mapped."""
+        if rva < 0:
+            return None
+
+        i = int(self.sources.searchsorted(rva, 'right')) - 1
+        if i < 0 or not self.targets[i]:
+            return None
+
+        return int(self.targets[i]) + rva - int(self.sources[i])
+
+    def lookup(self, rvas):
+        """
+        Translate all of *rvas* at once, returning a NumPy ``int64`` array with the shape of *rvas*
+        and -1 for the RVAs that aren't mapped (Including negative ones, e.g. the -1 of a previous
+        lookup).
+        """
+        import numpy as np
+
+        rvas = np.asarray(rvas, dtype=np.int64)
+        if not len(self):
+            return np.full(rvas.shape, -1, np.int64)
+
+        i = self.sources.searchsorted(rvas, 'right') - 1
+        clipped = np.maximum(i, 0)
+        targets = self.targets[clipped]
+        return np.where(
+            (i >= 0) & (targets != 0) & (rvas >= 0), targets + rvas - self.sources[clipped], -1)
+
+
+class Omap:
+    """
+    Both OMAP tables of a PDB, see :attr:`pydia2.dbi.DbiStream.omap`. A missing table maps RVAs
+    to themselves.
+    """
+
+    def __init__(self, to_source, from_source):
+        #: The :class:`OmapTable` from the RVAs of the binary to the source RVAs, or ``None``.
+        self.to_source_table = to_source
+        #: The :class:`OmapTable` from the source RVAs to the RVAs of the binary, or ``None``.
+        self.from_source_table = from_source
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} to_source={self.to_source_table} "
+                f"from_source={self.from_source_table}>")
+
+    def to_source(self, rva):
+        """Translate the RVA of the binary *rva* to a source RVA, or ``None`` if it isn't mapped."""
+        if self.to_source_table is None:
+            return rva
+
+        return self.to_source_table.find(rva)
+
+    def from_source(self, rva):
+        """
+        Translate the source RVA *rva* to an RVA of the binary, or ``None`` if it isn't mapped.
+        """
+        if self.from_source_table is None:
+            return rva
+
+        return self.from_source_table.find(rva)
+
+    def to_source_many(self, rvas):
+        """Translate the RVAs of the binary *rvas* at once, see :meth:`OmapTable.lookup`."""
+        import numpy as np
+
+        if self.to_source_table is None:
+            return np.asarray(rvas, dtype=np.int64)
+
+        return self.to_source_table.lookup(rvas)
+
+    def from_source_many(self, rvas):
+        """Translate the source RVAs *rvas* at once, see :meth:`OmapTable.lookup`."""
+        import numpy as np
+
+        if self.from_source_table is None:
+            return np.asarray(rvas, dtype=np.int64)
+
+        return self.from_source_table.lookup(rvas)
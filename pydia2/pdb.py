@@ -0,0 +1,216 @@
+"""
+Pure Python reader of the PDB info stream (Stream 1) of PDB files, with the version, signature, age
+and GUID of the PDB, the map of named streams (e.g. ``/names``) and the feature signatures.
+
+:func:`read_info` reads just that from a PDB, to check whether it matches a binary before opening it
+any further, and :func:`scan_info` does so for a whole directory tree of PDBs.
+
+:class:`PublicsPdb` opens a PDB for symbolizing addresses with public symbols only, reading just the
+streams needed for that.
+"""
+
+import os
+import uuid
+import struct
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+
+from .msf import MsfFile, DEFAULT_CACHE_SIZE
+from .dbi import DbiStream
+from .gsi import PublicsStream
+
+
+#: The stream index of the PDB info stream.
+PDB_STREAM = 1
+
+_HEADER = struct.Struct('<III16s')
+_U32 = struct.Struct('<I')
+
+# The block cache size when only reading the PDB info stream, which is usually a single block
+_INFO_CACHE_SIZE = 64 * 1024
+
+
+class PdbFeature(IntEnum):
+    """The feature signatures at the end of the PDB info stream."""
+    VC110 = 20091201
+    #: The PDB has an IPI stream.
+    VC140 = 20140508
+    NO_TYPE_MERGE = 0x4d544f4e
+    MINIMAL_DEBUG_INFO = 0x494e494d
+
+
+def _read_u32(data, pos):
+    if pos + 4 > len(data):
+        raise ValueError("PDB info stream is truncated")
+
+    return _U32.unpack_from(data, pos)[0], pos + 4
+
+
+def _parse_named_streams(data, pos):
+    """
+    Parse the named stream map at *pos* of *data*, returning the ``{name: stream index}`` dict and
+    the position after it.
+    """
+    names_size, pos = _read_u32(data, pos)
+    names = data[pos:pos + names_size]
+    if len(names) != names_size:
+        raise ValueError("PDB info stream is truncated")
+
+    pos += names_size
+    # A hash table of (name offset, stream index) pairs, of which only the present ones are stored
+    count, pos = _read_u32(data, pos)
+    _capacity, pos = _read_u32(data, pos)
+    present_words, pos = _read_u32(data, pos)
+    pos += 4 * present_words
+    deleted_words, pos = _read_u32(data, pos)
+    pos += 4 * deleted_words
+    if pos + 8 * count > len(data):
+        raise ValueError("PDB info stream is truncated")
+
+    streams = {}
+    for name_offset, stream in struct.iter_unpack('<II', data[pos:pos + 8 * count]):
+        end = names.find(b'\0', name_offset)
+        if end < 0:
+            raise ValueError(f"Stream name at {name_offset:#x} is out of bounds")
+
+        streams[names[name_offset:end].decode('utf-8', 'replace')] = stream
+
+    return streams, pos + 8 * count
+
+
+_FEATURES = {feature.value: feature for feature in PdbFeature}
+
+
+class PdbInfoStream:
+    """The PDB info stream of the :class:`~pydia2.msf.MsfFile` *msf*."""
+
+    def __init__(self, msf, stream_index=PDB_STREAM):
+        if stream_index >= msf.num_streams:
+            raise ValueError(f"MSF file has no stream {stream_index}")
+
+        data = bytes(msf.stream(stream_index).read())
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Stream {stream_index} is not a PDB info stream")
+
+        version, signature, age, guid = _HEADER.unpack_from(data)
+        #: The version of the PDB format, e.g. 20000404 for VC70.
+        self.version = version
+        #: The time stamp signature of the PDB.
+        self.signature = signature
+        #: The age of the PDB, incremented each time the PDB is updated.
+        self.age = age
+        #: The GUID of the PDB, which matches the RSDS debug directory entry of the binary.
+        self.guid = uuid.UUID(bytes_le=guid)
+        #: The ``{name: stream index}`` dict of the named streams.
+        self.named_streams, pos = _parse_named_streams(data, _HEADER.size)
+        #: The list of :class:`PdbFeature` of the PDB.
+        self.features = []
+        for (signature,) in struct.iter_unpack('<I', data[pos:pos + (len(data) - pos) // 4 * 4]):
+            if signature in _FEATURES:
+                self.features.append(_FEATURES[signature])
+                # VC110 PDBs have no other features, anything after it isn't a feature signature
+                if signature == PdbFeature.VC110:
+                    break
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} guid={self.guid} age={self.age}>"
+
+    def named_stream(self, name):
+        """Return the index of the stream named *name*, or ``None`` if it doesn't exist."""
+        return self.named_streams.get(name)
+
+    def matches(self, guid, age):
+        """
+        Whether this is the PDB of a binary with the RSDS debug directory entry *guid* (A
+        :class:`uuid.UUID` or a string) and *age*.
+        """
+        if not isinstance(guid, uuid.UUID):
+            guid = uuid.UUID(guid)
+
+        return guid == self.guid and age == self.age
+
+
+def read_info(source):
+    """
+    Read the :class:`PdbInfoStream` of the PDB *source* (See :class:`~pydia2.msf.MsfFile`), only
+    reading the MSF superblock, the start of the stream directory and the PDB info stream.
+    """
+    with MsfFile(source, _INFO_CACHE_SIZE) as msf:
+        return PdbInfoStream(msf)
+
+
+def _read_file_info(path):
+    try:
+        # Read through a file object rather than mapping the file, so that the threads of
+        # scan_info wait for I/O without holding the GIL
+        with open(path, 'rb') as f:
+            return path, read_info(f)
+    except (OSError, ValueError):
+        return path, None
+
+
+def scan_info(directory, max_workers=None):
+    """
+    Read the :class:`PdbInfoStream` of each ``.pdb`` file in the tree of *directory* with
+    :func:`read_info`, using a thread pool of *max_workers* threads.
+
+    Yields ``(path, info)`` tuples in the order of :func:`os.walk`, with ``None`` for the info of
+    files that can't be read or aren't PDBs.
+    """
+    paths = (
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names if name.lower().endswith('.pdb'))
+    with ThreadPoolExecutor(max_workers) as executor:
+        yield from executor.map(_read_file_info, paths)
+
+
+class PublicsPdb:
+    """
+    A PDB opened from *source* (See :class:`~pydia2.msf.MsfFile`) for symbolizing addresses with
+    its public symbols.
+
+    Only the PDB info stream, the DBI header and optional debug header, the section headers and the
+    public symbol stream (And the public symbol records) are read, the type, module and line info
+    streams are never touched. :attr:`bytes_read` tells how much of the file that was.
+    """
+
+    def __init__(self, source, cache_size=DEFAULT_CACHE_SIZE):
+        #: The :class:`~pydia2.msf.MsfFile`.
+        self.msf = MsfFile(source, cache_size, track_reads=True)
+        try:
+            #: The :class:`PdbInfoStream`.
+            self.info = PdbInfoStream(self.msf)
+            #: The :class:`~pydia2.dbi.DbiStream`, of which only the header is read.
+            self.dbi = DbiStream(self.msf)
+            #: The :class:`~pydia2.gsi.PublicsStream`.
+            self.publics = PublicsStream(self.msf, self.dbi)
+        except BaseException:
+            self.msf.close()
+            raise
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} guid={self.info.guid} age={self.info.age}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the file."""
+        self.msf.close()
+
+    @property
+    def bytes_read(self):
+        """The number of bytes of the file read so far, in whole MSF blocks."""
+        return self.msf.bytes_read
+
+    def find(self, rva):
+        """See :meth:`pydia2.gsi.PublicsStream.find`."""
+        return self.publics.find(rva)
+
+    def lookup(self, rvas):
+        """See :meth:`pydia2.gsi.PublicsStream.lookup`."""
+        return self.publics.lookup(rvas)
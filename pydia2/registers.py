@@ -0,0 +1,136 @@
+"""
+CPU aware decoding of CodeView register numbers (:class:`pydia2.cvconst.HREG`).
+
+Register numbers overlap between architectures (e.g. 328 is ``AMD64_RAX`` but ``ARM64_V18``), so
+they can only be decoded together with the :class:`pydia2.cvconst.CPU_TYPE` they come from (e.g.
+``IDiaSymbol.platform`` of the compiland). This uses plain lookup tables generated from
+``cvconst.h`` by ``scripts/generate_cvconst.py`` instead of going through the
+:class:`~pydia2.cvconst.HREG` enum.
+"""
+
+from . import _cvregs
+
+
+_UNKNOWN = (None, 0)
+
+_ALLREG = {value: (name, width) for value, name, width in _cvregs.ALLREG}
+_ALLREG_BASE = min(_ALLREG)
+_ALLREG_END = max(_ALLREG) + 1
+# The (names, widths) NumPy arrays of _ALLREG_BASE-_ALLREG_END, built on first use
+_allreg_arrays = None
+
+
+class _RegisterTable:
+    __slots__ = ('registers', '_arrays')
+
+    def __init__(self, registers):
+        # Dense list indexed by register number, with one extra trailing _UNKNOWN slot for
+        # decode_registers to map out of range register numbers to.
+        self.registers = [_UNKNOWN] * (registers[-1][0] + 2)
+        for value, name, width in registers:
+            self.registers[value] = (name, width)
+
+        self._arrays = None
+
+    def arrays(self):
+        if self._arrays is None:
+            import numpy as np
+
+            names = np.array([name for name, _ in self.registers], dtype=object)
+            widths = np.array([width for _, width in self.registers], dtype=np.uint16)
+            self._arrays = names, widths
+
+        return self._arrays
+
+
+def _get_allreg_arrays():
+    global _allreg_arrays
+    if _allreg_arrays is None:
+        import numpy as np
+
+        registers = [_ALLREG.get(reg, _UNKNOWN) for reg in range(_ALLREG_BASE, _ALLREG_END)]
+        _allreg_arrays = (
+            np.array([name for name, _ in registers], dtype=object),
+            np.array([width for _, width in registers], dtype=np.uint16))
+
+    return _allreg_arrays
+
+
+# CPU_TYPE value -> _RegisterTable, filled in on first use of each register family
+_tables = {}
+_family_tables = {}
+
+
+def _get_table(cpu):
+    table = _tables.get(cpu)
+    if table is None:
+        family = _cvregs.CPU_FAMILIES.get(cpu)
+        if family is None:
+            raise ValueError(f"Unsupported CPU type: {cpu!r}")
+
+        table = _family_tables.get(family)
+        if table is None:
+            table = _family_tables[family] = _RegisterTable(_cvregs.REGISTERS[family])
+
+        _tables[cpu] = table
+
+    return table
+
+
+def decode_register(cpu, reg):
+    """
+    Decode register number *reg* of the :class:`~pydia2.cvconst.CPU_TYPE` *cpu*.
+
+    Returns a ``(name, width)`` tuple where *name* is the name of the
+    :class:`~pydia2.cvconst.HREG` member (e.g. ``"AMD64_RAX"``) and *width* is the width of the
+    register in bits, or 0 if unknown. Returns ``(None, 0)`` for register numbers that are not
+    defined for *cpu*. Raises :exc:`ValueError` if *cpu* is not supported.
+    """
+    registers = _get_table(cpu).registers
+    if 0 <= reg < len(registers):
+        return registers[reg]
+
+    return _ALLREG.get(reg, _UNKNOWN)
+
+
+def register_name(cpu, reg):
+    """
+    Return the name of register number *reg* of *cpu*, or ``None``. See :func:`decode_register`.
+    """
+    return decode_register(cpu, reg)[0]
+
+
+def register_width(cpu, reg):
+    """
+    Return the width in bits of register number *reg* of *cpu*, or 0. See :func:`decode_register`.
+    """
+    return decode_register(cpu, reg)[1]
+
+
+def decode_registers(cpu, regs):
+    """
+    Decode an array of register numbers of *cpu* at once. Requires NumPy.
+
+    Returns a ``(names, widths)`` tuple of NumPy arrays with the shape of *regs*, *names* is an
+    object array with ``None`` for unknown registers, and *widths* is a ``uint16`` array with 0 for
+    unknown registers. See :func:`decode_register`.
+    """
+    import numpy as np
+
+    table = _get_table(cpu)
+    names, widths = table.arrays()
+    regs = np.asarray(regs, dtype=np.int64)
+
+    unknown = len(names) - 1
+    index = np.where((regs >= 0) & (regs < unknown), regs, unknown)
+    out_names = names[index]
+    out_widths = widths[index]
+
+    allreg = (regs >= _ALLREG_BASE) & (regs < _ALLREG_END)
+    if allreg.any():
+        allreg_names, allreg_widths = _get_allreg_arrays()
+        allreg_index = regs[allreg] - _ALLREG_BASE
+        out_names[allreg] = allreg_names[allreg_index]
+        out_widths[allreg] = allreg_widths[allreg_index]
+
+    return out_names, out_widths
@@ -0,0 +1,128 @@
+"""
+Pure Python reader of the ``/names`` string table of PDB files, which file checksums, line info and
+other records refer to strings in by offset.
+
+The table is kept as a single :class:`memoryview` of the stream (Without copying when its blocks are
+contiguous), and strings are only decoded when asked for, with a bounded memo of the decoded strings
+by offset. :meth:`StringTable.strings` decodes whole arrays of offsets at once.
+"""
+
+import struct
+from collections import OrderedDict
+
+from .pdb import PdbInfoStream
+
+
+#: The name of the string table stream in the named stream map.
+NAMES_STREAM = '/names'
+
+#: The default number of decoded strings memoized by a :class:`StringTable`.
+DEFAULT_MEMO_SIZE = 64 * 1024
+
+_HEADER = struct.Struct('<III')
+_SIGNATURE = 0xeffeeffe
+
+# How much to read at once when looking for the end of a single string
+_SCAN_SIZE = 256
+
+
+class StringTable:
+    """
+    The string table in the stream *stream_index* of the :class:`~pydia2.msf.MsfFile` *msf*,
+    memoizing up to *memo_size* decoded strings.
+    """
+
+    def __init__(self, msf, stream_index, memo_size=DEFAULT_MEMO_SIZE):
+        stream = msf.stream(stream_index)
+        if len(stream) < _HEADER.size:
+            raise ValueError(f"Stream {stream_index} is not a string table")
+
+        signature, self.hash_version, size = _HEADER.unpack_from(stream.read(0, _HEADER.size))
+        if signature != _SIGNATURE:
+            raise ValueError(f"Invalid string table signature: {signature:#x}")
+
+        if _HEADER.size + size > len(stream):
+            raise ValueError("String table is truncated")
+
+        self._data = stream.read(_HEADER.size, size)
+        self._memo = OrderedDict()
+        #: The maximum number of memoized strings.
+        self.memo_size = memo_size
+        # The offsets of the string terminators as a NumPy array, built on first batch decode
+        self._ends = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} size={len(self._data)}>"
+
+    def __len__(self):
+        return len(self._data)
+
+    def _memoize(self, offset, string):
+        self._memo[offset] = string
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def __getitem__(self, offset):
+        """Return the string at *offset*."""
+        string = self._memo.get(offset)
+        if string is not None:
+            self._memo.move_to_end(offset)
+            return string
+
+        if not 0 <= offset < len(self._data):
+            raise IndexError(f"String table offset {offset:#x} is out of range")
+
+        chunks = []
+        pos = offset
+        while pos < len(self._data):
+            chunk = bytes(self._data[pos:pos + _SCAN_SIZE])
+            end = chunk.find(b'\0')
+            if end >= 0:
+                chunks.append(chunk[:end])
+                break
+
+            chunks.append(chunk)
+            pos += len(chunk)
+
+        string = b''.join(chunks).decode('utf-8', 'replace')
+        self._memoize(offset, string)
+        return string
+
+    def strings(self, offsets):
+        """
+        Return the list of the strings at each of *offsets* (e.g. a NumPy array). Each distinct
+        offset is only decoded once, and the ends of the strings are found with NumPy. Requires
+        NumPy.
+        """
+        import numpy as np
+
+        offsets = np.asarray(offsets, dtype=np.int64).ravel()
+        if offsets.size and (offsets.min() < 0 or offsets.max() >= len(self._data)):
+            raise IndexError("String table offset is out of range")
+
+        if self._ends is None:
+            self._ends = np.append(
+                np.flatnonzero(np.frombuffer(self._data, dtype=np.uint8) == 0), len(self._data))
+
+        unique, inverse = np.unique(offsets, return_inverse=True)
+        ends = self._ends[self._ends.searchsorted(unique)]
+        memo = self._memo
+        decoded = []
+        for offset, end in zip(unique.tolist(), ends.tolist()):
+            string = memo.get(offset)
+            if string is None:
+                string = str(self._data[offset:end], 'utf-8', 'replace')
+                self._memoize(offset, string)
+
+            decoded.append(string)
+
+        return [decoded[i] for i in inverse.reshape(-1).tolist()]
+
+
+def open_names(msf, memo_size=DEFAULT_MEMO_SIZE):
+    """Return the ``/names`` :class:`StringTable` of *msf*, or ``None`` if it doesn't have one."""
+    stream = PdbInfoStream(msf).named_stream(NAMES_STREAM)
+    if stream is None:
+        return None
+
+    return StringTable(msf, stream, memo_size)
@@ -0,0 +1,134 @@
+"""
+Streaming reader of the CodeView symbols of the modules of PDB files.
+
+Symbols are yielded as lightweight :class:`SymbolRecord` objects, one module at a time. When only
+some symbol kinds are wanted, the other records are skipped using their length prefix without being
+decoded.
+"""
+
+import struct
+
+from .cvconst import SymTag
+from .cvinfo import SymKind
+
+
+#: The signature at the start of the symbols of a module with C13 line info.
+CV_SIGNATURE_C13 = 4
+
+_RECORD_HEADER = struct.Struct('<HH')
+
+_SYM_KINDS = {kind.value: kind for kind in SymKind}
+
+#: The symbol record kinds of each :class:`~pydia2.cvconst.SymTag` that DIA exposes module symbols
+#: as, for filtering by tag.
+SYMTAG_KINDS = {
+    SymTag.Function: frozenset({
+        SymKind.S_LPROC32, SymKind.S_GPROC32, SymKind.S_LPROC32_ID, SymKind.S_GPROC32_ID,
+        SymKind.S_LPROC32_DPC, SymKind.S_LPROC32_DPC_ID, SymKind.S_LPROCMIPS, SymKind.S_GPROCMIPS,
+        SymKind.S_LPROCMIPS_ID, SymKind.S_GPROCMIPS_ID, SymKind.S_LPROCIA64, SymKind.S_GPROCIA64,
+        SymKind.S_LPROCIA64_ID, SymKind.S_GPROCIA64_ID, SymKind.S_GMANPROC, SymKind.S_LMANPROC,
+    }),
+    SymTag.Data: frozenset({
+        SymKind.S_LDATA32, SymKind.S_GDATA32, SymKind.S_LTHREAD32, SymKind.S_GTHREAD32,
+        SymKind.S_LMANDATA, SymKind.S_GMANDATA, SymKind.S_CONSTANT, SymKind.S_MANCONSTANT,
+        SymKind.S_FILESTATIC, SymKind.S_LOCAL, SymKind.S_REGREL32, SymKind.S_BPREL32,
+        SymKind.S_REGISTER, SymKind.S_MANSLOT, SymKind.S_MANREGREL, SymKind.S_MANREGISTER,
+        SymKind.S_GDATA_HLSL, SymKind.S_LDATA_HLSL, SymKind.S_GDATA_HLSL32,
+        SymKind.S_LDATA_HLSL32, SymKind.S_GDATA_HLSL32_EX, SymKind.S_LDATA_HLSL32_EX,
+    }),
+    SymTag.Block: frozenset({SymKind.S_BLOCK32}),
+    SymTag.Label: frozenset({SymKind.S_LABEL32}),
+    SymTag.Thunk: frozenset({SymKind.S_THUNK32, SymKind.S_TRAMPOLINE}),
+    SymTag.Typedef: frozenset({SymKind.S_UDT, SymKind.S_COBOLUDT}),
+    SymTag.InlineSite: frozenset({SymKind.S_INLINESITE, SymKind.S_INLINESITE2}),
+    SymTag.CompilandDetails: frozenset({SymKind.S_COMPILE2, SymKind.S_COMPILE3}),
+    SymTag.CompilandEnv: frozenset({SymKind.S_ENVBLOCK}),
+    SymTag.Annotation: frozenset({SymKind.S_ANNOTATION}),
+    SymTag.CallSite: frozenset({SymKind.S_CALLSITEINFO}),
+    SymTag.HeapAllocationSite: frozenset({SymKind.S_HEAPALLOCSITE}),
+    SymTag.CoffGroup: frozenset({SymKind.S_COFFGROUP}),
+    SymTag.Export: frozenset({SymKind.S_EXPORT}),
+    SymTag.PublicSymbol: frozenset({SymKind.S_PUB32}),
+}
+
+
+class SymbolRecord:
+    """A CodeView symbol record."""
+
+    __slots__ = ('offset', 'kind', 'data')
+
+    def __init__(self, offset, kind, data):
+        #: The offset of the record in its stream, which is what other records (e.g. ``pEnd``)
+        #: refer to it by.
+        self.offset = offset
+        #: The :class:`~pydia2.cvinfo.SymKind` of the record (Or a plain :class:`int` if unknown).
+        self.kind = kind
+        #: The whole record, including the length and kind, as a :class:`memoryview`. This matches
+        #: the :mod:`pydia2.cvinfo` layouts, e.g. ``cvinfo.PROCSYM32.unpack_from(record.data)``.
+        self.data = data
+
+    def __repr__(self):
+        kind = self.kind.name if isinstance(self.kind, SymKind) else hex(self.kind)
+        return f"<{self.__class__.__name__} offset={self.offset:#x} kind={kind}>"
+
+
+def _kinds_filter(kinds, tags):
+    if kinds is None and tags is None:
+        return None
+
+    result = set(kinds or ())
+    for tag in tags or ():
+        result |= SYMTAG_KINDS[tag]
+
+    return frozenset(int(kind) for kind in result)
+
+
+def iter_records(data, kinds=None, base_offset=0):
+    """
+    Iterate the :class:`SymbolRecord` of the symbol records in the buffer *data*, only the ones of
+    *kinds* if given. *base_offset* is the offset of *data* in its stream.
+    """
+    data = memoryview(data).cast('B')
+    unpack_from = _RECORD_HEADER.unpack_from
+    size = len(data) - _RECORD_HEADER.size
+    pos = 0
+    while pos <= size:
+        length, kind = unpack_from(data, pos)
+        if kinds is None or kind in kinds:
+            yield SymbolRecord(base_offset + pos, _SYM_KINDS.get(kind, kind),
+                               data[pos:pos + 2 + length])
+
+        pos += 2 + length
+
+
+def iter_module_symbols(msf, module, kinds=None, tags=None):
+    """
+    Iterate the :class:`SymbolRecord` of the symbols of the :class:`~pydia2.dbi.ModuleInfo`
+    *module* of the :class:`~pydia2.msf.MsfFile` *msf*.
+
+    If *kinds* (:class:`~pydia2.cvinfo.SymKind` values) or *tags* (:class:`~pydia2.cvconst.SymTag`
+    values, see :data:`SYMTAG_KINDS`) are given, only the records of those kinds are yielded.
+    """
+    if module.symbol_stream is None or module.symbol_byte_size <= 4:
+        return
+
+    stream = msf.stream(module.symbol_stream)
+    signature = struct.unpack_from('<I', stream.read(0, 4))[0]
+    if signature != CV_SIGNATURE_C13:
+        raise ValueError(
+            f"Unsupported symbols signature {signature} in module {module.index} "
+            f"({module.name!r})")
+
+    yield from iter_records(
+        stream.read(4, module.symbol_byte_size - 4), _kinds_filter(kinds, tags), 4)
+
+
+def iter_symbols(msf, modules, kinds=None, tags=None):
+    """
+    Iterate ``(module, record)`` tuples of the symbols of all of *modules* (e.g.
+    :attr:`pydia2.dbi.DbiStream.modules`), see :func:`iter_module_symbols`. Only the symbols of one
+    module are read at a time.
+    """
+    for module in modules:
+        for record in iter_module_symbols(msf, module, kinds, tags):
+            yield module, record
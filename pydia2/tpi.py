@@ -0,0 +1,574 @@
+"""
+Pure Python reader of the TPI (Type info) and IPI (Id info) streams of PDB files.
+
+Records are found without walking the whole stream, using the index offset buffer of the TPI hash
+stream, which lists the offset of every few KB worth of records, to get close to a record and only
+scanning forward from there. Parsed records are memoized by type index.
+
+For bulk access :meth:`TypeStream.build_offsets` builds the offset of every record at once with
+:func:`scan_record_offsets`, optionally caching it on disk.
+
+:class:`IdStream` additionally resolves the id records of the IPI stream (Function ids, strings and
+build info) that inline site and build info symbols refer to.
+"""
+
+import sys
+import struct
+from array import array
+from bisect import bisect_right
+
+from .cvinfo import LeafKind
+from . import cvinfo
+from .msf import _u32_array
+from . import _cache
+
+
+#: The stream index of the TPI stream.
+TPI_STREAM = 2
+#: The stream index of the IPI stream.
+IPI_STREAM = 4
+
+_HEADER = struct.Struct('<IIIIIHHIIiIiIiI')
+_RECORD_HEADER = struct.Struct('<HH')
+
+# Stream index of a hash stream that doesn't exist
+_NIL_STREAM = 0xffff
+
+_OFFSETS_CACHE_MAGIC = b'PYDIATOF'
+_OFFSETS_CACHE_HEADER = struct.Struct('<8sIII')
+
+# The default distance between the guessed record starts of scan_record_offsets
+_SCAN_SEGMENT_SIZE = 16 * 1024
+
+_LEAF_KINDS = {leaf.value: leaf for leaf in LeafKind}
+# The leaves of type records (As opposed to the leaves only used in them, like numeric leaves)
+_TYPE_RECORD_KINDS = [leaf for leaf in _LEAF_KINDS if leaf < LeafKind.LF_NUMERIC]
+
+# The cvinfo layout of the fixed size part of the type records that have one
+_LAYOUTS = {
+    LeafKind.LF_MODIFIER: 'lfModifier',
+    LeafKind.LF_POINTER: 'lfPointer',
+    LeafKind.LF_ARRAY: 'lfArray',
+    LeafKind.LF_CLASS: 'lfClass',
+    LeafKind.LF_STRUCTURE: 'lfClass',
+    LeafKind.LF_INTERFACE: 'lfClass',
+    LeafKind.LF_UNION: 'lfUnion',
+    LeafKind.LF_ENUM: 'lfEnum',
+    LeafKind.LF_PROCEDURE: 'lfProc',
+    LeafKind.LF_MFUNCTION: 'lfMFunc',
+    LeafKind.LF_VTSHAPE: 'lfVTShape',
+    LeafKind.LF_ARGLIST: 'lfArgList',
+    LeafKind.LF_SUBSTR_LIST: 'lfArgList',
+    LeafKind.LF_FIELDLIST: 'lfFieldList',
+    LeafKind.LF_BITFIELD: 'lfBitfield',
+    LeafKind.LF_FUNC_ID: 'lfFuncId',
+    LeafKind.LF_MFUNC_ID: 'lfMFuncId',
+    LeafKind.LF_STRING_ID: 'lfStringId',
+    LeafKind.LF_UDT_SRC_LINE: 'lfUdtSrcLine',
+    LeafKind.LF_UDT_MOD_SRC_LINE: 'lfUdtModSrcLine',
+    LeafKind.LF_BUILDINFO: 'lfBuildInfo',
+}
+
+
+def _leaf_name(leaf):
+    return leaf.name if isinstance(leaf, LeafKind) else hex(leaf)
+
+
+class TypeRecord:
+    """A record of a :class:`TypeStream`."""
+
+    __slots__ = ('index', 'leaf', 'data')
+
+    def __init__(self, index, leaf, data):
+        #: The type index of the record.
+        self.index = index
+        #: The :class:`~pydia2.cvinfo.LeafKind` of the record (Or a plain :class:`int` if unknown).
+        self.leaf = leaf
+        #: The contents of the record, starting at the leaf (After the length), as a
+        #: :class:`memoryview`.
+        self.data = data
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} index={self.index:#x} leaf={_leaf_name(self.leaf)}>"
+
+    def unpack(self):
+        """
+        Unpack the fixed size part of the record into a :class:`dict` using its
+        :mod:`pydia2.cvinfo` layout. Raises :exc:`ValueError` for leaves without a known layout.
+        """
+        name = _LAYOUTS.get(self.leaf)
+        if name is None:
+            raise ValueError(f"No layout for type record leaf {self.leaf!r}")
+
+        layout = getattr(cvinfo, name)
+        return dict(zip(getattr(cvinfo, name + '_FIELDS'), layout.unpack_from(self.data)))
+
+    def tail(self):
+        """The rest of the record after its fixed size part, see :meth:`unpack`."""
+        return self.data[getattr(cvinfo, _LAYOUTS[self.leaf]).size:]
+
+
+class TypeStream:
+    """
+    The TPI or IPI stream, *stream_index* of the :class:`~pydia2.msf.MsfFile` *msf*.
+
+    Records are looked up by type index with ``stream[index]``, which returns a
+    :class:`TypeRecord`. If the stream has no index offset buffer, :meth:`build_offsets` is called
+    on the first lookup.
+    """
+
+    def __init__(self, msf, stream_index=TPI_STREAM):
+        self.msf = msf
+        self._stream = msf.stream(stream_index)
+        if len(self._stream) < _HEADER.size:
+            raise ValueError(f"Stream {stream_index} is not a type stream")
+
+        (self.version, self.header_size, self.type_index_begin, self.type_index_end,
+            self.type_record_bytes, self.hash_stream_index, self.hash_aux_stream_index,
+            self.hash_key_size, self.num_hash_buckets, self._hash_value_buffer_offset,
+            self._hash_value_buffer_length, self._index_offset_buffer_offset,
+            self._index_offset_buffer_length, self._hash_adj_buffer_offset,
+            self._hash_adj_buffer_length) = _HEADER.unpack_from(self._stream.read(0, _HEADER.size))
+
+        if self.header_size + self.type_record_bytes > len(self._stream):
+            raise ValueError(f"Type stream {stream_index} is truncated")
+
+        self._records = {}
+        # The type indices and record offsets of the index offset buffer, loaded on first use
+        self._checkpoint_indices = None
+        self._checkpoint_offsets = None
+        #: The offset of every record (By type index - :attr:`type_index_begin`) as an
+        #: ``array('I')``, once built by :meth:`build_offsets`.
+        self.offsets = None
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} stream={self._stream.index} "
+            f"types={self.type_index_begin:#x}-{self.type_index_end:#x}>")
+
+    def __len__(self):
+        return self.type_index_end - self.type_index_begin
+
+    def __contains__(self, index):
+        return self.type_index_begin <= index < self.type_index_end
+
+    def __getitem__(self, index):
+        record = self._records.get(index)
+        if record is None:
+            if index not in self:
+                raise KeyError(index)
+
+            record = self._records[index] = self._read_record(index)
+
+        return record
+
+    def get(self, index, default=None):
+        """Return the :class:`TypeRecord` of *index*, or *default* if it's out of range."""
+        if index not in self:
+            return default
+
+        return self[index]
+
+    def _load_checkpoints(self):
+        if self.hash_stream_index != _NIL_STREAM and self._index_offset_buffer_length:
+            hash_stream = self.msf.stream(self.hash_stream_index)
+            buffer = _u32_array(hash_stream.read(
+                self._index_offset_buffer_offset, self._index_offset_buffer_length))
+            self._checkpoint_indices = buffer[0::2]
+            self._checkpoint_offsets = buffer[1::2]
+        else:
+            self._checkpoint_indices = (self.type_index_begin,)
+            self._checkpoint_offsets = (0,)
+
+    def build_offsets(self, cache_dir=None):
+        """
+        Build :attr:`offsets`, the offset of every record, which makes lookups O(1).
+
+        If *cache_dir* is given, the offsets are loaded from, or saved to, a file in it named after
+        the GUID and age of the PDB, so that they are only built once for each PDB.
+        """
+        if self.offsets is not None:
+            return self.offsets
+
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = _cache.path(cache_dir, self.msf, f"{self._stream.index}.offsets")
+            offsets = self._load_offsets(cache_path)
+            if offsets is not None:
+                self.offsets = offsets
+                return offsets
+
+        if self._checkpoint_indices is None:
+            self._load_checkpoints()
+
+        segment_starts = None
+        if len(self._checkpoint_offsets) > 1:
+            segment_starts = self._checkpoint_offsets
+
+        records = self._stream.read(self.header_size, self.type_record_bytes)
+        offsets = scan_record_offsets(records, segment_starts, _TYPE_RECORD_KINDS)
+        if len(offsets) != len(self):
+            raise ValueError(
+                f"Type stream {self._stream.index} has {len(offsets)} records instead of "
+                f"{len(self)}")
+
+        if cache_path is not None:
+            self._save_offsets(cache_path, offsets)
+
+        self.offsets = offsets
+        return offsets
+
+    def _load_offsets(self, path):
+        data = _cache.read(path)
+        if data is None or len(data) < _OFFSETS_CACHE_HEADER.size:
+            return None
+
+        magic, type_index_begin, count, type_record_bytes = \
+            _OFFSETS_CACHE_HEADER.unpack_from(data)
+        if (magic != _OFFSETS_CACHE_MAGIC or type_index_begin != self.type_index_begin
+                or count != len(self) or type_record_bytes != self.type_record_bytes
+                or len(data) != _OFFSETS_CACHE_HEADER.size + count * 4):
+            return None
+
+        offsets = array('I', data[_OFFSETS_CACHE_HEADER.size:])
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        return offsets
+
+    def _save_offsets(self, path, offsets):
+        if sys.byteorder != 'little':
+            offsets = array('I', offsets)
+            offsets.byteswap()
+
+        _cache.write(path, _OFFSETS_CACHE_HEADER.pack(
+            _OFFSETS_CACHE_MAGIC, self.type_index_begin, len(offsets), self.type_record_bytes),
+            offsets.tobytes())
+
+    def _checkpoint(self, index):
+        """The nearest known (type index, offset, scan end offset) at or before *index*."""
+        if self._checkpoint_indices is None:
+            self._load_checkpoints()
+
+        i = bisect_right(self._checkpoint_indices, index) - 1
+        if i < 0:
+            return self.type_index_begin, 0, self.type_record_bytes
+
+        # The end of the scan, so that the records in between can be read at once
+        if i + 1 < len(self._checkpoint_offsets):
+            end = self._checkpoint_offsets[i + 1]
+        else:
+            end = self.type_record_bytes
+
+        return self._checkpoint_indices[i], self._checkpoint_offsets[i], end
+
+    def _read_record(self, index):
+        if self.offsets is None:
+            if self._checkpoint_indices is None:
+                self._load_checkpoints()
+
+            # Without an index offset buffer each lookup would walk the records from the first one
+            if len(self._checkpoint_offsets) <= 1:
+                self.build_offsets()
+
+        if self.offsets is not None:
+            i = index - self.type_index_begin
+            offset = self.offsets[i]
+            length, leaf = _RECORD_HEADER.unpack_from(
+                self._stream.read(self.header_size + offset, _RECORD_HEADER.size))
+            data = self._stream.read(self.header_size + offset + 2, length)
+            return TypeRecord(index, _LEAF_KINDS.get(leaf, leaf), data)
+
+        current, offset, end = self._checkpoint(index)
+        records = self._stream.read(self.header_size + offset, end - offset)
+        pos = 0
+        while current < index:
+            pos += 2 + _RECORD_HEADER.unpack_from(records, pos)[0]
+            current += 1
+
+        if pos + _RECORD_HEADER.size > len(records):
+            raise ValueError(f"Type record {index:#x} is out of bounds")
+
+        length, leaf = _RECORD_HEADER.unpack_from(records, pos)
+        return TypeRecord(index, _LEAF_KINDS.get(leaf, leaf), records[pos + 2:pos + 2 + length])
+
+
+def scan_record_offsets(records, segment_starts=None, kinds=None, segment_size=_SCAN_SEGMENT_SIZE):
+    """
+    Return the offset of every record in *records*, a buffer of CodeView records that start with a
+    ``uint16`` length followed by a ``uint16`` kind (e.g. the records of a type stream), as an
+    ``array('I')``.
+
+    With NumPy the records are walked from many segment starts in parallel. *segment_starts* are
+    offsets known to be record starts (e.g. from the index offset buffer of the hash stream), if
+    missing the record starts are guessed every *segment_size* bytes, preferring 4 byte aligned
+    offsets that look like a few valid records of the given *kinds*, and the walks from the guesses
+    are merged into the actual chain of records afterwards, so a bad guess only costs time. Without
+    NumPy this falls back to a plain loop.
+    """
+    records = memoryview(records).cast('B')
+    if not len(records):
+        return array('I')
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _scan_record_offsets_sequential(records)
+
+    data = np.frombuffer(records, dtype=np.uint8)
+    size = len(data)
+    if segment_starts is not None:
+        starts = np.union1d(np.asarray(segment_starts, dtype=np.int64), [0])
+        starts = starts[starts < size]
+    else:
+        starts = _guess_record_starts(np, data, kinds, segment_size)
+
+    ends = np.append(starts[1:], size)
+
+    # Walk all segments at once, collecting the positions visited. The segments starting at a
+    # guessed offset may visit garbage positions until they sync with the actual chain of records,
+    # those get dropped below.
+    visited = []
+    exits = np.empty(len(starts), dtype=np.int64)
+    lanes = np.arange(len(starts))
+    pos = starts
+    lane_ends = ends
+    while len(lanes):
+        visited.append(pos)
+        # The high byte of a garbage position at the very end doesn't matter
+        high = data[np.minimum(pos + 1, size - 1)].astype(np.int64)
+        pos = pos + 2 + (data[pos] | (high << 8))
+        done = pos >= lane_ends
+        if done.any():
+            exits[lanes[done]] = pos[done]
+            active = ~done
+            lanes = lanes[active]
+            pos = pos[active]
+            lane_ends = lane_ends[active]
+
+    visited = np.concatenate(visited)
+    visited.sort()
+
+    # Follow the actual chain of records from segment to segment, it merges with the positions
+    # visited from a segment once it reaches one of them, and is walked one record at a time until
+    # then. With exact segment starts it's always merged right away.
+    merge_points = np.empty(len(starts), dtype=np.int64)
+    extra = []
+    entry = 0
+    u16 = struct.Struct('<H')
+    # Whether the actual chain of records merges right away when entering a segment from the
+    # previous one, for the common case of all segments starting where they should
+    entries = np.append(0, exits[:-1]).tolist()
+    found = visited[np.minimum(visited.searchsorted(entries), len(visited) - 1)]
+    merges = (found == entries).tolist()
+    ends = ends.tolist()
+    exits = exits.tolist()
+    for i in range(len(starts)):
+        pos = entry
+        end = ends[i]
+        if merges[i] and pos == entries[i] and pos < end:
+            merge_points[i] = pos
+            entry = exits[i]
+            continue
+
+        while pos < end:
+            j = visited.searchsorted(pos)
+            if j < len(visited) and visited[j] == pos:
+                break
+
+            extra.append(pos)
+            pos += 2 + u16.unpack_from(records, pos)[0]
+
+        if pos < end:
+            merge_points[i] = pos
+            entry = exits[i]
+        else:
+            merge_points[i] = end
+            entry = pos
+
+    if entry != size:
+        raise ValueError("The last record extends past the end of the records")
+
+    keep = visited >= merge_points[starts.searchsorted(visited, 'right') - 1]
+    offsets = visited[keep]
+    if extra:
+        offsets = np.concatenate((offsets, np.array(extra, dtype=np.int64)))
+        offsets.sort()
+
+    return array('I', offsets.astype(np.uint32).tobytes())
+
+
+def _guess_record_starts(np, data, kinds, segment_size, window=1024, depth=3, step=16):
+    """
+    Guess a record start near every *segment_size* bytes of *data*, the first 4 byte aligned
+    offset in a *window* from which *depth* records look valid.
+    """
+    size = len(data)
+    valid_kinds = np.ones(0x10000, dtype=bool)
+    if kinds is not None:
+        valid_kinds[:] = False
+        valid_kinds[np.fromiter(kinds, dtype=np.int64)] = True
+
+    guesses = np.arange(segment_size, size, segment_size, dtype=np.int64) & ~3
+    starts = guesses.copy()
+    # Try *step* candidates of the segments that didn't find a start yet at a time, most segments
+    # find one in the first few.
+    unresolved = np.arange(len(guesses))
+    for first in range(0, window, step):
+        if not len(unresolved):
+            break
+
+        candidates = (guesses[unresolved, None] + 4 * np.arange(first, first + step)).ravel()
+        rows = np.repeat(unresolved, step)
+        in_bounds = candidates + 4 <= size
+        survivors = candidates[in_bounds]
+        rows = rows[in_bounds]
+        # Check the records from each candidate, only following the ones that still look valid
+        pos = survivors
+        for _ in range(depth):
+            ended = pos == size
+            p = np.where(ended, 0, pos)
+            length = data[p].astype(np.int64) | (data[p + 1].astype(np.int64) << 8)
+            kind = data[p + 2].astype(np.int64) | (data[p + 3].astype(np.int64) << 8)
+            next_pos = p + 2 + length
+            valid = ended | ((length % 4 == 2) & valid_kinds[kind] & (
+                (next_pos == size) | (next_pos + 4 <= size)))
+            survivors = survivors[valid]
+            rows = rows[valid]
+            pos = np.where(ended[valid], size, next_pos[valid])
+
+        # The first survivor of each segment
+        found = np.unique(rows, return_index=True)[1]
+        starts[rows[found]] = survivors[found]
+        unresolved = np.setdiff1d(unresolved, rows, assume_unique=False)
+
+    return np.unique(np.concatenate(([0], starts[starts < size])))
+
+
+def _scan_record_offsets_sequential(records):
+    offsets = array('I')
+    u16 = struct.Struct('<H')
+    pos = 0
+    size = len(records)
+    while pos < size:
+        offsets.append(pos)
+        pos += 2 + u16.unpack_from(records, pos)[0]
+
+    if pos != size:
+        raise ValueError("The last record extends past the end of the records")
+
+    return offsets
+
+
+def _cstring(data):
+    """Decode the NUL terminated string at the start of *data*."""
+    data = bytes(data)
+    end = data.find(b'\0')
+    return data[:end if end >= 0 else len(data)].decode('utf-8', 'replace')
+
+
+class FunctionId:
+    """A function id (``LF_FUNC_ID`` or ``LF_MFUNC_ID``) of an :class:`IdStream`."""
+
+    __slots__ = ('index', 'name', 'type', 'scope', 'is_member')
+
+    def __init__(self, index, name, type, scope, is_member):
+        #: The id index of the record.
+        self.index = index
+        #: The name of the function.
+        self.name = name
+        #: The type index of the function type in the TPI stream.
+        self.type = type
+        #: The id index of the scope (An ``LF_STRING_ID``, or 0) for ``LF_FUNC_ID``, or the type
+        #: index of the class for ``LF_MFUNC_ID``.
+        self.scope = scope
+        #: Whether this is an ``LF_MFUNC_ID``.
+        self.is_member = is_member
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} index={self.index:#x} name={self.name!r}>"
+
+
+class IdStream(TypeStream):
+    """
+    The IPI stream of the :class:`~pydia2.msf.MsfFile` *msf*, with lazy resolution of the id records
+    on top of :class:`TypeStream`. Resolved ids are memoized.
+    """
+
+    def __init__(self, msf, stream_index=IPI_STREAM):
+        super().__init__(msf, stream_index)
+        self._function_ids = {}
+        self._strings = {}
+        self._substring_lists = {}
+        self._build_infos = {}
+
+    def _record(self, index, leaves):
+        record = self[index]
+        if record.leaf not in leaves:
+            expected = ' or '.join(leaf.name for leaf in leaves)
+            raise ValueError(f"Id {index:#x} is {_leaf_name(record.leaf)}, not {expected}")
+
+        return record
+
+    def function_id(self, index):
+        """Resolve the ``LF_FUNC_ID`` or ``LF_MFUNC_ID`` *index* to a :class:`FunctionId`."""
+        function_id = self._function_ids.get(index)
+        if function_id is None:
+            record = self._record(index, (LeafKind.LF_FUNC_ID, LeafKind.LF_MFUNC_ID))
+            if record.leaf == LeafKind.LF_FUNC_ID:
+                _, scope, type = cvinfo.lfFuncId.unpack_from(record.data)
+            else:
+                _, scope, type = cvinfo.lfMFuncId.unpack_from(record.data)
+
+            function_id = self._function_ids[index] = FunctionId(
+                index, _cstring(record.tail()), type, scope, record.leaf == LeafKind.LF_MFUNC_ID)
+
+        return function_id
+
+    def string(self, index):
+        """
+        Resolve the ``LF_STRING_ID`` *index* to a :class:`str`, including the substrings it's
+        prefixed with if any.
+        """
+        string = self._strings.get(index)
+        if string is None:
+            record = self._record(index, (LeafKind.LF_STRING_ID,))
+            _, substrings = cvinfo.lfStringId.unpack_from(record.data)
+            string = _cstring(record.tail())
+            if substrings:
+                string = ''.join(self.substrings(substrings)) + string
+
+            self._strings[index] = string
+
+        return string
+
+    def substrings(self, index):
+        """Resolve the ``LF_SUBSTR_LIST`` *index* to a :class:`tuple` of strings."""
+        substrings = self._substring_lists.get(index)
+        if substrings is None:
+            record = self._record(index, (LeafKind.LF_SUBSTR_LIST,))
+            substrings = self._substring_lists[index] = tuple(
+                self.string(string) for string in self._index_list(record, cvinfo.lfArgList))
+
+        return substrings
+
+    def build_info(self, index):
+        """
+        Resolve the ``LF_BUILDINFO`` *index* to a :class:`tuple` of its argument strings (In the
+        order of ``CV_BuildInfo_e`` in ``cvinfo.h``: current directory, build tool, source file,
+        PDB file and command line), with ``None`` for missing arguments.
+        """
+        build_info = self._build_infos.get(index)
+        if build_info is None:
+            record = self._record(index, (LeafKind.LF_BUILDINFO,))
+            build_info = self._build_infos[index] = tuple(
+                self.string(arg) if arg else None
+                for arg in self._index_list(record, cvinfo.lfBuildInfo))
+
+        return build_info
+
+    @staticmethod
+    def _index_list(record, layout):
+        """The count prefixed list of u32 indices following the fixed part *layout* of *record*."""
+        count = layout.unpack_from(record.data)[1]
+        return struct.unpack_from(f'<{count}I', record.data, layout.size)
@@ -0,0 +1,63 @@
+"""
+Measure the import time of pydia2.cvconst, the cost of materializing the lazy enums, and the cost
+of a register number -> name lookup via the enum vs. the plain lookup dict.
+
+The import is measured in a fresh interpreter each time.
+"""
+import sys
+import argparse
+import pathlib
+import statistics
+import subprocess
+import timeit
+
+
+_SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(_SCRIPT_DIR.parent))
+
+
+_SNIPPET = """\
+import time
+t = time.perf_counter()
+import pydia2.cvconst
+t1 = time.perf_counter()
+pydia2.cvconst.HREG
+t2 = time.perf_counter()
+print(t1 - t, t2 - t1)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    imports = []
+    materializations = []
+    for _ in range(args.repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _SNIPPET], cwd=_SCRIPT_DIR.parent,
+            stdout=subprocess.PIPE, text=True, check=True)
+        t_import, t_materialize = map(float, result.stdout.split())
+        imports.append(t_import)
+        materializations.append(t_materialize)
+
+    print(f"import pydia2.cvconst: median {statistics.median(imports) * 1e3:.2f} ms")
+    print(f"first access to HREG: median {statistics.median(materializations) * 1e3:.2f} ms")
+
+    from pydia2 import cvconst
+
+    values = list(cvconst.HREG_NAMES)
+    number = 20
+    for label, stmt in [
+        ("HREG(value).name", "for v in values: HREG(v).name"),
+        ("HREG_NAMES[value]", "for v in values: HREG_NAMES[v]"),
+    ]:
+        t = min(timeit.repeat(
+            stmt, number=number, repeat=5,
+            globals={'values': values, 'HREG': cvconst.HREG, 'HREG_NAMES': cvconst.HREG_NAMES}))
+        print(f"{label}: {t / (number * len(values)) * 1e9:.1f} ns per lookup")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Measure the import time of pydia2 and pydia2.cvconst.
+
+Each measurement runs in a fresh interpreter, and also reports whether comtypes (And so the DIA
+typelib) got loaded as a side effect of the import.
+"""
+import sys
+import argparse
+import pathlib
+import statistics
+import subprocess
+
+
+_SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+
+
+_SNIPPET = """\
+import sys, time
+t = time.perf_counter()
+import {module}
+t = time.perf_counter() - t
+print(t, 'comtypes' in sys.modules, any(m.startswith('comtypes.gen') for m in sys.modules))
+"""
+
+
+def measure(module, repeat):
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _SNIPPET.format(module=module)],
+            cwd=_SCRIPT_DIR.parent,
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True)
+        t, comtypes_loaded, typelib_loaded = result.stdout.split()
+        timings.append(float(t))
+
+    return timings, comtypes_loaded == 'True', typelib_loaded == 'True'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    failed = False
+    for module in ("pydia2", "pydia2.cvconst"):
+        timings, comtypes_loaded, typelib_loaded = measure(module, args.repeat)
+        print(f"import {module}: min {min(timings) * 1e3:.2f} ms, "
+              f"median {statistics.median(timings) * 1e3:.2f} ms, "
+              f"comtypes loaded: {comtypes_loaded}, typelib loaded: {typelib_loaded}")
+        failed |= comtypes_loaded or typelib_loaded
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Measure building the offset of every record of a type stream with pydia2.tpi.scan_record_offsets,
+with NumPy (From guessed segment starts) vs. a plain loop over the records.
+
+The records are synthetic: a mix of pointers, argument lists and field lists.
+"""
+import sys
+import time
+import random
+import struct
+import argparse
+import pathlib
+
+
+_SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(_SCRIPT_DIR.parent))
+
+from pydia2 import tpi  # noqa: E402
+from pydia2.cvinfo import LeafKind  # noqa: E402
+
+
+def _record(leaf, body):
+    data = struct.pack('<H', leaf) + body
+    pad = -(len(data) + 2) % 4
+    data += bytes(0xf0 + pad - i for i in range(pad))
+    return struct.pack('<H', len(data)) + data
+
+
+def make_records(count, seed=0):
+    rnd = random.Random(seed)
+    records = []
+    for i in range(count):
+        kind = rnd.random()
+        if kind < 0.5:
+            records.append(_record(LeafKind.LF_POINTER, struct.pack('<II', 0x1000 + i, 0x1000c)))
+        elif kind < 0.9:
+            records.append(_record(LeafKind.LF_ARGLIST, struct.pack('<IIII', 3, i, 0x74, 0x1001)))
+        else:
+            member = struct.pack('<HHIH', LeafKind.LF_MEMBER, 3, 0x74, 0) + b'member\0'
+            records.append(_record(LeafKind.LF_FIELDLIST, member * rnd.randrange(1, 30)))
+
+    return b''.join(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-c", "--count", type=int, default=2_000_000, help="Number of records")
+    args = parser.parse_args()
+
+    records = make_records(args.count)
+    print(f"{args.count} records, {len(records) / 2**20:.1f} MiB")
+
+    # Don't measure importing NumPy
+    tpi.scan_record_offsets(make_records(10))
+
+    t = time.perf_counter()
+    offsets = tpi.scan_record_offsets(records, kinds=tpi._TYPE_RECORD_KINDS)
+    print(f"numpy: {time.perf_counter() - t:.3f}s")
+
+    t = time.perf_counter()
+    expected = tpi._scan_record_offsets_sequential(memoryview(records))
+    print(f"loop:  {time.perf_counter() - t:.3f}s")
+
+    assert offsets == expected
+
+
+if __name__ == "__main__":
+    main()
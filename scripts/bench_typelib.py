@@ -0,0 +1,82 @@
+"""
+Cold-start benchmark of loading a typelib module via comtypes codegen vs. importing the frozen
+wrapper generated by generate_dia_wrapper.py.
+
+Runs against a stand-in typelib (stdole2.tlb by default) so that it doesn't need msdia140.dll, pass
+``--typelib pydia2/lib/amd64/msdia140.dll`` to measure the real thing. Each measurement runs in a
+fresh interpreter with an empty comtypes.gen cache directory.
+"""
+import sys
+import argparse
+import pathlib
+import statistics
+import subprocess
+import tempfile
+
+
+_SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+
+
+_COLD_SNIPPET = """\
+import sys, time
+import comtypes.gen
+from comtypes import client
+comtypes.gen.__path__[:] = [sys.argv[1]]
+client.gen_dir = sys.argv[1]
+t = time.perf_counter()
+client.GetModule(sys.argv[2])
+print(time.perf_counter() - t)
+"""
+
+
+_FROZEN_SNIPPET = """\
+import sys, time, importlib
+import comtypes.gen
+from comtypes import client
+comtypes.gen.__path__[:] = [sys.argv[1]]
+client.gen_dir = sys.argv[1]
+t = time.perf_counter()
+comtypes.gen.__path__.append(sys.argv[2])
+importlib.import_module('comtypes.gen.' + sys.argv[3])
+print(time.perf_counter() - t)
+"""
+
+
+def run(snippet, *args):
+    result = subprocess.run(
+        [sys.executable, "-c", snippet, *args], stdout=subprocess.PIPE, text=True, check=True)
+    return float(result.stdout)
+
+
+def report(label, timings):
+    print(f"{label}: min {min(timings) * 1e3:.2f} ms, "
+          f"median {statistics.median(timings) * 1e3:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--typelib", default="stdole2.tlb")
+    parser.add_argument("-n", "--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as frozen_dir:
+        result = subprocess.run(
+            [sys.executable, str(_SCRIPT_DIR / "generate_dia_wrapper.py"), args.typelib,
+             frozen_dir],
+            stdout=subprocess.PIPE, text=True, check=True)
+        module_name = result.stdout.strip()
+
+        cold = []
+        frozen = []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as gen_dir:
+                cold.append(run(_COLD_SNIPPET, gen_dir, args.typelib))
+            with tempfile.TemporaryDirectory() as gen_dir:
+                frozen.append(run(_FROZEN_SNIPPET, gen_dir, frozen_dir, module_name))
+
+    report(f"codegen + load ({module_name})", cold)
+    report(f"frozen import ({module_name})", frozen)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 import sys
 import os
 import pathlib
+import re
+import struct
 import subprocess
-from unicodedata import name
+import tempfile
+import textwrap
 from pycparser import parse_file, c_ast, c_generator
 
 
@@ -60,6 +63,8 @@ DEFS = {
     'CV_HREG_e': {
         'name': 'HREG',
         'rmprefix': 'CV_',
+        # ~3,200 members, emitted as a table and only turned into an enum on first access
+        'lazy': True,
     },
     'CV_HLSLREG_e': {
         'name': 'HLSLREG',
@@ -91,26 +96,439 @@ DEFS = {
 }
 
 
+# Enums emitted from cvinfo.h into pydia2/cvinfo.py, all the others are skipped.
+CVINFO_DEFS = {
+    'SYM_ENUM_e': {
+        'name': 'SymKind',
+    },
+    'LEAF_ENUM_e': {
+        'name': 'LeafKind',
+    },
+    'CV_ptrtype_e': {
+        'name': 'PointerType',
+        'rmprefix': 'CV_',
+    },
+    'CV_ptrmode_e': {
+        'name': 'PointerMode',
+        'rmprefix': 'CV_PTR_MODE_',
+    },
+    'DEBUG_S_SUBSECTION_TYPE': {
+        'name': 'DebugSubsectionKind',
+    },
+}
+
+
+# Records from cvinfo.h emitted as struct.Struct layouts into pydia2/cvinfo.py. 'trailing' cuts
+# the fixed part of the record at the named member, for arrays that are variable length in practice.
+RECORDS = {
+    # Symbol records
+    'SYMTYPE': {},
+    'PROCSYM32': {},
+    'THUNKSYM32': {},
+    'BLOCKSYM32': {},
+    'LABELSYM32': {},
+    'DATASYM32': {},
+    'THREADSYM32': {},
+    'PUBSYM32': {},
+    'REFSYM2': {},
+    'UDTSYM': {},
+    'CONSTSYM': {},
+    'REGSYM': {},
+    'REGREL32': {},
+    'BPRELSYM32': {},
+    'LOCALSYM': {},
+    'OBJNAMESYM': {},
+    'COMPILESYM3': {},
+    'FRAMEPROCSYM': {},
+    'INLINESITESYM': {},
+    'BUILDINFOSYM': {},
+    'SECTIONSYM': {},
+    'COFFGROUPSYM': {},
+    # Type and id records (Following the length prefix)
+    'TYPTYPE': {},
+    'lfModifier': {},
+    'lfPointer': {},
+    'lfArray': {},
+    'lfClass': {},
+    'lfUnion': {},
+    'lfEnum': {},
+    'lfProc': {},
+    'lfMFunc': {},
+    'lfVTShape': {},
+    'lfArgList': {},
+    'lfFieldList': {},
+    'lfBitfield': {},
+    'lfBClass': {},
+    'lfEnumerate': {},
+    'lfIndex': {},
+    'lfMember': {},
+    'lfSTMember': {},
+    'lfMethod': {},
+    'lfOneMethod': {},
+    'lfNestType': {},
+    'lfVFuncTab': {},
+    'lfFuncId': {},
+    'lfMFuncId': {},
+    'lfStringId': {},
+    'lfUdtSrcLine': {},
+    'lfUdtModSrcLine': {},
+    'lfBuildInfo': {
+        'trailing': 'arg',
+    },
+    # C13 debug subsections
+    'CV_DebugSSubsectionHeader_t': {},
+    'CV_DebugSLinesHeader_t': {},
+    'CV_DebugSLinesFileBlockHeader_t': {},
+    'CV_Line_t': {},
+    'CV_Column_t': {},
+}
+
+
+# Register families of HREG, used by pydia2.registers to decode register numbers per CPU_TYPE.
+# widths are (pattern, bits) matched against the register name without its prefix, unmatched
+# registers have a width of 0 (unknown).
+_X86_VECTOR_WIDTHS = [
+    (r'ST\d', 80),
+    (r'MM\d', 64),
+    (r'MM\d\d', 32),
+    (r'XMM\d+', 128),
+    (r'XMM\d+_\d', 32),
+    (r'[EX]MM\d+[LH]|XMM\d+I[LH]', 64),
+    (r'YMM\d+', 256),
+    (r'YMM\d+H', 128),
+    (r'YMM\d+[ID]\d', 64),
+    (r'YMM\d+F\d', 32),
+    (r'ZMM\d+', 512),
+    (r'ZMM\d+H', 256),
+    (r'K\d', 64),
+    (r'BND\d', 128),
+    (r'BNDCFGU|BNDSTATUS', 64),
+    (r'TMM\d', 8192),
+    (r'CTRL|STAT|TAG|FPCS|FPDS|ISEM|GDTL|IDTL|LDTR|TR', 16),
+    (r'FPIP|FPDO|FPEIP|FPEDO|MXCSR', 32),
+]
+
+REGISTER_FAMILIES = {
+    'X86': {
+        'prefixes': ['REG_'],
+        'cpus': [
+            'CFL_8080', 'CFL_8086', 'CFL_80286', 'CFL_80386', 'CFL_80486', 'CFL_PENTIUM',
+            'CFL_PENTIUMII', 'CFL_PENTIUMIII',
+        ],
+        'widths': [
+            (r'[ABCD][LH]', 8),
+            (r'[ABCD]X|SP|BP|SI|DI|IP|FLAGS|[ECSDFG]S', 16),
+            (r'E(AX|CX|DX|BX|SP|BP|SI|DI|IP|FLAGS)|CR\d|DR\d|GDTR|IDTR|SSP', 32),
+            (r'EDXEAX', 64),
+            (r'XMM\d\d', 32),
+        ] + _X86_VECTOR_WIDTHS,
+    },
+    'MIPS': {
+        'prefixes': ['M4_'],
+        'cpus': [
+            'CFL_MIPS', 'CFL_MIPS16', 'CFL_MIPS32', 'CFL_MIPS64', 'CFL_MIPSI', 'CFL_MIPSII',
+            'CFL_MIPSIII', 'CFL_MIPSIV', 'CFL_MIPSV',
+        ],
+    },
+    'M68K': {
+        'prefixes': ['R68_'],
+        'cpus': ['CFL_M68000', 'CFL_M68010', 'CFL_M68020', 'CFL_M68030', 'CFL_M68040'],
+    },
+    'ALPHA': {
+        'prefixes': ['ALPHA_'],
+        'cpus': [
+            'CFL_ALPHA', 'CFL_ALPHA_21164', 'CFL_ALPHA_21164A', 'CFL_ALPHA_21264',
+            'CFL_ALPHA_21364',
+        ],
+    },
+    'PPC': {
+        'prefixes': ['PPC_'],
+        'cpus': ['CFL_PPC601', 'CFL_PPC603', 'CFL_PPC604', 'CFL_PPC620', 'CFL_PPCFP', 'CFL_PPCBE'],
+    },
+    'SH': {
+        'prefixes': ['SH3_', 'SH_'],
+        'cpus': ['CFL_SH3', 'CFL_SH3E', 'CFL_SH3DSP', 'CFL_SH4'],
+    },
+    'SHMEDIA': {
+        'prefixes': ['SHMEDIA_'],
+        'cpus': ['CFL_SHMEDIA'],
+    },
+    'ARM': {
+        'prefixes': ['ARM_'],
+        'cpus': [
+            'CFL_ARM3', 'CFL_ARM4', 'CFL_ARM4T', 'CFL_ARM5', 'CFL_ARM5T', 'CFL_ARM6',
+            'CFL_ARM_XMAC', 'CFL_ARM_WMMX', 'CFL_ARM7', 'CFL_THUMB', 'CFL_ARMNT',
+        ],
+        'widths': [
+            (r'R\d+|SP|LR|PC|CPSR|FPSCR|FPEXC|FS\d+|FPEXTRA\d|WC\w+', 32),
+            (r'ACC0|WR\d+|ND\d+', 64),
+            (r'NQ\d+', 128),
+        ],
+    },
+    'IA64': {
+        'prefixes': ['IA64_'],
+        'cpus': ['CFL_IA64', 'CFL_IA64_2'],
+    },
+    'AM33': {
+        'prefixes': ['AM33_'],
+        'cpus': ['CFL_AM33'],
+    },
+    'M32R': {
+        'prefixes': ['M32R_'],
+        'cpus': ['CFL_M32R'],
+    },
+    'TRICORE': {
+        'prefixes': ['TRI_'],
+        'cpus': ['CFL_TRICORE'],
+    },
+    'AMD64': {
+        'prefixes': ['AMD64_'],
+        'cpus': ['CFL_X64'],
+        'widths': [
+            (r'[ABCD][LH]|SIL|DIL|BPL|SPL|R\d+B', 8),
+            (r'[ABCD]X|SP|BP|SI|DI|FLAGS|R\d+W|[ECSDFG]S', 16),
+            (r'E(AX|CX|DX|BX|SP|BP|SI|DI|FLAGS)|R\d+D|SSP', 32),
+            (r'R(AX|CX|DX|BX|SP|BP|SI|DI|IP)|R\d+|CR\d|DR\d+|GDTR|IDTR', 64),
+        ] + _X86_VECTOR_WIDTHS,
+    },
+    'ARM64': {
+        'prefixes': ['ARM64_'],
+        'cpus': ['CFL_ARM64', 'CFL_HYBRID_X86_ARM64', 'CFL_ARM64EC', 'CFL_ARM64X'],
+        'widths': [
+            (r'B\d+', 8),
+            (r'H\d+', 16),
+            (r'W\d+|WZR|S\d+|NZCV|CPSR|FPSR|FPCR', 32),
+            (r'X\d+|IP[01]|FP|LR|SP|ZR|PC|D\d+|Q\d+H', 64),
+            (r'Q\d+|V\d+', 128),
+        ],
+    },
+}
+
+
+REGISTERS_HEADER = """\
+# CPU_TYPE value -> register family, and for each register family the (value, name, width in bits)
+# of its HREG registers sorted by value. Width is 0 when unknown. See pydia2.registers.
+
+
+"""
+
+
+HEADER = """\
+from enum import IntEnum, auto
+
+
+"""
+
+
+CVINFO_HEADER = """\
+\"\"\"
+Record layouts and enums from ``cvinfo.h``, generated by ``scripts/generate_cvconst.py``.
+
+Each record has a precompiled :class:`struct.Struct` ``<NAME>`` of its fixed size part, a
+``<NAME>_FIELDS`` tuple of the field names matching ``<NAME>.unpack_from()``, and for records with
+bitfields a ``<NAME>_BITS`` dict of bitfield name -> ``(field index, shift, width)``. Structs of
+bitfields (e.g. ``CV_prop_t``) and unions are kept as a single integer field.
+\"\"\"
+
+from enum import IntEnum, auto
+from struct import Struct
+
+
+"""
+
+
+# Large enums are emitted as (name, value) tables which are materialized by this module __getattr__
+# on first access, as building them dominates the import time of the module. <NAME>_NAMES is a plain
+# int -> name dict for each of them.
+FOOTER = """\
+def _enum_names(members):
+    # The first name defined for a value wins, same as with the enum itself
+    return {{value: name for name, value in reversed(members)}}
+
+
+def __getattr__(name):
+    if name in _LAZY_ENUMS:
+        value = IntEnum(name, _LAZY_ENUMS[name], module=__name__, qualname=name)
+    elif name.endswith('_NAMES') and name[:-len('_NAMES')] in _LAZY_ENUMS:
+        value = _enum_names(_LAZY_ENUMS[name[:-len('_NAMES')]])
+    else:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {{f"{{name}}_NAMES" for name in _LAZY_ENUMS}})
+
+
+__all__ = [
+{all}
+]
+
+
+_LAZY_ENUMS = {{
+{lazy_enums}
+}}
+"""
+
+
+HELPER_NAMES = ['enum_categories', 'enum_codes', 'enum_names']
+
+
+# Vectorized decoding of arrays of enum values using a lookup table per enum, requires NumPy.
+HELPERS = """\
+class _LookupTable:
+    __slots__ = ('categories', 'offset', 'codes')
+
+    def __init__(self, members):
+        import numpy as np
+
+        # The first name defined for a value wins, same as with the enum itself
+        first_names = {}
+        for name, value in members:
+            first_names.setdefault(value, name)
+
+        self.categories = tuple(first_names.values())
+        self.offset = min(first_names)
+        self.codes = np.full(max(first_names) - self.offset + 1, -1, dtype=np.int32)
+        for code, value in enumerate(first_names):
+            self.codes[value - self.offset] = code
+
+    def lookup(self, values):
+        import numpy as np
+
+        index = np.asarray(values, dtype=np.int64) - self.offset
+        known = (index >= 0) & (index < len(self.codes))
+        return np.where(known, self.codes[np.where(known, index, 0)], -1)
+
+
+_lookup_tables = {}
+
+
+def _get_lookup_table(enum):
+    name = enum if isinstance(enum, str) else enum.__name__
+    table = _lookup_tables.get(name)
+    if table is None:
+        if name in _LAZY_ENUMS:
+            members = _LAZY_ENUMS[name]
+        else:
+            cls = globals().get(name)
+            if not (isinstance(cls, type) and issubclass(cls, IntEnum)):
+                raise ValueError(f"Unknown enum {enum!r}")
+
+            members = [
+                (member_name, member.value) for member_name, member in cls.__members__.items()
+            ]
+
+        table = _lookup_tables[name] = _LookupTable(members)
+
+    return table
+
+
+def enum_categories(enum):
+    \"\"\"
+    Return the names of the distinct values of *enum* (An enum of this module, or its name), in the
+    order of :func:`enum_codes`. Requires NumPy.
+    \"\"\"
+    return _get_lookup_table(enum).categories
+
+
+def enum_codes(enum, values):
+    \"\"\"
+    Map an array of integer *values* of *enum* (An enum of this module, or its name) to an array of
+    indices into :func:`enum_categories`, with -1 for unknown values. Requires NumPy.
+
+    The result can be used as categorical codes, e.g. with ``pandas.Categorical.from_codes``.
+    \"\"\"
+    return _get_lookup_table(enum).lookup(values)
+
+
+def enum_names(enum, values, unknown=None, strict=False):
+    \"\"\"
+    Map an array of integer *values* of *enum* (An enum of this module, or its name) to an object
+    array of member names. Requires NumPy.
+
+    Unknown values are mapped to *unknown*, or raise :exc:`ValueError` if *strict* is true.
+    \"\"\"
+    import numpy as np
+
+    table = _get_lookup_table(enum)
+    codes = table.lookup(values)
+    if strict and (codes < 0).any():
+        name = enum if isinstance(enum, str) else enum.__name__
+        bad = np.unique(np.asarray(values)[codes < 0])
+        raise ValueError(f"Unknown {name} values: {bad.tolist()!r}")
+
+    # -1 indexes the trailing unknown entry
+    names = np.array(table.categories + (unknown,), dtype=object)
+    return names[codes]
+
+
+"""
+
+
+def _evaluate(node, values):
+    if isinstance(node, c_ast.Constant):
+        return int(node.value.rstrip('uUlL'), 0)
+    elif isinstance(node, c_ast.ID):
+        return values[node.name]
+    elif isinstance(node, c_ast.UnaryOp):
+        operand = _evaluate(node.expr, values)
+        return {'-': lambda: -operand, '+': lambda: operand, '~': lambda: ~operand}[node.op]()
+    elif isinstance(node, c_ast.BinaryOp):
+        left = _evaluate(node.left, values)
+        right = _evaluate(node.right, values)
+        return {
+            '+': lambda: left + right,
+            '-': lambda: left - right,
+            '*': lambda: left * right,
+            '|': lambda: left | right,
+            '&': lambda: left & right,
+            '<<': lambda: left << right,
+            '>>': lambda: left >> right,
+        }[node.op]()
+    else:
+        raise ValueError(f"unsupported enumerator value: {node!r}")
+
+
 class EnumVisitor(c_ast.NodeVisitor):
-    def __init__(self, output):
+    def __init__(self, output, defs=DEFS, only_defs=False):
         super().__init__()
         self.output = output
+        self.defs = defs
+        # Only emit the enums that are in defs
+        self.only_defs = only_defs
+        self.names = []
+        self.lazy_enums = []
+        # enum name -> [(name, value)] of the evaluated enumerators
+        self.enums = {}
 
     def visit_Enum(self, node):
+        if node.values is None:
+            # A reference to an enum (e.g. the type of a struct member)
+            return
+
         if node.name is None:
             if node.values.enumerators[0].name == "NAMEHASH_BUILD_START":
                 name = "NameHashBuild"
+            elif self.only_defs:
+                return
             else:
                 raise ValueError("enum with no name")
         else:
             name = node.name
 
-        enum_def = DEFS.get(name, {})
+        if self.only_defs and name not in self.defs:
+            return
+
+        enum_def = self.defs.get(name, {})
         name = enum_def.get('name', name)
         rmprefix = enum_def.get('rmprefix', '')
 
-        self.output.write(f"class {name}(IntEnum):\n")
-
+        # (name, value source, evaluated value) for each enumerator
+        members = []
+        values = {}
         for i, enumerator in enumerate(node.values):
             if enumerator.value is not None:
                 if isinstance(enumerator.value, c_ast.ID):
@@ -120,20 +538,331 @@ class EnumVisitor(c_ast.NodeVisitor):
                 else:
                     generator = c_generator.CGenerator()
                     value = generator.visit(enumerator.value)
+
+                int_value = _evaluate(enumerator.value, values)
             else:
                 if i == 0:
                     value = 0
+                    int_value = 0
                 else:
-                    value = 'auto()'
+                    int_value = members[-1][2] + 1
+                    # Depending on the Python version auto() continues from the highest value so
+                    # far instead of the previous one like C does, e.g. after
+                    # DEBUG_S_IGNORE = 0x80000000, DEBUG_S_SYMBOLS = 0xf1
+                    if int_value > max(member[2] for member in members):
+                        value = 'auto()'
+                    else:
+                        value = hex(int_value)
+
+            values[enumerator.name] = int_value
 
             enumerator_name = enumerator.name
             if enumerator_name.startswith(rmprefix):
                 enumerator_name = enumerator_name[len(rmprefix):]
 
+            members.append((enumerator_name, value, int_value))
+
+        self.names.append(name)
+        self.enums[name] = [
+            (enumerator_name, int_value) for enumerator_name, _, int_value in members
+        ]
+
+        if enum_def.get('lazy', False):
+            self.write_table(name, members)
+        else:
+            self.write_class(name, members)
+
+    def write_class(self, name, members):
+        self.output.write(f"class {name}(IntEnum):\n")
+
+        for enumerator_name, value, _ in members:
             self.output.write(f"    {enumerator_name} = {value}\n")
 
         self.output.write("\n\n")
 
+    def write_table(self, name, members):
+        self.lazy_enums.append(name)
+
+        self.output.write(f"_{name}_MEMBERS = (\n")
+
+        for enumerator_name, _, int_value in members:
+            self.output.write(f"    ({enumerator_name!r}, {int_value}),\n")
+
+        self.output.write(")\n\n\n")
+
+    def write_footer(self):
+        self.output.write(HELPERS)
+        self.output.write(FOOTER.format(
+            all="\n".join(f"    {name!r}," for name in self.names + HELPER_NAMES),
+            lazy_enums="\n".join(f"    {name!r}: _{name}_MEMBERS," for name in self.lazy_enums),
+        ))
+
+
+# struct formats of C base types, with the sizes of MSVC (LLP64)
+_BASE_FORMATS = {
+    ('char',): 'b',
+    ('unsigned', 'char'): 'B',
+    ('short',): 'h',
+    ('unsigned', 'short'): 'H',
+    ('int',): 'i',
+    ('unsigned',): 'I',
+    ('long',): 'i',
+    ('unsigned', 'long'): 'I',
+    ('long', 'long'): 'q',
+    ('unsigned', 'long', 'long'): 'Q',
+}
+
+_UNSIGNED_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+class _Layout:
+    """
+    The flattened layout of a record: a struct field for each member (Nested structs are inlined,
+    unions and structs of bitfields become a single integer), up to the first variable length
+    member.
+    """
+
+    def __init__(self):
+        # [(name, format)]
+        self.fields = []
+        # [(name, field index, shift, width)] of bitfields declared directly in the record
+        self.bits = []
+        self.trailing = None
+        # (base format, used bits) of the bitfield storage unit being filled
+        self._bitfield = None
+
+    @property
+    def format(self):
+        return ''.join(fmt for _, fmt in self.fields)
+
+    @property
+    def size(self):
+        return struct.calcsize('<' + self.format)
+
+
+class RecordVisitor(c_ast.NodeVisitor):
+    def __init__(self):
+        super().__init__()
+        self.typedefs = {}
+        self.structs = {}
+
+    def visit_Typedef(self, node):
+        self.typedefs[node.name] = node.type
+        self.generic_visit(node)
+
+    def visit_Struct(self, node):
+        if node.name is not None and node.decls is not None:
+            self.structs[node.name] = node
+        self.generic_visit(node)
+
+    def visit_Union(self, node):
+        self.visit_Struct(node)
+
+    def _resolve(self, type_node):
+        """Resolve typedefs and struct tags to the underlying type node."""
+        while True:
+            if isinstance(type_node, c_ast.TypeDecl):
+                type_node = type_node.type
+            elif isinstance(type_node, c_ast.IdentifierType) and \
+                    type_node.names[-1] in self.typedefs:
+                type_node = self.typedefs[type_node.names[-1]]
+            elif isinstance(type_node, (c_ast.Struct, c_ast.Union)) and type_node.decls is None:
+                type_node = self.structs[type_node.name]
+            else:
+                return type_node
+
+    def _base_format(self, type_node):
+        names = tuple(name for name in type_node.names if name != 'signed') or ('int',)
+        if len(names) > 1 and names[-1] == 'int':
+            names = names[:-1]
+        return _BASE_FORMATS[names]
+
+    def layout(self, name, trailing=None):
+        """Return the _Layout of the record (typedef or struct tag) *name*."""
+        layout = _Layout()
+        type_node = self._resolve(c_ast.IdentifierType([name])) if name in self.typedefs \
+            else self.structs[name]
+        self._add_members(layout, type_node, trailing)
+        return layout
+
+    def _add_members(self, layout, node, trailing=None):
+        for decl in node.decls:
+            if decl.name is not None and decl.name == trailing:
+                layout.trailing = decl.name
+            elif decl.bitsize is not None:
+                self._add_bitfield(layout, decl)
+                continue
+            else:
+                layout._bitfield = None
+                self._add_member(layout, decl)
+
+            if layout.trailing is not None:
+                return
+
+    def _add_bitfield(self, layout, decl):
+        fmt = self._base_format(self._resolve(decl.type))
+        width = int(decl.bitsize.value, 0)
+        bits = struct.calcsize(fmt) * 8
+
+        if layout._bitfield is None or layout._bitfield[0] != fmt or \
+                layout._bitfield[1] + width > bits:
+            layout.fields.append((decl.name, _UNSIGNED_FORMATS[struct.calcsize(fmt)]))
+            layout._bitfield = (fmt, 0)
+
+        layout.bits.append((decl.name, len(layout.fields) - 1, layout._bitfield[1], width))
+        layout._bitfield = (fmt, layout._bitfield[1] + width)
+
+    def _add_member(self, layout, decl):
+        if isinstance(decl.type, c_ast.ArrayDecl):
+            dim = decl.type.dim
+            if dim is None or (isinstance(dim, c_ast.Constant) and int(dim.value, 0) <= 1):
+                # Variable length (name[], name[1])
+                layout.trailing = decl.name
+                return
+
+            count = int(dim.value, 0)
+            element = self._resolve(decl.type.type)
+            fmt = self._base_format(element)
+            if fmt in 'bB':
+                layout.fields.append((decl.name, f'{count}s'))
+            else:
+                for i in range(count):
+                    layout.fields.append((f'{decl.name}_{i}', fmt))
+            return
+
+        type_node = self._resolve(decl.type)
+        if isinstance(type_node, c_ast.IdentifierType):
+            layout.fields.append((decl.name, self._base_format(type_node)))
+        elif isinstance(type_node, c_ast.Enum):
+            layout.fields.append((decl.name, 'I'))
+        elif isinstance(type_node, c_ast.Struct):
+            nested = _Layout()
+            self._add_members(nested, type_node)
+            if len(nested.fields) == 1 and len(nested.bits) == len(type_node.decls):
+                # A struct of bitfields in a single storage unit
+                layout.fields.append((decl.name, nested.fields[0][1]))
+            else:
+                layout.fields.extend(nested.fields)
+                layout.trailing = nested.trailing
+        elif isinstance(type_node, c_ast.Union):
+            sizes = []
+            for member in type_node.decls:
+                nested = _Layout()
+                self._add_members(nested, c_ast.Struct(None, [member]))
+                if nested.trailing is not None:
+                    layout.trailing = decl.name
+                    return
+                sizes.append(nested.size)
+
+            layout.fields.append((decl.name, _UNSIGNED_FORMATS[max(sizes)]))
+        else:
+            raise ValueError(f"unsupported member: {decl.name}")
+
+
+def _wrap(prefix, items, suffix):
+    lines = textwrap.wrap(
+        ', '.join(items) + ',', width=100, initial_indent='    ', subsequent_indent='    ',
+        break_on_hyphens=False)
+    return prefix + '\n' + '\n'.join(lines) + '\n' + suffix
+
+
+def write_records(ast, output):
+    v = RecordVisitor()
+    v.visit(ast)
+
+    for i, (name, record_def) in enumerate(RECORDS.items()):
+        layout = v.layout(name, record_def.get('trailing'))
+
+        if i > 0:
+            output.write("\n")
+        output.write(f"#: {name}")
+        if layout.trailing is not None:
+            output.write(f", followed by {layout.trailing}")
+        output.write("\n")
+        output.write(f"{name} = Struct('<{layout.format}')\n")
+        fields = [repr(field) for field, _ in layout.fields]
+        output.write(_wrap(f"{name}_FIELDS = (", fields, ")\n"))
+        if layout.bits:
+            bits = [
+                f"{bit!r}: ({index}, {shift}, {width})" for bit, index, shift, width in layout.bits
+            ]
+            output.write(_wrap(f"{name}_BITS = {{", bits, "}\n"))
+
+
+def write_cvinfo(ast, output):
+    output.write(CVINFO_HEADER)
+
+    v = EnumVisitor(output, CVINFO_DEFS, only_defs=True)
+    v.visit(ast)
+
+    write_records(ast, output)
+
+
+def write_cvconst(ast, output):
+    output.write(HEADER)
+
+    v = EnumVisitor(output)
+    v.visit(ast)
+    v.write_footer()
+
+    return v
+
+
+def _register_width(family, name):
+    for pattern, width in REGISTER_FAMILIES[family].get('widths', []):
+        if re.fullmatch(pattern, name):
+            return width
+
+    return 0
+
+
+def write_registers(enums, output):
+    cpu_types = dict(enums['CPU_TYPE'])
+    hreg = enums['HREG']
+
+    output.write(REGISTERS_HEADER)
+
+    output.write("CPU_FAMILIES = {\n")
+    for family, family_def in REGISTER_FAMILIES.items():
+        for cpu in family_def['cpus']:
+            output.write(f"    {cpu_types[cpu]:#x}: {family!r},\n")
+    output.write("}\n\n\n")
+
+    output.write("REGISTERS = {\n")
+    for family, family_def in REGISTER_FAMILIES.items():
+        registers = {}
+        for name, value in hreg:
+            for prefix in family_def['prefixes']:
+                if name.startswith(prefix):
+                    # The first name defined for a value wins, same as with the enum itself
+                    registers.setdefault(value, (name, _register_width(family, name[len(prefix):])))
+
+        output.write(f"    {family!r}: (\n")
+        for value, (name, width) in sorted(registers.items()):
+            output.write(f"        ({value}, {name!r}, {width}),\n")
+        output.write("    ),\n")
+    output.write("}\n\n\n")
+
+    output.write("ALLREG = (\n")
+    for name, value in hreg:
+        if name.startswith('ALLREG_'):
+            output.write(f"    ({value}, {name!r}, 0),\n")
+    output.write(")\n")
+
+
+CVINFO_WRAPPER = """\
+typedef struct _GUID {
+    unsigned long Data1;
+    unsigned short Data2;
+    unsigned short Data3;
+    unsigned char Data4[8];
+} GUID;
+#define __int64 long long
+#define __inline inline
+#define __forceinline inline
+#include <cvinfo.h>
+"""
+
 
 def main():
     result = subprocess.run([
@@ -149,10 +878,22 @@ def main():
     ast = parse_file(dia_sdk / 'include/cvconst.h', use_cpp=True, cpp_path='cl', cpp_args='/E')
 
     with open(_SCRIPT_DIR / "../pydia2/cvconst.py", "w") as f:
-        f.write("from enum import IntEnum, auto\n\n\n")
+        v = write_cvconst(ast, f)
+
+    with open(_SCRIPT_DIR / "../pydia2/_cvregs.py", "w") as f:
+        write_registers(v.enums, f)
+
+    # cvinfo.h isn't self contained, provide what it needs from the Windows headers, and make
+    # the MSVC specific keywords parsable by pycparser.
+    with tempfile.TemporaryDirectory() as tmp:
+        wrapper = pathlib.Path(tmp) / "cvinfo_wrapper.h"
+        wrapper.write_text(CVINFO_WRAPPER)
+        ast = parse_file(
+            wrapper, use_cpp=True, cpp_path='cl',
+            cpp_args=['/E', f'/I{dia_sdk / "include"}'])
 
-        v = EnumVisitor(f)
-        v.visit(ast)
+    with open(_SCRIPT_DIR / "../pydia2/cvinfo.py", "w") as f:
+        write_cvinfo(ast, f)
 
 
 if __name__ == "__main__":
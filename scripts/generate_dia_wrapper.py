@@ -0,0 +1,53 @@
+"""
+Generate the comtypes wrapper modules for a typelib (msdia140.dll) into a directory, so that they
+can be shipped frozen in the package instead of being generated into comtypes.gen on first use.
+
+This must run in a fresh interpreter, as the generated modules are imported in the process.
+"""
+import sys
+import argparse
+import pathlib
+import shutil
+import tempfile
+
+
+def generate(typelib, output_dir):
+    """
+    Generate the wrapper modules for *typelib* (Including the typelibs it references) into
+    *output_dir*, and return the name of the friendly module (e.g. ``Dia2Lib``).
+    """
+    import comtypes.gen
+    from comtypes import client
+
+    output_dir = pathlib.Path(output_dir)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Generate into an empty directory, so that nothing is picked up from the comtypes.gen
+        # cache and all referenced typelibs end up in the output too.
+        comtypes.gen.__path__[:] = [tmp]
+        client.gen_dir = tmp
+
+        module = client.GetModule(str(typelib))
+
+        if output_dir.exists():
+            shutil.rmtree(output_dir)
+        output_dir.mkdir(parents=True)
+
+        for path in pathlib.Path(tmp).glob("*.py"):
+            if path.name != "__init__.py":
+                shutil.copy(path, output_dir / path.name)
+
+    return module.__name__.rpartition('.')[2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("typelib", help="Path of the typelib (Or the DLL containing it)")
+    parser.add_argument("output_dir", help="Directory to write the wrapper modules into")
+    args = parser.parse_args()
+
+    print(generate(args.typelib, args.output_dir))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
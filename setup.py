@@ -52,6 +52,14 @@ if not os.path.exists("pydia2/lib/amd64/symsrv.dll"):
     shutil.copy(os.path.join(winsdk, R"Debuggers\x64\symsrv.dll"), "pydia2/lib/amd64/symsrv.dll")
 
 
+for arch in ["x86", "amd64"]:
+    if not os.path.exists(f"pydia2/lib/{arch}/comtypes_gen"):
+        subprocess.run([
+            sys.executable, "scripts/generate_dia_wrapper.py",
+            f"pydia2/lib/{arch}/msdia140.dll", f"pydia2/lib/{arch}/comtypes_gen"],
+            check=True)
+
+
 setup(
     name="pydia2",
     version=version,
@@ -100,6 +108,8 @@ setup(
             "lib/amd64/msdia140.dll",
             "lib/x86/symsrv.dll",
             "lib/amd64/symsrv.dll",
+            "lib/x86/comtypes_gen/*.py",
+            "lib/amd64/comtypes_gen/*.py",
         ],
     },
     zip_safe=False,
@@ -108,6 +118,9 @@ setup(
         "comtypes",
     ],
     extras_require={
+        "numpy": {
+            "numpy",
+        },
         "dev": {
             "setuptools",
             "pycparser",